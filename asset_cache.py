@@ -0,0 +1,247 @@
+import os
+import json
+import time
+import shutil
+import hashlib
+import threading
+from contextlib import contextmanager
+from collections import defaultdict
+from config import Config
+try: import msvcrt
+except ImportError: msvcrt = None
+try: import fcntl
+except ImportError: fcntl = None
+
+# ==============================================================================
+# 🗄️ ASSET CACHE (콘텐츠 주소 기반 디스크 캐시)
+# - 키(정규화된 검색어 / 소스 URL) -> 콘텐츠 해시(sha256) -> blobs/ 파일
+# - 같은 내용은 한 번만 저장되고, 크기 상한 초과 시 LRU 로 제거, TTL 지나면 미스 처리
+# - [수정] 여러 프로세스(스케줄러 작업 / 데몬 워커)가 같은 폴더를 공유하므로
+#   인덱스 쓰기는 파일 잠금 안에서 디스크 인덱스를 다시 읽어 병합한 뒤 저장 (마지막 쓰기가 덮어쓰지 않도록)
+# ==============================================================================
+
+def normalize_query(query):
+    return " ".join(str(query).lower().split())
+
+@contextmanager
+def file_lock(path):
+    """프로세스 간 배타 잠금 (Windows: msvcrt, 그 외: fcntl)"""
+    with open(path, 'a+b') as f:
+        if msvcrt:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError: time.sleep(0.05)  # LK_LOCK 은 10초 후 실패 -> 계속 대기
+        elif fcntl: fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try: yield
+        finally:
+            if msvcrt:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            elif fcntl: fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+class AssetCache:
+    def __init__(self, root=None, max_bytes=None, ttl=None):
+        self.root = root or Config.ASSET_CACHE_DIR
+        self.max_bytes = max_bytes if max_bytes is not None else Config.ASSET_CACHE_MAX_MB * 1024 * 1024
+        self.ttl = ttl if ttl is not None else Config.ASSET_CACHE_TTL_HOURS * 3600
+        self.index_path = os.path.join(self.root, "index.json")
+        self.lock_path = os.path.join(self.root, "index.lock")
+        self.lock = threading.RLock()
+        self.stats = defaultdict(lambda: {"hit": 0, "miss": 0})
+        # 아직 디스크에 쓰지 않은 조회 시각 (flush 때 병합)
+        self.touched = {}
+        self.loaded_mtime = None
+        # blob 총 크기 (인덱스에 함께 저장되는 누적값, 상한을 넘을 때만 디스크를 직접 확인)
+        self.bytes = 0
+
+        os.makedirs(os.path.join(self.root, "blobs"), exist_ok=True)
+        self.entries = self._load()
+
+    # ------------------------------------------------------------------
+    # 인덱스 입출력
+    # ------------------------------------------------------------------
+    def _index_mtime(self):
+        try: return os.stat(self.index_path).st_mtime_ns
+        except OSError: return None
+
+    def _load(self):
+        self.loaded_mtime = self._index_mtime()
+        entries, total = {}, None
+        if self.loaded_mtime is not None:
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    index = json.load(f)
+                entries, total = index.get("entries", {}), index.get("bytes")
+            except Exception as e:
+                print(f"   ⚠️ [Cache] Index unreadable, starting fresh: {e}")
+        self.entries = entries
+        # 누적값이 없는 이전 형식 인덱스는 항목 기준으로 계산
+        self.bytes = total if total is not None else self.total_bytes()
+        return entries
+
+    def _refresh(self):
+        """다른 프로세스가 인덱스를 바꿨으면 다시 읽음 (os.replace 로 쓰므로 읽기에는 잠금 불필요)"""
+        if self._index_mtime() != self.loaded_mtime: self.entries = self._load()
+
+    @contextmanager
+    def _transaction(self):
+        """
+        잠금 -> 디스크 인덱스 다시 읽기 -> 미기록 조회 시각 병합 -> (변경) -> 제거 -> 저장
+        yield 되는 self.entries 는 최신 디스크 내용
+        """
+        with self.lock, file_lock(self.lock_path):
+            self.entries = self._load()
+            for key, accessed in self.touched.items():
+                entry = self.entries.get(key)
+                if entry: entry["accessed"] = max(entry["accessed"], accessed)
+            self.touched = {}
+            yield self.entries
+            self._evict()
+            tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"entries": self.entries, "bytes": self.bytes}, f)
+            os.replace(tmp_path, self.index_path)
+            self.loaded_mtime = self._index_mtime()
+
+    def flush(self):
+        """조회 시각(LRU) 기록"""
+        with self.lock:
+            if not self.touched: return
+            with self._transaction(): pass
+
+    def _blob_path(self, digest):
+        return os.path.join(self.root, "blobs", digest[:2], digest)
+
+    # ------------------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------------------
+    def get(self, key):
+        """캐시된 파일 경로 반환 (없거나 만료되면 None)"""
+        kind = key.split(":", 1)[0]
+        with self.lock:
+            self._refresh()
+            entry = self.entries.get(key)
+            now = time.time()
+            expired = entry and self.ttl and now - entry["created"] > self.ttl
+            path = self._blob_path(entry["blob"]) if entry else None
+            if expired or not path or not os.path.exists(path):
+                if entry:
+                    with self._transaction(): self._remove(key)
+                self.stats[kind]["miss"] += 1
+                return None
+            self.touched[key] = now
+            self.stats[kind]["hit"] += 1
+            return path
+
+    def get_bytes(self, key):
+        path = self.get(key)
+        if not path: return None
+        with open(path, 'rb') as f: return f.read()
+
+    def get_json(self, key):
+        data = self.get_bytes(key)
+        if data is None: return None
+        try: return json.loads(data.decode('utf-8'))
+        except: return None
+
+    def copy_to(self, key, filename):
+        path = self.get(key)
+        if not path: return False
+        shutil.copyfile(path, filename)
+        return True
+
+    def get_meta(self, key):
+        with self.lock:
+            self._refresh()
+            entry = self.entries.get(key)
+            return dict(entry.get("meta", {})) if entry else {}
+
+    def put(self, key, data, meta=None):
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        # blob 쓰기도 잠금 안에서 (다른 프로세스의 제거가 인덱스에 아직 없는 blob 을 지우지 않도록)
+        with self._transaction() as entries:
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp_path, 'wb') as f: f.write(data)
+                os.replace(tmp_path, path)
+                self.bytes += len(data)
+            now = time.time()
+            entries[key] = {"blob": digest, "size": len(data), "created": now, "accessed": now}
+            if meta: entries[key]["meta"] = meta
+        return path
+
+    def put_json(self, key, obj):
+        return self.put(key, json.dumps(obj, ensure_ascii=False).encode('utf-8'))
+
+    # ------------------------------------------------------------------
+    # 제거 (LRU + 참조 카운트) - _transaction 안에서만 호출
+    # ------------------------------------------------------------------
+    def _remove(self, key):
+        entry = self.entries.pop(key, None)
+        if not entry: return
+        if any(e["blob"] == entry["blob"] for e in self.entries.values()): return
+        try: os.remove(self._blob_path(entry["blob"]))
+        except OSError: return
+        self.bytes = max(0, self.bytes - entry["size"])
+
+    def total_bytes(self):
+        blobs = {e["blob"]: e["size"] for e in self.entries.values()}
+        return sum(blobs.values())
+
+    def disk_blobs(self):
+        """실제로 디스크에 있는 blob {digest: (size, mtime)} (.tmp 제외)"""
+        blobs = {}
+        blob_root = os.path.join(self.root, "blobs")
+        for sub in os.listdir(blob_root):
+            sub_dir = os.path.join(blob_root, sub)
+            if not os.path.isdir(sub_dir): continue
+            for name in os.listdir(sub_dir):
+                if name.endswith(".tmp"): continue
+                try: st = os.stat(os.path.join(sub_dir, name))
+                except OSError: continue
+                blobs[name] = (st.st_size, st.st_mtime)
+        return blobs
+
+    def _evict(self, repair=False):
+        """
+        [수정] 평소에는 누적값으로만 판단하고 (저장마다 디스크를 훑지 않음),
+        상한을 넘었거나 repair 일 때만 디스크의 blob 을 직접 세어 누적값을 바로잡은 뒤
+        인덱스에 없는 blob (이전 버전의 경쟁 쓰기 / 중단된 작업이 남긴 것) 부터 지우고, 그다음 LRU 순
+        """
+        if not repair and (not self.max_bytes or self.bytes <= self.max_bytes): return
+        blobs = self.disk_blobs()
+        total = sum(size for size, _ in blobs.values())
+        self.bytes = total
+        if not self.max_bytes or total <= self.max_bytes: return
+
+        referenced = {e["blob"] for e in self.entries.values()}
+        for digest in sorted((d for d in blobs if d not in referenced), key=lambda d: blobs[d][1]):
+            if total <= self.max_bytes: break
+            try: os.remove(self._blob_path(digest))
+            except OSError: continue
+            total -= blobs[digest][0]
+
+        for key in sorted(self.entries, key=lambda k: self.entries[k]["accessed"]):
+            if total <= self.max_bytes: break
+            entry = self.entries[key]
+            shared = sum(1 for e in self.entries.values() if e["blob"] == entry["blob"])
+            self._remove(key)
+            if shared == 1 and entry["blob"] in blobs: total -= blobs[entry["blob"]][0]
+        self.bytes = total
+
+    def gc(self):
+        """디스크의 blob 을 직접 세어 누적 크기를 바로잡고 상한까지 정리 (수동 점검용)"""
+        with self.lock, self._transaction():
+            self._evict(repair=True)
+
+    def report(self):
+        # 단계가 끝날 때 조회 시각(LRU) 을 디스크에 기록
+        self.flush()
+        if not self.stats: return
+        parts = [f"{kind} {s['hit']}/{s['hit'] + s['miss']}" for kind, s in sorted(self.stats.items())]
+        print(f"   🗄️ [Cache] Hits: {', '.join(parts)} | {self.bytes / 1024 / 1024:.1f} MB on disk")
@@ -0,0 +1,128 @@
+import os
+import threading
+
+# ==============================================================================
+# 🎧 AUDIO PROBE (디코더 없이 MP3 프레임 헤더만 읽어서 길이 계산)
+# [NEW] 길이 캐시: (경로, mtime, 크기) 키 -> TTS 생성 시 MediaAgent 가 채우고,
+#       에디터는 레이아웃 계산에 AudioFileClip (ffmpeg 리더 프로세스) 을 열지 않고 조회만 함
+# ==============================================================================
+
+# MPEG 비트레이트 테이블 (kbps) - [version_group][layer]
+_BITRATES = {
+    (1, 1): [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448],
+    (1, 2): [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+    (1, 3): [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    (2, 1): [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+    (2, 2): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+    (2, 3): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+_SAMPLE_RATES = {3: [44100, 48000, 32000], 2: [22050, 24000, 16000], 0: [11025, 12000, 8000]}
+
+def _skip_id3(data):
+    if data[:3] == b"ID3" and len(data) >= 10:
+        size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+        return 10 + size
+    return 0
+
+def _parse_header(data, pos):
+    """(frame_length, samples_per_frame, sample_rate) 또는 None"""
+    if pos + 4 > len(data): return None
+    b1, b2 = data[pos + 1], data[pos + 2]
+    if data[pos] != 0xFF or (b1 & 0xE0) != 0xE0: return None
+
+    version_bits = (b1 >> 3) & 0x03   # 3 = MPEG1, 2 = MPEG2, 0 = MPEG2.5
+    layer_bits = (b1 >> 1) & 0x03     # 3 = Layer I, 2 = II, 1 = III
+    bitrate_idx = (b2 >> 4) & 0x0F
+    rate_idx = (b2 >> 2) & 0x03
+    padding = (b2 >> 1) & 0x01
+    if version_bits == 1 or layer_bits == 0 or bitrate_idx in (0, 15) or rate_idx == 3: return None
+
+    layer = 4 - layer_bits
+    group = 1 if version_bits == 3 else 2
+    bitrate = _BITRATES[(group, layer)][bitrate_idx] * 1000
+    sample_rate = _SAMPLE_RATES[version_bits][rate_idx]
+
+    if layer == 1:
+        samples = 384
+        length = (12 * bitrate // sample_rate + padding) * 4
+    else:
+        samples = 1152 if (layer == 2 or group == 1) else 576
+        length = samples // 8 * bitrate // sample_rate + padding
+    return length, samples, sample_rate
+
+def _is_info_frame(frame):
+    return any(tag in frame for tag in (b"Xing", b"Info", b"VBRI"))
+
+def mp3_duration(path):
+    """
+    MP3 프레임 헤더를 순회해서 재생 길이(초)를 계산합니다. (VBR 포함)
+    MP3 가 아니거나 해석할 수 없으면 None.
+    """
+    if not os.path.exists(path): return None
+    with open(path, 'rb') as f: data = f.read()
+
+    pos = _skip_id3(data)
+    total = 0.0
+    frames = 0
+    while pos < len(data) - 4:
+        header = _parse_header(data, pos)
+        if header is None:
+            # 동기화 유실 -> 다음 sync word 탐색
+            nxt = data.find(b"\xff", pos + 1)
+            if nxt < 0: break
+            pos = nxt
+            continue
+        length, samples, sample_rate = header
+        if length <= 0: break
+        # [NEW] 첫 프레임이 Xing/Info/VBRI 메타 프레임이면 재생 길이에 넣지 않음 (인코더가 넣는 무음 프레임)
+        if not (frames == 0 and _is_info_frame(data[pos:pos + length])):
+            total += samples / sample_rate
+        frames += 1
+        pos += length
+    return total if frames else None
+
+class DurationCache:
+    """파일이 바뀌면 (mtime / 크기가 달라지면) 키가 달라지므로 오래된 값은 자연히 무시됨"""
+    def __init__(self):
+        self.entries = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(path):
+        st = os.stat(path)
+        return (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+    def put(self, path, duration):
+        if not duration or not os.path.exists(path): return
+        with self.lock: self.entries[self.key(path)] = float(duration)
+
+    def get(self, path):
+        if not os.path.exists(path): return None
+        key = self.key(path)
+        with self.lock: duration = self.entries.get(key)
+        if duration is None:
+            duration = probe_duration(path)
+            if duration:
+                with self.lock: self.entries[key] = duration
+        return duration
+
+def probe_duration(path):
+    """
+    .mp3 는 헤더 파싱 -> 실패하거나 다른 컨테이너면 ffmpeg 정보 조회 한 번 (리더를 열어 두지 않음)
+    (MP4 등은 데이터 안에 우연한 sync word 가 있어 헤더 파싱 결과를 믿을 수 없음)
+    """
+    if path.lower().endswith(".mp3"):
+        duration = mp3_duration(path)
+        if duration: return duration
+    try:
+        from ffmpeg_tools import media_duration
+        return media_duration(path) or None
+    except Exception:
+        return None
+
+# 프로세스 안의 MediaAgent / 에디터가 같은 캐시를 공유
+DURATIONS = DurationCache()
+
+def audio_duration(path):
+    """캐시된 재생 길이(초). 파일이 없거나 해석할 수 없으면 None"""
+    return DURATIONS.get(path)
@@ -0,0 +1,500 @@
+import os
+import sys
+import json
+import time
+import base64
+import argparse
+import subprocess
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import numpy as np
+from PIL import Image
+
+# ==============================================================================
+# ⏱️ RENDER BENCHMARK (네트워크 없이 합성 픽스처로 측정)
+# 사용법: python benchmark.py shorts-frames [--frames 90]
+#         python benchmark.py zoom [--width 1920 --height 1080]
+#         python benchmark.py tts-client [--clips 30 --handshake-ms 40]
+#         python benchmark.py startup [--module main --budget-ms 1200]
+#         python benchmark.py overlays [--pages 100 --frames 60]
+#         python benchmark.py render [--form shorts --profiles fast-draft,publish,archive --renderers moviepy,direct]
+#         python benchmark.py timeline [--scenes 4,16 --modes eager,lazy --tolerance 1.25]
+# ==============================================================================
+
+FIXTURE_NARRATION = (
+    "Global markets rallied on Monday as *investors* welcomed fresh signs that inflation "
+    "is cooling, while central banks signalled a slower pace of rate hikes for the rest of the year. "
+    "Analysts say the *momentum* could continue if earnings hold up."
+)
+
+def make_fixture(work_dir, num_scenes=3, size=(1280, 720)):
+    """
+    고정 대본 픽스처: 그라디언트 이미지 + 동일한 내레이션 (재현 가능한 결과)
+    """
+    os.makedirs(os.path.join(work_dir, "images"), exist_ok=True)
+    rng = np.random.default_rng(42)
+    w, h = size
+    scenes = []
+    for i in range(num_scenes):
+        gx = np.linspace(0, 255, w, dtype=np.float32)[None, :, None]
+        gy = np.linspace(0, 255, h, dtype=np.float32)[:, None, None]
+        noise = rng.integers(0, 40, size=(h, w, 3)).astype(np.float32)
+        arr = np.clip((gx * 0.6 + gy * 0.4) * np.array([1.0, 0.7 - 0.1*i, 0.4 + 0.1*i]) + noise, 0, 255)
+        Image.fromarray(arr.astype(np.uint8)).save(os.path.join(work_dir, "images", f"image_{i+1}.png"))
+        scenes.append({"narration": FIXTURE_NARRATION, "image_prompt": "fixture"})
+
+    return {
+        "title": "Markets *Rally* As Inflation Cools Worldwide",
+        "intro_narration": "Welcome to Flash News Bite.",
+        "outro_narration": "Thanks for watching.",
+        "script": {"scenes": scenes},
+    }
+
+def time_frames(clip, num_frames, fps=30):
+    times = [min(i / fps, clip.duration - 1e-3) for i in range(num_frames)]
+    clip.get_frame(0)  # 워밍업
+    start = time.perf_counter()
+    for t in times: clip.get_frame(t)
+    return (time.perf_counter() - start) / num_frames
+
+def bench_shorts_frames(args):
+    from editor import Editor, PAUSE_DURATION
+
+    work_dir = tempfile.mkdtemp(prefix="cinemagen_bench_")
+    data = make_fixture(work_dir, num_scenes=args.scenes)
+    editor = Editor()
+    audio_duration = args.frames / 30.0
+
+    print(f"⏱️ [Bench] Shorts frame time ({args.scenes} scenes x {args.frames} frames)")
+    results = {}
+    for label, build in [("legacy", editor.create_scene_visual_legacy), ("sprite", editor.create_scene_visual)]:
+        per_frame = []
+        for i, scene in enumerate(data['script']['scenes']):
+            img_path = os.path.join(work_dir, "images", f"image_{i+1}.png")
+            pages = editor.paginate_narration(scene['narration'])
+            clip = build(img_path, data['title'], pages, audio_duration, audio_duration + PAUSE_DURATION)
+            per_frame.append(time_frames(clip, args.frames))
+        results[label] = sum(per_frame) / len(per_frame)
+        print(f"   {label:<8} {results[label]*1000:8.2f} ms/frame  ({1/results[label]:6.1f} fps)")
+
+    print(f"   🚀 Speedup: x{results['legacy'] / results['sprite']:.2f}")
+    return results
+
+def bench_zoom(args):
+    from moviepy.editor import ImageClip, CompositeVideoClip
+    from render_fx import KenBurnsClip
+
+    W, H = args.width, args.height
+    work_dir = tempfile.mkdtemp(prefix="cinemagen_bench_")
+    make_fixture(work_dir, num_scenes=1, size=(W, H))
+    img = Image.open(os.path.join(work_dir, "images", "image_1.png")).convert("RGB")
+    duration = args.frames / 30.0 + 0.5
+
+    legacy = ImageClip(np.array(img)).set_duration(duration)
+    legacy = CompositeVideoClip([legacy.resize(lambda t: 1 + 0.04 * t).set_position('center')], size=(W, H))
+    vectorized = KenBurnsClip(img, duration, 0.04)
+
+    print(f"⏱️ [Bench] Ken Burns zoom {W}x{H} ({args.frames} frames)")
+    results = {}
+    for label, clip in [("resize", legacy), ("kenburns", vectorized)]:
+        results[label] = time_frames(clip, args.frames)
+        print(f"   {label:<8} {results[label]*1000:8.2f} ms/frame  ({1/results[label]:6.1f} fps)")
+    print(f"   🚀 Speedup: x{results['resize'] / results['kenburns']:.2f}")
+    return results
+
+class StandInTTSHandler(BaseHTTPRequestHandler):
+    """Gemini TTS generateContent 응답을 흉내 내는 로컬 서버 (새 연결마다 핸드셰이크 지연)"""
+    protocol_version = "HTTP/1.1"
+    # 헤더/본문을 따로 쓰면 keep-alive 연결에서 Nagle + delayed ACK 로 ~40ms 지연 -> 재사용 효과가 가려짐
+    disable_nagle_algorithm = True
+    wbufsize = -1
+    handshake_ms = 0
+    audio = base64.b64encode(b"\x00" * 4096).decode()
+
+    def setup(self):
+        time.sleep(self.handshake_ms / 1000.0)
+        super().setup()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        body = json.dumps({"candidates": [{"content": {"parts": [{"inlineData": {"data": self.audio}}]}}]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.wfile.flush()
+
+    def log_message(self, *args): pass
+
+def bench_tts_client(args):
+    import requests
+    from config import Config
+    from media_agent import MediaAgent
+
+    StandInTTSHandler.handshake_ms = args.handshake_ms
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInTTSHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    Config.GEMINI_API_BASE = f"http://127.0.0.1:{server.server_port}"
+    Config.GEMINI_KEYS = ["bench"]
+
+    agent = MediaAgent()
+    out_file = os.path.join(tempfile.mkdtemp(prefix="cinemagen_bench_"), "clip.mp3")
+    print(f"⏱️ [Bench] Gemini TTS per-clip latency vs local stand-in ({args.clips} clips, handshake {args.handshake_ms}ms)")
+
+    results = {}
+    # per-call: 기존처럼 매 호출마다 새 연결 / pooled: MediaAgent 의 공유 세션
+    for label, http in [("per-call", requests), ("pooled", agent.http)]:
+        agent.http = http
+        start = time.perf_counter()
+        for _ in range(args.clips): agent.try_gemini_tts("Benchmark narration line.", out_file, "Kore")
+        results[label] = (time.perf_counter() - start) / args.clips
+        print(f"   {label:<8} {results[label]*1000:8.2f} ms/clip")
+
+    server.shutdown()
+    print(f"   🚀 Speedup: x{results['per-call'] / results['pooled']:.2f}")
+    print("   ℹ️ GCP TextToSpeechClient reuse is not covered (gRPC has no local stand-in here).")
+    return results
+
+# [NEW] 시작 시간 예산: main.py --category 실행 시 import 단계에서 쓰는 시간 (-X importtime)
+STARTUP_BUDGET_MS = 1200
+# 스케줄 실행 시작 시점에 로드되면 안 되는 무거운 모듈 (실제로 쓰는 코드 경로에서만 import)
+STARTUP_FORBIDDEN = ["playwright", "google.cloud.texttospeech_v1beta1", "edge_tts", "google.generativeai", "moviepy.editor"]
+
+def parse_importtime(stderr):
+    """-X importtime 출력 -> [(module, self_us, cumulative_us, depth)]"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line: continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+def bench_startup(args):
+    repo_dir = os.path.dirname(os.path.abspath(__file__))
+    print(f"⏱️ [Bench] Import time for '{args.module}' (budget {args.budget_ms} ms, best of {args.runs})")
+
+    best = None
+    for _ in range(args.runs):
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {args.module}"],
+                              cwd=repo_dir, capture_output=True, text=True)
+        if proc.returncode != 0:
+            print(f"   ❌ import {args.module} failed:\n{proc.stderr.splitlines()[-1]}")
+            sys.exit(2)
+        rows = parse_importtime(proc.stderr)
+        # 대상 모듈 행은 자식 모듈들 뒤에 출력됨 -> 직전 최상위 행 이후가 대상 모듈의 import 트리
+        end = max(i for i, r in enumerate(rows) if r[0] == args.module and r[3] == 0)
+        start = max([i for i, r in enumerate(rows[:end]) if r[3] == 0], default=-1) + 1
+        total_us, rows = rows[end][2], rows[start:end + 1]
+        if best is None or total_us < best[0]: best = (total_us, rows)
+
+    total_us, rows = best
+    top = sorted((r for r in rows if r[3] == 1), key=lambda r: -r[2])[:args.top]
+    for name, _, cum, _ in top:
+        print(f"   {name:<40} {cum/1000:8.1f} ms")
+
+    loaded = {name for name, _, _, _ in rows}
+    forbidden = [m for m in STARTUP_FORBIDDEN if any(n == m or n.startswith(m + ".") for n in loaded)]
+    print(f"   Total: {total_us/1000:.1f} ms")
+
+    failed = False
+    if forbidden:
+        print(f"   ❌ Heavy modules loaded at startup: {', '.join(forbidden)}")
+        failed = True
+    if total_us / 1000 > args.budget_ms:
+        print(f"   ❌ Over budget by {total_us/1000 - args.budget_ms:.1f} ms")
+        failed = True
+    if failed: sys.exit(1)
+    print("   ✅ Within startup budget.")
+    return total_us / 1000
+
+def bench_overlays(args):
+    """
+    자막 오버레이 메모리/처리량: 페이지마다 전체 화면 RGBA 캔버스 vs 글자 영역 스프라이트
+    메모리는 tracemalloc 으로 오버레이 N 개를 만드는 동안의 최대 할당량 (numpy 배열 포함)
+    """
+    import tracemalloc
+    from moviepy.video.VideoClip import ImageClip, ColorClip
+    from moviepy.video.compositing.CompositeVideoClip import CompositeVideoClip
+    from editor import Editor, FIXED_SUBTITLE_Y
+    from render_fx import with_sprites
+
+    W, H = 720, 1280
+    editor = Editor()
+    words = FIXTURE_NARRATION.split()
+    pages = [editor.paginate_narration(" ".join(words[i % len(words):] + words[:i % len(words)]))[0] for i in range(args.pages)]
+
+    def full_canvas(page_lines):
+        canvas = Image.new('RGBA', (W, H), (0, 0, 0, 0))
+        editor.draw_text_with_highlight(canvas, page_lines, (W//2, FIXED_SUBTITLE_Y), editor.font_sub, W)
+        return ImageClip(np.array(canvas)).set_duration(1.0).set_position('center')
+
+    def sprite(page_lines):
+        return editor.text_overlay(page_lines, (W//2, FIXED_SUBTITLE_Y), editor.font_sub)
+
+    print(f"⏱️ [Bench] Subtitle overlays ({args.pages} pages, {args.frames} frames)")
+    results = {}
+    for label, build in [("canvas", full_canvas), ("sprite", sprite)]:
+        tracemalloc.start()
+        overlays = [build(page_lines) for page_lines in pages]
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        bg = ColorClip(size=(W, H), color=(30, 60, 90)).set_duration(args.frames / 30.0 + 0.5)
+        if label == "canvas":
+            clip = CompositeVideoClip([bg, overlays[0]])
+        else:
+            clip = with_sprites(bg, [overlays[0]])
+        per_frame = time_frames(clip, args.frames)
+        results[label] = (peak, per_frame)
+        print(f"   {label:<8} {peak / 2**20:8.1f} MB peak  {per_frame*1000:8.2f} ms/frame  ({1/per_frame:6.1f} fps)")
+        del overlays
+
+    print(f"   🚀 Memory: x{results['canvas'][0] / results['sprite'][0]:.1f} smaller, "
+          f"Speedup: x{results['canvas'][1] / results['sprite'][1]:.2f}")
+    return results
+
+def make_tone(path, duration, freq=440):
+    """TTS 대신 쓰는 사인파 내레이션 (MP3)"""
+    from moviepy.audio.AudioClip import AudioClip
+    def make_frame(t):
+        wave = 0.2 * np.sin(freq * 2 * np.pi * np.asarray(t))
+        return np.stack([wave, wave], axis=-1)
+    AudioClip(make_frame, duration=duration, fps=44100).write_audiofile(path, fps=44100, verbose=False, logger=None)
+
+def render_fixture(form, profile, work_dir, num_scenes, seconds):
+    """픽스처 대본(생성 이미지 + 사인파 오디오)을 주어진 프로필로 렌더링하고 출력 경로 반환"""
+    data = make_fixture(work_dir, num_scenes=num_scenes, size=(1280, 720) if form == "long" else (1024, 768))
+    os.makedirs(os.path.join(work_dir, "audio"), exist_ok=True)
+    for i in range(num_scenes):
+        make_tone(os.path.join(work_dir, "audio", f"audio_{i+1}.mp3"), seconds, 330 + 40 * i)
+
+    if form == "long":
+        from editor_long import EditorLong
+        data["intro_narration"] = data["outro_narration"] = ""
+        return EditorLong(workspace=work_dir).make_video(data, profile=profile)
+
+    from editor import Editor
+    Editor(workspace=work_dir).make_shorts(data, category="finance", profile=profile)
+    return os.path.join(work_dir, "results", "final_shorts_FINANCE.mp4")
+
+def cpu_times():
+    """[이 프로세스, 종료된 자식 합계] CPU 초 (Windows 에서는 자식 시간이 0 으로 나옴)"""
+    t = os.times()
+    return [t.user + t.system, t.children_user + t.children_system]
+
+def peak_rss_mb():
+    """
+    [이 프로세스, 종료된 자식 중 최대] 최대 RSS (MB). 측정할 수 없는 값은 None
+    resource 는 Unix 전용 -> Windows 에서는 psutil (peak_wset, 자식은 측정 불가)
+    """
+    try:
+        import resource
+        # Linux ru_maxrss 는 KB 단위
+        return [resource.getrusage(who).ru_maxrss / 1024 for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN)]
+    except ImportError: pass
+    try:
+        import psutil
+        info = psutil.Process().memory_info()
+        return [getattr(info, "peak_wset", info.rss) / 2**20, None]
+    except ImportError:
+        return [None, None]
+
+def fmt_mb(value, width=7):
+    return f"{value:{width}.0f}M" if value is not None else f"{'n/a':>{width + 1}}"
+
+def bench_render_child(args):
+    """프로필 1개 렌더 (별도 프로세스 - 최대 RSS 를 프로필별로 분리 측정). 결과는 JSON 한 줄로 출력"""
+    from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+    from config import Config
+    if args.renderer: Config.SHORTS_RENDERER = args.renderer
+
+    work_dir = tempfile.mkdtemp(prefix="cinemagen_bench_")
+    before = cpu_times()
+    start = time.perf_counter()
+    out = render_fixture(args.form, args.child, work_dir, args.scenes, args.seconds)
+    wall = time.perf_counter() - start
+    after = cpu_times()
+    rss_py, rss_ffmpeg = peak_rss_mb()
+
+    cpu = sum(a - b for a, b in zip(after, before))
+    infos = ffmpeg_parse_infos(out)
+    frames = infos.get("video_nframes") or int(infos["duration"] * 30)
+    print("BENCH_RESULT " + json.dumps({
+        "profile": args.child, "renderer": Config.SHORTS_RENDERER, "wall": wall, "cpu": cpu, "frames": frames,
+        # python 렌더 프로세스 / ffmpeg 인코더 중 최대 (측정 불가면 null)
+        "rss_py": rss_py, "rss_ffmpeg": rss_ffmpeg,
+        "size": os.path.getsize(out),
+    }))
+
+def bench_render(args):
+    if args.child: return bench_render_child(args)
+
+    profiles = [p.strip() for p in args.profiles.split(",") if p.strip()]
+    # 렌더러 비교는 쇼츠만 해당 (롱폼은 항상 moviepy 세그먼트 렌더)
+    renderers = [r.strip() for r in (args.renderers or "").split(",") if r.strip()] if args.form == "shorts" else []
+    print(f"⏱️ [Bench] {args.form} render per encode profile ({args.scenes} scenes x {args.seconds:g}s, synthetic fixture)")
+    print(f"   {'profile':<19} {'fps':>7} {'wall s':>8} {'cpu s':>8} {'cpu/wall':>8} {'rss py':>8} {'rss ff':>8} {'size MB':>8}")
+    results = {}
+    for profile, renderer in [(p, r) for p in profiles for r in (renderers or [None])]:
+        cmd = [sys.executable, os.path.abspath(__file__), "render", "--child", profile, "--form", args.form,
+               "--scenes", str(args.scenes), "--seconds", str(args.seconds)]
+        if renderer: cmd += ["--renderer", renderer]
+        label = f"{profile}/{renderer}" if renderer else profile
+        proc = subprocess.run(cmd, capture_output=True, text=True)
+        lines = [l for l in proc.stdout.splitlines() if l.startswith("BENCH_RESULT ")]
+        if proc.returncode != 0 or not lines:
+            print(f"   {label:<19} ❌ failed: {(proc.stderr or proc.stdout).strip().splitlines()[-1:]}")
+            continue
+        r = json.loads(lines[-1][len("BENCH_RESULT "):])
+        results[label] = r
+        print(f"   {label:<19} {r['frames'] / r['wall']:7.1f} {r['wall']:8.1f} {r['cpu']:8.1f} {r['cpu'] / r['wall']:8.2f} "
+              f"{fmt_mb(r['rss_py'])} {fmt_mb(r['rss_ffmpeg'])} {r['size'] / 2**20:8.2f}")
+    return results
+
+def bench_timeline_child(args):
+    """장면 N 개 롱폼 타임라인을 샘플 fps 로 끝까지 그리면서 최대 메모리 측정 (별도 프로세스). 결과는 JSON 한 줄"""
+    import shutil
+    import tracemalloc
+    from moviepy.video.compositing.concatenate import concatenate_videoclips
+    from editor_long import EditorLong, DECODERS
+
+    work_dir = tempfile.mkdtemp(prefix="cinemagen_bench_")
+    data = make_fixture(work_dir, num_scenes=args.child, size=(1280, 720))
+    data["intro_narration"] = data["outro_narration"] = ""
+    os.makedirs(os.path.join(work_dir, "audio"), exist_ok=True)
+    for i in range(args.child):
+        make_tone(os.path.join(work_dir, "audio", f"audio_{i+1}.mp3"), args.seconds, 330 + 40 * i)
+
+    # 첫 장면은 배경 영상 장면 (디코더가 장면 렌더 때만 열리는지 확인용)
+    from ffmpeg_tools import run_ffmpeg
+    os.makedirs(os.path.join(work_dir, "videos"), exist_ok=True)
+    run_ffmpeg(["-f", "lavfi", "-i", "testsrc=size=640x360:rate=30", "-t", "1", "-pix_fmt", "yuv420p",
+                os.path.join(work_dir, "videos", "video_1.mp4")])
+    data["script"]["scenes"][0]["visual_type"] = "video"
+
+    editor = EditorLong(workspace=work_dir)
+    specs = editor.build_scene_specs(data)
+    tracemalloc.start()
+    decoders_at_build = 0
+    if args.mode == "lazy":
+        clip, _ = editor.build_timeline(specs)
+        decoders_at_build = len(DECODERS) + (clip.scene is not None)
+    else:
+        # 기존 방식: 모든 장면 클립을 먼저 만들고 concatenate (렌더 내내 유지)
+        clip = concatenate_videoclips([editor.create_scene_clip(*spec) for spec in specs if editor.scene_duration(spec[2])], method="compose")
+    frames = sum(1 for _ in clip.iter_frames(fps=args.fps))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    clip.close()
+    DECODERS.close_all()
+    shutil.rmtree(work_dir, ignore_errors=True)
+
+    print("BENCH_RESULT " + json.dumps({
+        "scenes": args.child, "mode": args.mode, "frames": frames, "duration": clip.duration, "decoders_at_build": decoders_at_build,
+        "peak": peak, "rss": peak_rss_mb()[0],
+    }))
+
+def bench_timeline(args):
+    """
+    롱폼 타임라인 메모리: 장면 수가 늘어도 최대 메모리가 일정해야 함 (lazy).
+    tracemalloc 최대치(numpy 배열 포함)가 가장 작은 장면 수 대비 --tolerance 배를 넘으면 실패 (exit 1)
+    타임라인을 만들 때 장면/배경 디코더가 열려도 실패 (첫 장면은 배경 영상 장면)
+    판정은 tracemalloc 기준이라 모든 플랫폼에서 동작 (RSS 는 참고용, 측정 불가면 n/a)
+    """
+    if args.child: return bench_timeline_child(args)
+
+    counts = [int(n) for n in args.scenes.split(",") if n.strip()]
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+    print(f"⏱️ [Bench] Long-form timeline peak memory ({args.seconds:g}s scenes, sampled at {args.fps:g} fps)")
+    print(f"   {'mode':<6} {'scenes':>6} {'video s':>8} {'frames':>7} {'peak MB':>8} {'rss':>8}")
+    results = {}
+    for mode in modes:
+        for count in counts:
+            cmd = [sys.executable, os.path.abspath(__file__), "timeline", "--child", str(count), "--mode", mode,
+                   "--seconds", str(args.seconds), "--fps", str(args.fps)]
+            proc = subprocess.run(cmd, capture_output=True, text=True)
+            lines = [l for l in proc.stdout.splitlines() if l.startswith("BENCH_RESULT ")]
+            if proc.returncode != 0 or not lines:
+                print(f"   {mode:<6} {count:>6} ❌ failed: {(proc.stderr or proc.stdout).strip().splitlines()[-1:]}")
+                sys.exit(2)
+            r = json.loads(lines[-1][len("BENCH_RESULT "):])
+            results[(mode, count)] = r
+            print(f"   {mode:<6} {count:>6} {r['duration']:8.1f} {r['frames']:7d} {r['peak'] / 2**20:8.1f} {fmt_mb(r['rss'])}")
+
+    if "lazy" not in modes: return results
+    # 타임라인을 만드는 것만으로는 장면/디코더가 열리지 않아야 함 (렌더 중 해당 구간에서만)
+    eager_opens = [n for n in counts if results[("lazy", n)]["decoders_at_build"]]
+    if eager_opens:
+        print(f"   ❌ Building the lazy timeline opened scenes/decoders ({', '.join(map(str, eager_opens))} scenes)")
+        sys.exit(1)
+    peaks = [results[("lazy", n)]["peak"] for n in counts]
+    growth = max(peaks) / min(peaks)
+    if growth > args.tolerance:
+        print(f"   ❌ Lazy timeline peak grows x{growth:.2f} with scene count (tolerance x{args.tolerance:g})")
+        sys.exit(1)
+    print(f"   ✅ Lazy timeline peak is flat (x{growth:.2f}, tolerance x{args.tolerance:g})")
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="CinemaGen Render Benchmark")
+    sub = parser.add_subparsers(dest="command")
+
+    p = sub.add_parser("shorts-frames", help="Editor.make_shorts frame time: legacy vs sprite")
+    p.add_argument("--scenes", type=int, default=3)
+    p.add_argument("--frames", type=int, default=90)
+    p.set_defaults(func=bench_shorts_frames)
+
+    p = sub.add_parser("zoom", help="Ken Burns zoom: moviepy resize(lambda t) vs vectorized engine")
+    p.add_argument("--width", type=int, default=1920)
+    p.add_argument("--height", type=int, default=1080)
+    p.add_argument("--frames", type=int, default=60)
+    p.set_defaults(func=bench_zoom)
+
+    p = sub.add_parser("tts-client", help="TTS HTTP latency: new connection per clip vs pooled session")
+    p.add_argument("--clips", type=int, default=30)
+    p.add_argument("--handshake-ms", type=float, default=40.0)
+    p.set_defaults(func=bench_tts_client)
+
+    p = sub.add_parser("startup", help="Import-time budget check for the CLI entry point (-X importtime)")
+    p.add_argument("--module", default="main")
+    p.add_argument("--budget-ms", type=float, default=STARTUP_BUDGET_MS)
+    p.add_argument("--runs", type=int, default=3)
+    p.add_argument("--top", type=int, default=10)
+    p.set_defaults(func=bench_startup)
+
+    p = sub.add_parser("overlays", help="Subtitle overlays: full-frame RGBA canvases vs cropped sprites (memory / fps)")
+    p.add_argument("--pages", type=int, default=100)
+    p.add_argument("--frames", type=int, default=60)
+    p.set_defaults(func=bench_overlays)
+
+    p = sub.add_parser("render", help="Full render per encode profile: fps, wall/CPU time, peak RSS, output size")
+    p.add_argument("--form", choices=["shorts", "long"], default="shorts")
+    p.add_argument("--profiles", default="fast-draft,publish,archive")
+    p.add_argument("--scenes", type=int, default=3)
+    p.add_argument("--seconds", type=float, default=4.0, help="Narration length per scene")
+    p.add_argument("--renderers", help="Shorts renderers to compare, e.g. moviepy,direct (default: Config.SHORTS_RENDERER)")
+    p.add_argument("--renderer", help=argparse.SUPPRESS)
+    p.add_argument("--child", help=argparse.SUPPRESS)
+    p.set_defaults(func=bench_render)
+
+    p = sub.add_parser("timeline", help="Long-form timeline peak memory vs scene count (fails if the lazy timeline grows)")
+    p.add_argument("--scenes", default="4,16", help="Scene counts to compare")
+    p.add_argument("--modes", default="eager,lazy")
+    p.add_argument("--seconds", type=float, default=2.0, help="Narration length per scene")
+    p.add_argument("--fps", type=float, default=2.0, help="Frame sampling rate (memory does not depend on fps)")
+    p.add_argument("--tolerance", type=float, default=1.25)
+    p.add_argument("--mode", help=argparse.SUPPRESS)
+    p.add_argument("--child", type=int, help=argparse.SUPPRESS)
+    p.set_defaults(func=bench_timeline)
+
+    args = parser.parse_args()
+    if not getattr(args, "func", None):
+        parser.print_help()
+        sys.exit(1)
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
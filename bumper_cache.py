@@ -0,0 +1,77 @@
+import os
+import hashlib
+import tempfile
+from config import Config
+from ffmpeg_tools import run_ffmpeg
+from job_run import hash_value
+
+# ==============================================================================
+# 🎬 BUMPER CACHE (인트로/아웃트로 정적 부분 사전 인코딩)
+# - 리사이즈 + 레터박스/크롭 + 로고처럼 작업마다 같은 부분을 ffmpeg 한 번으로 미리 합성
+# - 키: 원본 경로 + mtime + 파일 크기 + 출력 크기 + 맞춤 방식 + 오버레이 내용
+# - 작업에서는 캐시된 파일을 그대로 읽고 제목/자막 오버레이만 합성합니다.
+# ==============================================================================
+
+# 중간 파일이므로 화질 우선 (최종 인코딩에서 다시 압축됨)
+BUMPER_ENCODE = ["-c:v", "libx264", "-crf", "16", "-preset", "veryfast", "-pix_fmt", "yuv420p", "-c:a", "aac", "-b:a", "192k"]
+# 롱폼 배경 영상: 내레이션 오디오로 교체되므로 오디오는 버림
+BACKGROUND_ENCODE = ["-c:v", "libx264", "-crf", "16", "-preset", "veryfast", "-pix_fmt", "yuv420p", "-an"]
+
+def fit_filter(size, fit):
+    """
+    width: 가로를 맞추고 세로는 가운데 정렬 레터박스 (쇼츠: resize(width=720) + 검은 배경 중앙 배치와 동일)
+    cover: 화면을 꽉 채운 뒤 가로 중앙 / 세로 위쪽 기준 크롭 (롱폼: resize(height) + crop(y1=0) 과 동일)
+    """
+    W, H = size
+    if fit == "width":
+        return f"scale={W}:-2,crop={W}:'min(ih,{H})',pad={W}:{H}:(ow-iw)/2:(oh-ih)/2:black,setsar=1"
+    return f"scale={W}:{H}:force_original_aspect_ratio=increase,crop={W}:{H}:(iw-{W})/2:0,setsar=1"
+
+class BumperCache:
+    def __init__(self, root=None, encode=None, label="Bumper"):
+        """encode: 인코딩 옵션 (기본 BUMPER_ENCODE), label: 로그 표시용"""
+        self.root = root or Config.BUMPER_CACHE_DIR
+        self.encode = encode or BUMPER_ENCODE
+        self.label = label
+
+    def key(self, src, size, fit, overlay_digest=None):
+        stat = os.stat(src)
+        return hash_value(os.path.abspath(src), stat.st_mtime_ns, stat.st_size, list(size), fit, overlay_digest, self.encode)[:24]
+
+    def get(self, src, size, fit="cover", overlay=None):
+        """
+        정적 부분이 합성된 범퍼 경로. overlay 는 출력 크기와 같은 RGBA PIL 이미지 (로고 등).
+        인코딩에 실패하면 None -> 호출 쪽에서 기존 방식(프레임마다 리사이즈)으로 처리합니다.
+        """
+        if not os.path.exists(src): return None
+        overlay_digest = hashlib.sha256(overlay.tobytes()).hexdigest() if overlay is not None else None
+        name = os.path.splitext(os.path.basename(src))[0]
+        out_path = os.path.join(self.root, f"{name}_{size[0]}x{size[1]}_{self.key(src, size, fit, overlay_digest)}.mp4")
+        if os.path.exists(out_path):
+            print(f"   ♻️ [{self.label}] Cache Hit: {os.path.basename(src)} ({size[0]}x{size[1]})")
+            return out_path
+
+        os.makedirs(self.root, exist_ok=True)
+        print(f"   🎬 [{self.label}] Pre-rendering {os.path.basename(src)} ({size[0]}x{size[1]}, {fit})...")
+        tmp_path = f"{out_path}.{os.getpid()}.tmp.mp4"
+        overlay_path = None
+        try:
+            graph = f"[0:v]{fit_filter(size, fit)}[v]"
+            inputs = ["-i", src]
+            if overlay is not None:
+                fd, overlay_path = tempfile.mkstemp(suffix=".png", dir=self.root)
+                os.close(fd)
+                overlay.save(overlay_path)
+                inputs += ["-i", overlay_path]
+                graph += ";[v][1:v]overlay=0:0:format=auto[vout]"
+            else:
+                graph += ";[v]null[vout]"
+            run_ffmpeg(inputs + ["-filter_complex", graph, "-map", "[vout]", "-map", "0:a?"] + self.encode + [tmp_path])
+            os.replace(tmp_path, out_path)
+            return out_path
+        except Exception as e:
+            print(f"   ⚠️ [{self.label}] Pre-render failed, using source directly: {e}")
+            return None
+        finally:
+            for path in (tmp_path, overlay_path):
+                if path and os.path.exists(path): os.remove(path)
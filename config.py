@@ -20,6 +20,7 @@ class Config:
     
     MODEL_NAME = "models/gemini-flash-latest"
     TTS_MODEL_NAME = "models/gemini-2.0-flash-exp"
+    GEMINI_API_BASE = os.getenv("GEMINI_API_BASE", "https://generativelanguage.googleapis.com")
 
     # [NEW] 해상도 설정
     VIDEO_DIMENSIONS = {
@@ -27,6 +28,71 @@ class Config:
         "long": (1920, 1080)
     }
 
+    # [NEW] 롱폼 세그먼트 병렬 렌더링 워커 수 (0 = CPU 코어 수 - 1, 1 = 기존 단일 파이프)
+    LONG_RENDER_WORKERS = int(os.getenv("LONG_RENDER_WORKERS", "0"))
+    # [NEW] 기본 인코딩 프로필 (fast-draft / publish / archive - encode_profiles.py)
+    ENCODE_PROFILE = os.getenv("ENCODE_PROFILE", "publish")
+    # [NEW] 쇼츠 렌더러: direct (프레임 버퍼 -> ffmpeg stdin) / moviepy (write_videofile)
+    SHORTS_RENDERER = os.getenv("SHORTS_RENDERER", "direct")
+    # [NEW] 사운드트랙 조립: BGM 볼륨 / 내레이션 구간 BGM 더킹 / 라우드니스 정규화 목표 (LUFS)
+    BGM_VOLUME = float(os.getenv("BGM_VOLUME", "0.1"))
+    BGM_DUCKING = os.getenv("BGM_DUCKING", "1") == "1"
+    AUDIO_LOUDNORM = os.getenv("AUDIO_LOUDNORM", "1") == "1"
+    AUDIO_TARGET_LUFS = float(os.getenv("AUDIO_TARGET_LUFS", "-14"))
+    # [NEW] 롱폼 배경 영상: 1920x1080 으로 미리 트랜스코딩 + 동시에 열어 둘 디코더 수 (프로세스당)
+    LONG_BG_TRANSCODE = os.getenv("LONG_BG_TRANSCODE", "1") == "1"
+    LONG_DECODER_POOL = int(os.getenv("LONG_DECODER_POOL", "2"))
+
+    # [NEW] 이미지/영상 에셋 캐시 (검색 결과 + 다운로드 파일 재사용)
+    ASSET_CACHE_ENABLED = os.getenv("ASSET_CACHE_ENABLED", "1") == "1"
+    ASSET_CACHE_DIR = os.getenv("ASSET_CACHE_DIR", "cache/assets")
+    ASSET_CACHE_MAX_MB = int(os.getenv("ASSET_CACHE_MAX_MB", "2048"))
+    ASSET_CACHE_TTL_HOURS = int(os.getenv("ASSET_CACHE_TTL_HOURS", "72"))
+
+    # [NEW] 이미지 후보 동시 다운로드 스레드 수
+    IMAGE_FETCH_WORKERS = int(os.getenv("IMAGE_FETCH_WORKERS", "8"))
+
+    # [NEW] 장면 단위 병렬 미디어 수집 (동시 장면 수 / 프로바이더별 초당 호출 수)
+    MEDIA_SCENE_WORKERS = int(os.getenv("MEDIA_SCENE_WORKERS", "4"))
+    SERPER_RATE_PER_SEC = float(os.getenv("SERPER_RATE_PER_SEC", "5"))
+    PEXELS_RATE_PER_SEC = float(os.getenv("PEXELS_RATE_PER_SEC", "2"))
+
+    # [NEW] TTS 동시 합성 수 (프로바이더별)
+    TTS_GCP_CONCURRENCY = int(os.getenv("TTS_GCP_CONCURRENCY", "4"))
+    TTS_GEMINI_CONCURRENCY = int(os.getenv("TTS_GEMINI_CONCURRENCY", "2"))
+    TTS_EDGE_CONCURRENCY = int(os.getenv("TTS_EDGE_CONCURRENCY", "4"))
+
+    # [NEW] 내레이션 TTS 캐시 (MP3 + 길이)
+    TTS_CACHE_ENABLED = os.getenv("TTS_CACHE_ENABLED", "1") == "1"
+    TTS_CACHE_DIR = os.getenv("TTS_CACHE_DIR", "cache/tts")
+    TTS_CACHE_MAX_MB = int(os.getenv("TTS_CACHE_MAX_MB", "512"))
+
+    # [NEW] 작업별 체크포인트(매니페스트) 폴더
+    RUNS_DIR = os.getenv("RUNS_DIR", "runs")
+
+    # [NEW] 인트로/아웃트로 범퍼 사전 인코딩 캐시 (원본 mtime + 크기 + 출력 크기 기준)
+    BUMPER_CACHE_ENABLED = os.getenv("BUMPER_CACHE_ENABLED", "1") == "1"
+    BUMPER_CACHE_DIR = os.getenv("BUMPER_CACHE_DIR", "cache/bumpers")
+
+    # [NEW] 파이프라인 모드 (자산 다운로드와 장면 인코딩을 겹쳐서 실행)
+    PIPELINE_STAGES = os.getenv("PIPELINE_STAGES", "1") == "1"
+
+    # [NEW] 스케줄러 워커 풀 (동시 작업 수 / 렌더링 동시 수 / 업로드 동시 수 / 시간 제한)
+    SCHED_MAX_JOBS = int(os.getenv("SCHED_MAX_JOBS", "4"))
+    SCHED_RENDER_SLOTS = int(os.getenv("SCHED_RENDER_SLOTS", "2"))
+    SCHED_UPLOAD_SLOTS = int(os.getenv("SCHED_UPLOAD_SLOTS", "2"))
+    SCHED_RENDER_TIMEOUT_MIN = int(os.getenv("SCHED_RENDER_TIMEOUT_MIN", "45"))
+    SCHED_START_DEADLINE_MIN = int(os.getenv("SCHED_START_DEADLINE_MIN", "90"))
+
+    # [NEW] 상주 워커 데몬 (scheduler 가 main.py 를 매번 새로 띄우는 대신 로컬 소켓으로 작업 전달)
+    SCHED_USE_DAEMON = os.getenv("SCHED_USE_DAEMON", "0") == "1"
+    DAEMON_HOST = os.getenv("DAEMON_HOST", "127.0.0.1")
+    DAEMON_PORT = int(os.getenv("DAEMON_PORT", "6070"))
+    # [수정] 인증 키 기본값 없음: 환경변수 또는 사용자별 키 파일 (python worker_daemon.py --init-key 로 생성, 0600)
+    DAEMON_AUTHKEY = os.getenv("DAEMON_AUTHKEY")
+    DAEMON_KEY_FILE = os.getenv("DAEMON_KEY_FILE", os.path.join(os.path.expanduser("~"), ".cinemagen", "daemon.key"))
+    DAEMON_WORKERS = int(os.getenv("DAEMON_WORKERS", "1"))
+
     SAFETY_SETTINGS = [
         {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
         {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_NONE"},
@@ -1,12 +1,25 @@
 import os
 import re
 from datetime import datetime
-from PIL import Image, ImageFont, ImageDraw
+from PIL import Image, ImageFont
 if not hasattr(Image, 'ANTIALIAS'): Image.ANTIALIAS = Image.LANCZOS
-from moviepy.editor import *
-from moviepy.audio.AudioClip import CompositeAudioClip
+# [수정] moviepy.editor 대신 필요한 클래스만 import (시작 시간 단축, fx 메서드는 render_fx 에서 등록)
+from moviepy.video.VideoClip import ImageClip, ColorClip
+from moviepy.video.io.VideoFileClip import VideoFileClip
+from moviepy.video.compositing.CompositeVideoClip import CompositeVideoClip
+from moviepy.video.compositing.concatenate import concatenate_videoclips
 import numpy as np
 import textwrap
+from config import Config
+from render_fx import StaticOverlay, ShortsSceneClip, KenBurnsZoom, SpriteOverlay, with_sprites
+from subtitle_timing import load_timing, page_starts
+from text_render import RASTERIZER, SHORTS_TITLE_STYLES, SHORTS_SUBTITLE_STYLES, composite
+from bumper_cache import BumperCache
+from encode_profiles import encode_params
+from shorts_writer import write_shorts_direct
+from soundtrack import assemble_soundtrack
+from ffmpeg_tools import has_audio
+from audio_probe import audio_duration
 
 # 폰트 설정 (Windows 기준)
 FONT_TITLE_PATH = "C:/Windows/Fonts/arialbi.ttf" # Arial Bold Italic
@@ -19,9 +32,14 @@ FIXED_SUBTITLE_Y = 1040
 # 오디오 사이의 휴식 간격 (초 단위)
 PAUSE_DURATION = 0.6 
 
+# [NEW] 이미지 박스 비율 및 줌 속도
+IMAGE_BOX_RATIO = 4/3
+ZOOM_RATE = 0.04
+
 class Editor:
-    def __init__(self):
-        os.makedirs("results", exist_ok=True)
+    def __init__(self, workspace="."):
+        # [NEW] 작업별 작업 폴더 (audio/, images/, results/ 가 이 아래에 생성됨)
+        self.use_workspace(workspace)
         try:
             self.font_title = ImageFont.truetype(FONT_TITLE_PATH, 50)
             self.font_sub = ImageFont.truetype(FONT_SUB_PATH, 46)
@@ -30,6 +48,24 @@ class Editor:
             self.font_title = ImageFont.load_default()
             self.font_sub = ImageFont.load_default()
 
+        # [NEW] 로고 / 타이틀 레이어는 한 번만 그려서 재사용
+        self.logo = None
+        if os.path.exists("assets/logo.png"):
+            self.logo = Image.open("assets/logo.png").convert("RGBA")
+            self.logo.thumbnail((150, 150), Image.LANCZOS)
+
+        # [NEW] 인트로/아웃트로 범퍼 (리사이즈 + 레터박스 + 로고) 사전 인코딩 캐시
+        self.bumpers = BumperCache() if Config.BUMPER_CACHE_ENABLED else None
+
+    def use_workspace(self, workspace):
+        """[NEW] 작업 폴더 전환 (폰트/로고는 유지, 작업별 타이틀 레이어 캐시는 비움)"""
+        self.workspace = workspace
+        self._title_layers = {}
+        os.makedirs(self.workspace_path("results"), exist_ok=True)
+
+    def workspace_path(self, *parts):
+        return os.path.join(self.workspace, *parts)
+
     def clean_text(self, text):
         if not text: return ""
         pattern = r'[^a-zA-Z0-9\s.,?!:;\'"*\-()\[\]%가-힣]'
@@ -46,8 +82,12 @@ class Editor:
                 title = title.replace(t, f"*{t}*", 1)
         return title
 
-    def draw_text_with_highlight(self, draw, text_lines, position, font, max_width, align='center', line_spacing=1.2, highlight_style='text'):
-        x, start_y = position
+    def text_sprite(self, text_lines, position, font, line_spacing=1.2, highlight_style='text'):
+        """
+        [NEW] 글자 영역만큼의 RGBA 스프라이트와 화면 좌표 (좌상단). 그릴 글자가 없으면 (None, (0, 0))
+        position: (가운데 x, 블록 세로 중앙 y)
+        """
+        center_x, center_y = position
         try:
             bbox = font.getbbox("Ay")
             ascender, descender = bbox[1], bbox[3]
@@ -56,63 +96,126 @@ class Editor:
 
         line_height = int((descender - ascender) * line_spacing)
         total_height = line_height * len(text_lines)
-        current_y = start_y - (total_height // 2)
-
-        for line in text_lines:
-            clean_line = self.clean_text(line)
-            parts = []
-            buffer = ""; is_highlight = False
-            for char in clean_line:
-                if char == '*':
-                    if buffer: parts.append((buffer, is_highlight))
-                    buffer = ""; is_highlight = not is_highlight
-                else: buffer += char
-            if buffer: parts.append((buffer, is_highlight))
-
-            total_w = sum([font.getlength(p[0]) for p in parts])
-            current_x = (max_width - total_w) / 2 if align == 'center' else x
-
-            for part_text, highlight in parts:
-                part_w = font.getlength(part_text)
-                if highlight and highlight_style == 'box':
-                    pad_x, pad_y = 8, 5
-                    box_x1 = current_x - pad_x
-                    box_y1 = current_y + ascender - pad_y
-                    box_x2 = current_x + part_w + pad_x
-                    box_y2 = current_y + descender + pad_y
-                    draw.rectangle([(box_x1, box_y1), (box_x2, box_y2)], fill='#FFD700')
-                    draw.text((current_x, current_y), part_text, font=font, fill='black')
-                elif highlight and highlight_style == 'text':
-                    for dx, dy in [(-2,-2),(2,2)]:
-                        draw.text((current_x+dx, current_y+dy), part_text, font=font, fill='black')
-                    draw.text((current_x, current_y), part_text, font=font, fill='#FFFF00')
-                else:
-                    for dx, dy in [(-2,-2),(2,2)]:
-                        draw.text((current_x+dx, current_y+dy), part_text, font=font, fill='black')
-                    draw.text((current_x, current_y), part_text, font=font, fill='white')
-                current_x += part_w
-            current_y += line_height
+        current_y = center_y - (total_height // 2)
+
+        styles = SHORTS_TITLE_STYLES if highlight_style == 'box' else SHORTS_SUBTITLE_STYLES
+        clean_lines = [self.clean_text(line) for line in text_lines]
+        sprite, (ox, oy) = RASTERIZER.block(clean_lines, font, styles, line_height)
+        if sprite is None: return None, (0, 0)
+        return sprite, (int(round(center_x + ox)), current_y + oy)
+
+    def draw_text_with_highlight(self, canvas, text_lines, position, font, max_width, line_spacing=1.2, highlight_style='text'):
+        """[수정] 공용 래스터라이저(외곽선 stroke + 스프라이트 캐시)로 그린 줄들을 캔버스에 합성 (가운데 정렬)"""
+        sprite, (x, y) = self.text_sprite(text_lines, (max_width / 2, position[1]), font, line_spacing, highlight_style)
+        if sprite: composite(canvas, sprite, x, y)
+
+    def text_overlay(self, text_lines, position, font, highlight_style='text'):
+        """[NEW] 텍스트 스프라이트를 SpriteOverlay 로 (없으면 None)"""
+        sprite, (x, y) = self.text_sprite(text_lines, position, font, highlight_style=highlight_style)
+        return SpriteOverlay(np.array(sprite), x, y) if sprite else None
+
+    def load_box_image(self, img_path, W=720):
+        """4:3 박스 크기로 잘라낸 장면 이미지 (PIL)"""
+        img = Image.open(img_path).convert("RGB")
+        iw, ih = img.size
+        if iw/ih > IMAGE_BOX_RATIO:
+            new_w = int(ih * IMAGE_BOX_RATIO)
+            img = img.crop(((iw-new_w)//2, 0, (iw-new_w)//2+new_w, ih))
+        else:
+            new_h = int(iw / IMAGE_BOX_RATIO)
+            img = img.crop((0, (ih-new_h)//2, iw, (ih-new_h)//2+new_h))
+        
+        box_height = int(W / IMAGE_BOX_RATIO) 
+        return img.resize((W, box_height), Image.LANCZOS)
+
+    def paste_logo(self, canvas):
+        if self.logo is None: return
+        W, H = canvas.size
+        logo_y = H - self.logo.size[1] - 30
+        canvas.paste(self.logo, ((W - self.logo.size[0]) // 2, logo_y), self.logo)
+
+    def create_title_layer(self, video_title, W=720, H=1280):
+        """[NEW] 타이틀 + 로고 캔버스 (제목별 캐시)"""
+        if video_title in self._title_layers: return self._title_layers[video_title]
+
+        canvas = Image.new('RGBA', (W, H), (0, 0, 0, 0))
+        title = self.auto_highlight_title(self.clean_text(video_title))
+        title_lines = textwrap.wrap(title, width=22)
+        self.draw_text_with_highlight(
+            canvas, title_lines, (W//2, FIXED_TITLE_Y), self.font_title, W, highlight_style='box'
+        )
+        self.paste_logo(canvas)
+        self._title_layers[video_title] = canvas
+        return canvas
+
+    def paginate_narration(self, narr_text):
+        all_lines = textwrap.wrap(narr_text, width=28)
+        num_pages = (len(all_lines) + 3) // 4
+        if num_pages < 1: num_pages = 1
+        
+        total_lines = len(all_lines)
+        base_cnt = total_lines // num_pages
+        extra = total_lines % num_pages
+        
+        pages = []
+        curr = 0
+        for p in range(num_pages):
+            cnt = base_cnt + (1 if p < extra else 0)
+            pages.append(all_lines[curr : curr + cnt])
+            curr += cnt
+        return pages
+
+    def create_scene_visual(self, img_path, video_title, pages, audio_duration, duration, starts=None):
+        """
+        [NEW] 자막 페이지마다 (레터박스 + 타이틀 + 로고 + 자막) 을 한 장으로 미리 합성하고
+        매 프레임에는 줌 영역만 블렌딩하는 장면 클립을 만듭니다.
+        starts: TTS 단어 타이밍 기반 페이지 시작 시각 (없으면 균등 분할)
+        """
+        W, H = 720, 1280
+        zoom, box = None, None
+        if os.path.exists(img_path):
+            img = self.load_box_image(img_path, W)
+            y0 = (H - img.size[1]) // 2
+            box = (y0, y0 + img.size[1])
+            zoom = KenBurnsZoom(img, duration, ZOOM_RATE)
+
+        title_layer = self.create_title_layer(video_title, W, H)
+        overlays = []
+        for page_lines in pages:
+            canvas = title_layer.copy()
+            if page_lines:
+                self.draw_text_with_highlight(
+                    canvas, page_lines, (W//2, FIXED_SUBTITLE_Y), self.font_sub, W, highlight_style='text'
+                )
+            overlays.append(StaticOverlay(np.array(canvas), box))
+
+        if starts is None:
+            dur_per_page = audio_duration / max(1, len(pages))
+            starts = [p_idx * dur_per_page for p_idx in range(len(pages))]
+        return ShortsSceneClip(overlays, starts, duration, zoom=zoom)
+
+    def create_scene_visual_legacy(self, img_path, video_title, pages, audio_duration, duration):
+        """기존 방식 (CompositeVideoClip 중첩) - 벤치마크 비교용"""
+        base_clip = self.create_base_layer(img_path, video_title, duration)
+        overlays = []
+        dur_per_page = audio_duration / len(pages)
+        for p_idx, page_lines in enumerate(pages):
+            start_time = p_idx * dur_per_page
+            sub_duration = dur_per_page if p_idx < len(pages) - 1 else duration - start_time
+            sub_clip = self.create_subtitle_clip(page_lines, sub_duration)
+            overlays.append(sub_clip.set_start(start_time).set_position('center'))
+        return CompositeVideoClip([base_clip] + overlays)
 
     def create_base_layer(self, img_path, video_title, duration):
         W, H = 720, 1280
         final_bg_clip = None
         
         if os.path.exists(img_path):
-            img = Image.open(img_path).convert("RGB")
-            target_ratio = 4/3
-            iw, ih = img.size
-            if iw/ih > target_ratio:
-                new_w = int(ih * target_ratio)
-                img = img.crop(((iw-new_w)//2, 0, (iw-new_w)//2+new_w, ih))
-            else:
-                new_h = int(iw / target_ratio)
-                img = img.crop((0, (ih-new_h)//2, iw, (ih-new_h)//2+new_h))
-            
-            box_height = int(W / target_ratio) 
-            img = img.resize((W, box_height), Image.LANCZOS)
+            img = self.load_box_image(img_path, W)
+            box_height = img.size[1]
             
             def zoom_effect(t):
-                scale = 1.0 + (0.04 * t) 
+                scale = 1.0 + (ZOOM_RATE * t) 
                 return scale
 
             raw_clip = ImageClip(np.array(img)).set_duration(duration)
@@ -123,75 +226,74 @@ class Editor:
         else:
             final_bg_clip = ColorClip(size=(W, H), color=(0,0,0)).set_duration(duration)
 
-        text_canvas = Image.new('RGBA', (W, H), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(text_canvas)
-
-        video_title = self.auto_highlight_title(self.clean_text(video_title))
-        title_lines = textwrap.wrap(video_title, width=22)
-        self.draw_text_with_highlight(
-            draw, title_lines, (W//2, FIXED_TITLE_Y), self.font_title, W, highlight_style='box'
-        )
-        
-        if os.path.exists("assets/logo.png"):
-            logo = Image.open("assets/logo.png").convert("RGBA")
-            logo.thumbnail((150, 150), Image.LANCZOS)
-            logo_y = H - logo.size[1] - 30
-            text_canvas.paste(logo, ((W - logo.size[0]) // 2, logo_y), logo)
-
+        text_canvas = self.create_title_layer(video_title, W, H)
         fixed_layer = ImageClip(np.array(text_canvas)).set_duration(duration)
         return CompositeVideoClip([final_bg_clip, fixed_layer])
 
     def create_subtitle_clip(self, text_lines, duration):
+        """전체 화면 RGBA 캔버스 자막 클립 - 기존 방식 (create_scene_visual_legacy 벤치마크 기준선 전용)"""
         W, H = 720, 1280
         canvas = Image.new('RGBA', (W, H), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(canvas)
-        
         if text_lines:
             self.draw_text_with_highlight(
-                draw, text_lines, (W//2, FIXED_SUBTITLE_Y), self.font_sub, W, highlight_style='text'
+                canvas, text_lines, (W//2, FIXED_SUBTITLE_Y), self.font_sub, W, highlight_style='text'
             )
-            
         return ImageClip(np.array(canvas)).set_duration(duration)
 
+    def logo_overlay(self, W=720, H=1280):
+        """[NEW] 로고 스프라이트 (paste_logo 와 같은 위치, 로고가 없으면 None)"""
+        if self.logo is None: return None
+        logo = self.logo.convert('RGBA')
+        return SpriteOverlay(np.array(logo), (W - logo.size[0]) // 2, H - logo.size[1] - 30)
+
+    def logo_layer(self, W=720, H=1280):
+        """[NEW] 로고만 그려진 투명 캔버스 (범퍼 사전 합성용, 로고가 없으면 None)"""
+        if self.logo is None: return None
+        canvas = Image.new('RGBA', (W, H), (0, 0, 0, 0))
+        self.paste_logo(canvas)
+        return canvas
+
+    def special_audio_source(self, video_path, audio_path):
+        """[NEW] 인트로/아웃트로 사운드: 내레이션이 있으면 내레이션, 없으면 영상 자체 사운드 (없으면 None)"""
+        if os.path.exists(audio_path): return audio_path
+        return video_path if has_audio(video_path) else None
+
     def process_special_clip(self, video_path, audio_path, text_content, full_title):
         if not os.path.exists(video_path): return None
-        video = VideoFileClip(video_path).resize(width=720)
+        W, H = 720, 1280
+        # [수정] 정적 부분(리사이즈 + 레터박스 + 로고)은 캐시된 범퍼를 재사용하고, 제목/자막만 매번 합성
+        bumper = self.bumpers.get(video_path, (W, H), fit="width", overlay=self.logo_layer(W, H)) if self.bumpers else None
+        # [수정] 사운드는 사운드트랙 단계에서 원본 파일로 조립하므로 영상 오디오 리더는 열지 않음
+        video = VideoFileClip(bumper, audio=False) if bumper else VideoFileClip(video_path, audio=False).resize(width=720)
         
-        if os.path.exists(audio_path):
-            audio = AudioFileClip(audio_path)
-            total_duration = audio.duration + PAUSE_DURATION
+        # [수정] 내레이션 길이는 캐시된 프로브 값 (AudioFileClip 디코더를 열지 않음)
+        narration = audio_duration(audio_path)
+        if narration:
+            total_duration = narration + PAUSE_DURATION
             if total_duration > video.duration:
                 freeze_duration = total_duration - video.duration
                 last_frame = video.to_ImageClip(t=video.duration - 0.1).set_duration(freeze_duration)
                 video = concatenate_videoclips([video, last_frame])
             else:
                 video = video.subclip(0, total_duration)
-            video = video.set_audio(audio) 
-        
-        bg = ColorClip(size=(720, 1280), color=(0, 0, 0)).set_duration(video.duration)
-        video_centered = video.set_position("center")
         
-        W, H = 720, 1280
-        canvas = Image.new('RGBA', (W, H), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(canvas)
-        if os.path.exists("assets/logo.png"):
-            logo = Image.open("assets/logo.png").convert("RGBA")
-            logo.thumbnail((150, 150), Image.LANCZOS)
-            logo_y = H - logo.size[1] - 30
-            canvas.paste(logo, ((W - logo.size[0]) // 2, logo_y), logo)
-
+        # [수정] 로고/제목/자막은 글자 영역만큼의 스프라이트로 해당 행만 블렌딩 (전체 크기 RGBA 캔버스 없음)
         title = self.auto_highlight_title(self.clean_text(full_title))
         title_lines = textwrap.wrap(title, width=22)
-        self.draw_text_with_highlight(draw, title_lines, (W//2, FIXED_TITLE_Y), self.font_title, W, highlight_style='box')
-        
-        if text_content:
-            sub_lines = textwrap.wrap(self.clean_text(text_content), width=28)
-            self.draw_text_with_highlight(draw, sub_lines, (W//2, FIXED_SUBTITLE_Y), self.font_sub, W, highlight_style='text')
+        sub_lines = textwrap.wrap(self.clean_text(text_content), width=28) if text_content else []
+        sprites = [
+            None if bumper else self.logo_overlay(W, H),
+            self.text_overlay(title_lines, (W//2, FIXED_TITLE_Y), self.font_title, highlight_style='box'),
+            self.text_overlay(sub_lines, (W//2, FIXED_SUBTITLE_Y), self.font_sub, highlight_style='text'),
+        ]
+        sprites = [sprite for sprite in sprites if sprite]
+        if bumper: return with_sprites(video, sprites)
 
-        overlay = ImageClip(np.array(canvas)).set_duration(video.duration)
-        return CompositeVideoClip([bg, video_centered, overlay])
+        bg = ColorClip(size=(W, H), color=(0, 0, 0)).set_duration(video.duration)
+        video_centered = video.set_position("center")
+        return with_sprites(CompositeVideoClip([bg, video_centered]), sprites)
 
-    def make_shorts(self, data, category="world"):
+    def make_shorts(self, data, category="world", profile=None):
         print(f"🎬 [Editor] Creating Video with Framed Zoom...")
         scenes = data['script']['scenes']
         
@@ -199,70 +301,50 @@ class Editor:
         final_title = re.sub(r'-?\d{2}-\d{2}', '', raw_title).strip()
         final_title = final_title.strip('-').strip()
         
-        clips = []
+        # [NEW] 클립별 사운드 원본 (사운드트랙 조립용, 없으면 None)
+        clips, sources = [], []
 
         # 0. Thumbnail
-        thumb_img_path = "images/image_1.png"
+        thumb_img_path = self.workspace_path("images", "image_1.png")
         if os.path.exists(thumb_img_path):
             print("📸 [Editor] Creating Thumbnail...")
-            thumb_clip = self.create_base_layer(thumb_img_path, final_title, 0.1)
+            thumb_clip = self.create_scene_visual(thumb_img_path, final_title, [[]], 0.1, 0.1)
             clips.append(thumb_clip)
+            sources.append(None)
         
         # 1. Intro
         intro_text = data.get('intro_narration', "Welcome to Flash News Bite.")
-        intro = self.process_special_clip("assets/intro.mp4", "audio/intro.mp3", intro_text, final_title)
-        if intro: clips.append(intro)
+        intro_audio = self.workspace_path("audio", "intro.mp3")
+        intro = self.process_special_clip("assets/intro.mp4", intro_audio, intro_text, final_title)
+        if intro:
+            clips.append(intro)
+            sources.append(self.special_audio_source("assets/intro.mp4", intro_audio))
 
         # 2. Main Scenes
         for i, scene in enumerate(scenes):
             idx = i + 1
-            aud_path = f"audio/audio_{idx}.mp3"
-            img_path = f"images/image_{idx}.png"
+            aud_path = self.workspace_path("audio", f"audio_{idx}.mp3")
+            img_path = self.workspace_path("images", f"image_{idx}.png")
             if not os.path.exists(aud_path): continue
             
-            full_audio = AudioFileClip(aud_path)
-            narr_text = scene.get('narration', "")
-            
-            all_lines = textwrap.wrap(narr_text, width=28)
-            num_pages = (len(all_lines) + 3) // 4
-            if num_pages < 1: num_pages = 1
-            
-            total_lines = len(all_lines)
-            base_cnt = total_lines // num_pages
-            extra = total_lines % num_pages
+            narration = audio_duration(aud_path)
+            if not narration: continue
+            pages = self.paginate_narration(scene.get('narration', ""))
             
-            pages = []
-            curr = 0
-            for p in range(num_pages):
-                cnt = base_cnt + (1 if p < extra else 0)
-                pages.append(all_lines[curr : curr + cnt])
-                curr += cnt
-            
-            total_scene_duration = full_audio.duration + PAUSE_DURATION
-            base_clip = self.create_base_layer(img_path, final_title, total_scene_duration)
-            
-            overlays = []
-            dur_per_page = full_audio.duration / len(pages)
-            
-            for p_idx, page_lines in enumerate(pages):
-                start_time = p_idx * dur_per_page
-                if p_idx == len(pages) - 1:
-                    sub_duration = dur_per_page + PAUSE_DURATION
-                else:
-                    sub_duration = dur_per_page
-                
-                sub_clip = self.create_subtitle_clip(page_lines, sub_duration)
-                sub_clip = sub_clip.set_start(start_time).set_position('center')
-                overlays.append(sub_clip)
-            
-            scene_clip = CompositeVideoClip([base_clip] + overlays)
-            scene_clip = scene_clip.set_audio(full_audio)
+            total_scene_duration = narration + PAUSE_DURATION
+            # [수정] 정적 요소는 페이지별 스프라이트로 사전 합성, 줌 영역만 프레임마다 블렌딩
+            starts = page_starts(pages, load_timing(aud_path))
+            scene_clip = self.create_scene_visual(img_path, final_title, pages, narration, total_scene_duration, starts=starts)
             clips.append(scene_clip)
+            sources.append(aud_path)
 
         # 3. Outro
         outro_text = data.get('outro_narration', "Thanks for watching.")
-        outro = self.process_special_clip("assets/outro.mp4", "audio/outro.mp3", outro_text, final_title)
-        if outro: clips.append(outro)
+        outro_audio = self.workspace_path("audio", "outro.mp3")
+        outro = self.process_special_clip("assets/outro.mp4", outro_audio, outro_text, final_title)
+        if outro:
+            clips.append(outro)
+            sources.append(self.special_audio_source("assets/outro.mp4", outro_audio))
 
         # Final Render
         final = concatenate_videoclips(clips, method="compose")
@@ -274,7 +356,26 @@ class Editor:
             "health": "HEALTH"
         }
         suffix = suffix_map.get(category, "USWORLD")
-        out_file = f"results/final_shorts_{suffix}.mp4"
+        out_file = self.workspace_path("results", f"final_shorts_{suffix}.mp4")
         
-        final.write_videofile(out_file, fps=30, codec="libx264", audio_codec="aac", bitrate="5000k", preset="medium")
+        # [NEW] 사운드트랙은 ffmpeg 한 번으로 조립 (내레이션 배치 + 정규화) -> 어느 렌더러든 그대로 mux
+        placements, start = [], 0.0
+        for clip, source in zip(clips, sources):
+            if source: placements.append((start, source))
+            start += clip.duration
+        track = assemble_soundtrack(placements, final.duration, out_file[:-4] + "_audio.m4a")
+
+        encode = encode_params("shorts", profile)
+        try:
+            if Config.SHORTS_RENDERER == "direct":
+                try:
+                    write_shorts_direct(clips, track, out_file, encode)
+                except Exception as e:
+                    # 직접 렌더러가 처리하지 못하는 클립 (크기가 다른 클립 등) -> moviepy 경로로 다시 렌더링
+                    print(f"   ⚠️ [Editor] Direct renderer failed ({e}). Falling back to moviepy...")
+                    final.write_videofile(out_file, audio=track, **encode)
+            else:
+                final.write_videofile(out_file, audio=track, **encode)
+        finally:
+            if os.path.exists(track): os.remove(track)
         print(f"✨ Video Created: {out_file}")
\ No newline at end of file
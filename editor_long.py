@@ -1,12 +1,26 @@
 import os
 import re
+import shutil
+import threading
 from datetime import datetime
-from PIL import Image, ImageFont, ImageDraw
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image, ImageFont
 if not hasattr(Image, 'ANTIALIAS'): Image.ANTIALIAS = Image.LANCZOS
-from moviepy.editor import *
-import moviepy.video.fx.all as vfx
+# [수정] moviepy.editor 대신 필요한 클래스만 import (시작 시간 단축, fx 메서드는 render_fx 에서 등록)
+from moviepy.video.VideoClip import ColorClip
+from moviepy.video.compositing.CompositeVideoClip import CompositeVideoClip
 import numpy as np
 import textwrap
+from config import Config
+from render_fx import KenBurnsClip, PagedSpriteClip, LazyVideoClip, DecoderPool, LazyTimeline
+from subtitle_timing import load_timing, page_starts
+from text_render import RASTERIZER, LONG_SUBTITLE_STYLES
+from bumper_cache import BumperCache, BACKGROUND_ENCODE
+from encode_profiles import encode_params
+from ffmpeg_tools import concat_segments, mux_audio, media_duration
+from audio_probe import audio_duration
+from soundtrack import assemble_soundtrack
+from job_run import hash_value, file_digest
 
 # [설정] 레이아웃
 W, H = 1920, 1080
@@ -15,10 +29,30 @@ SUBTITLE_Y = 750
 # [수정 1] 폰트 크기 축소 (95 -> 80)
 FONT_SIZE = 80    
 
+# [NEW] Ken Burns 줌 속도 (초당 배율 증가량)
+ZOOM_RATE = 0.04
+
+# [NEW] 장면 끝 쉼 (장면 길이 = 내레이션 + 쉼)
+SCENE_PAUSE = 0.5
+
+# [NEW] 세그먼트 인코딩 옵션 (오디오는 사운드트랙으로 따로 조립하므로 영상만) - 세그먼트 체크포인트 해시에 포함
+SEGMENT_WRITE = dict(audio=False, verbose=False, logger=None)
+# [NEW] 프로세스당 동시에 열어 두는 배경 영상 디코더 (LRU, 장면 인코딩 후 close_all)
+DECODERS = DecoderPool(Config.LONG_DECODER_POOL)
+
 class EditorLong:
-    def __init__(self):
-        os.makedirs("results", exist_ok=True)
+    def __init__(self, workspace="."):
+        # [NEW] 작업별 작업 폴더 (audio/, images/, videos/, results/ 가 이 아래에 생성됨)
+        self.workspace = workspace
+        os.makedirs(self.workspace_path("results"), exist_ok=True)
         self.font = self.load_font()
+        # [NEW] 인트로/아웃트로 범퍼 사전 인코딩 캐시 (1920x1080 맞춤)
+        self.bumpers = BumperCache() if Config.BUMPER_CACHE_ENABLED else None
+        # [NEW] 장면 배경 영상은 작업 폴더 안에 출력 크기로 한 번만 트랜스코딩
+        self.backgrounds = BumperCache(self.workspace_path("videos", "fitted"), BACKGROUND_ENCODE, "Background") if Config.LONG_BG_TRANSCODE else None
+
+    def workspace_path(self, *parts):
+        return os.path.join(self.workspace, *parts)
 
     def load_font(self):
         font_candidates = [
@@ -38,91 +72,62 @@ class EditorLong:
         pattern = r'[^a-zA-Z0-9\s.,?!:;\'"*\-()\[\]%가-힣]'
         return re.sub(pattern, '', text).strip()
 
-    def create_subtitle_image_from_lines(self, lines):
-        # [수정 2] 줄 간격(Gap) 자동 조정
-        # 폰트가 작아졌으므로 1.4배수로 설정하여 가독성 확보 (80 * 1.4 = 112px 높이)
-        line_height = int(FONT_SIZE * 1.4) 
-        total_height = line_height * len(lines)
-        
-        # 캔버스 높이 여유있게
-        img = Image.new('RGBA', (W, total_height + 40), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-
-        y = 0
-        for line in lines:
-            clean_line = self.clean_text(line)
-            parts = []
-            buffer = ""; is_highlight = False
-            for char in clean_line:
-                if char == '*':
-                    if buffer: parts.append((buffer, is_highlight))
-                    buffer = ""; is_highlight = not is_highlight
-                else: buffer += char
-            if buffer: parts.append((buffer, is_highlight))
-
-            try: total_w = sum([self.font.getlength(p[0]) for p in parts])
-            except: total_w = self.font.getsize(clean_line)[0]
-            current_x = (W - total_w) / 2
-
-            for part_text, highlight in parts:
-                fill_color = '#FFFF00' if highlight else 'white'
-                
-                # [수정 3] 외곽선 두께 조정 (7 -> 6)
-                # 글씨가 작아졌으니 테두리도 살짝 얇게 해서 뭉침 방지
-                stroke_width = 6 
-                
-                for dx in range(-stroke_width, stroke_width+1):
-                    for dy in range(-stroke_width, stroke_width+1):
-                        draw.text((current_x+dx, y+dy), part_text, font=self.font, fill='black')
-                draw.text((current_x, y), part_text, font=self.font, fill=fill_color)
-                try: current_x += self.font.getlength(part_text)
-                except: current_x += self.font.getsize(part_text)[0]
-            y += line_height
-        return img
+    def create_subtitle_sprite(self, lines):
+        """
+        [수정] 자막 페이지 스프라이트 (글자 영역만) + 화면 좌표
+        외곽선(6px)은 공용 래스터라이저의 stroke 로 한 번에 그리고, 같은 줄/단어는 캐시에서 재사용
+        줄 간격은 1.4배 (80 * 1.4 = 112px), 첫 줄 기준선은 SUBTITLE_Y
+        """
+        clean_lines = [self.clean_text(line) for line in lines]
+        sprite, (ox, oy) = RASTERIZER.block(clean_lines, self.font, LONG_SUBTITLE_STYLES, int(FONT_SIZE * 1.4))
+        if sprite is None: return np.zeros((1, 1, 4), dtype=np.uint8), (W // 2, SUBTITLE_Y)
+        return np.array(sprite), (W // 2 + ox, SUBTITLE_Y + oy)
+
+    def scene_duration(self, audio_path):
+        """[NEW] 장면 클립을 만들지 않고 길이만 계산 (내레이션이 없으면 None)"""
+        audio_len = audio_duration(audio_path)
+        return audio_len + SCENE_PAUSE if audio_len else None
 
     def create_scene_clip(self, idx, scene_data, audio_path, override_video_path=None, loop_video=True):
-        if not os.path.exists(audio_path): return None
-        audio = AudioFileClip(audio_path)
-        duration = audio.duration + 0.5 
+        # [수정] 레이아웃에는 길이만 필요 -> 캐시된 프로브 값 (장면마다 오디오 리더를 열어 두지 않음)
+        # 사운드는 사운드트랙 단계에서 원본 파일로 조립하므로 클립에 오디오를 붙이지 않음
+        duration = self.scene_duration(audio_path)
+        if not duration: return None
+        audio_len = duration - SCENE_PAUSE
 
         visual_type = scene_data.get('visual_type', 'image')
-        img_path = f"images/image_{idx}.png"
+        img_path = self.workspace_path("images", f"image_{idx}.png")
         
         if override_video_path and os.path.exists(override_video_path):
-            vid_path = override_video_path
+            # [수정] 인트로/아웃트로는 1920x1080 으로 미리 맞춰 둔 범퍼 캐시 사용 (없으면 원본)
+            vid_path = (self.bumpers.get(override_video_path, (W, H), fit="cover") if self.bumpers else None) or override_video_path
             visual_type = 'video'
         else:
-            vid_path = f"videos/video_{idx}.mp4"
+            vid_path = self.workspace_path("videos", f"video_{idx}.mp4")
+            if visual_type == 'video' and self.backgrounds and os.path.exists(vid_path):
+                vid_path = self.backgrounds.get(vid_path, (W, H), fit="cover") or vid_path
 
         visual_clip = None
 
         if visual_type == 'video' and os.path.exists(vid_path):
             try:
-                v = VideoFileClip(vid_path)
-                if loop_video:
-                    if v.duration < duration: v = vfx.loop(v, duration=duration)
-                    else: v = v.subclip(0, duration)
+                # [수정] 디코더는 첫 프레임을 읽을 때 공용 풀에서 열림 (반복/인트로·아웃트로 정지는 시간 변환으로 처리)
+                v = LazyVideoClip(vid_path, duration, DECODERS, loop=loop_video)
+
+                # 이미 출력 크기면 프레임마다 리사이즈/크롭하지 않음
+                if tuple(v.size) == (W, H):
+                    visual_clip = v
                 else:
-                    # Intro/Outro freezing logic
-                    if v.duration < duration:
-                        freeze_duration = duration - v.duration
-                        if freeze_duration > 0:
-                            last_frame = v.get_frame(max(0, v.duration - 0.1))
-                            freeze_clip = ImageClip(last_frame).set_duration(freeze_duration)
-                            v = concatenate_videoclips([v, freeze_clip])
-                    else:
-                        v = v.subclip(0, duration)
-
-                visual_clip = v.resize(height=H)
-                if visual_clip.w < W: visual_clip = v.resize(width=W)
-                visual_clip = visual_clip.crop(x1=visual_clip.w/2 - W/2, y1=0, width=W, height=H)
+                    visual_clip = v.resize(height=H)
+                    if visual_clip.w < W: visual_clip = v.resize(width=W)
+                    visual_clip = visual_clip.crop(x1=visual_clip.w/2 - W/2, y1=0, width=W, height=H)
             except Exception as e:
                 print(f"⚠️ Video Error ({vid_path}): {e}. Fallback to Image.")
                 visual_type = 'image'
 
         if visual_type == 'image' or visual_clip is None:
             if not os.path.exists(img_path):
-                return ColorClip(size=(W, H), color=(0,0,0)).set_duration(duration).set_audio(audio)
+                return ColorClip(size=(W, H), color=(0,0,0)).set_duration(duration)
             
             pil_img = Image.open(img_path).convert("RGB")
             iw, ih = pil_img.size
@@ -135,11 +140,11 @@ class EditorLong:
                 pil_img = pil_img.crop((0, (ih - new_h)//2, iw, (ih - new_h)//2 + new_h))
             
             pil_img = pil_img.resize((W, H), Image.LANCZOS)
-            clip = ImageClip(np.array(pil_img)).set_duration(duration)
-            visual_clip = clip.resize(lambda t: 1 + 0.04 * t).set_position('center')
+            # [수정] 프레임마다 LANCZOS 리사이즈 대신 벡터화된 줌 엔진 사용
+            visual_clip = KenBurnsClip(pil_img, duration, ZOOM_RATE)
 
         narration = scene_data.get('narration', '')
-        if not narration: return visual_clip.set_audio(audio)
+        if not narration: return visual_clip
 
         wrapper = textwrap.TextWrapper(width=30) 
         all_lines = wrapper.wrap(narration)
@@ -148,53 +153,47 @@ class EditorLong:
         for i in range(0, len(all_lines), 2):
             pages.append(all_lines[i:i+2]) 
 
-        if not pages: return visual_clip.set_audio(audio)
-
-        total_chars = len(narration.replace(" ", ""))
-        if total_chars == 0: total_chars = 1
-        
-        overlays = []
-        current_start = 0
-        actual_audio_dur = audio.duration 
+        if not pages: return visual_clip
 
-        for i, page_lines in enumerate(pages):
-            chunk_text = "".join(page_lines)
-            page_chars = len(chunk_text.replace(" ", ""))
+        # [NEW] TTS 단어 경계 타이밍이 있으면 페이지 첫 단어가 발음되는 프레임에 전환
+        starts = page_starts(pages, load_timing(audio_path))
+        if starts is None:
+            # 기존 추정 방식: 글자 수 비율 (최소 2초)
+            total_chars = len(narration.replace(" ", ""))
+            if total_chars == 0: total_chars = 1
             
-            if i < len(pages) - 1:
-                ratio = page_chars / total_chars
-                page_duration = ratio * actual_audio_dur
-                if page_duration < 2.0: page_duration = 2.0
-            else:
-                page_duration = max(0, duration - current_start)
+            starts = []
+            current_start = 0
+            actual_audio_dur = audio_len 
 
-            if current_start + page_duration > duration:
-                page_duration = duration - current_start
+            for page_lines in pages:
+                if current_start >= duration: break
+                starts.append(current_start)
+                page_chars = len("".join(page_lines).replace(" ", ""))
+                page_duration = max(2.0, page_chars / total_chars * actual_audio_dur)
+                current_start += page_duration
 
-            sub_img = self.create_subtitle_image_from_lines(page_lines)
-            sub_clip = ImageClip(np.array(sub_img))
-            
-            sub_clip = sub_clip.set_start(current_start).set_duration(page_duration)
-            sub_clip = sub_clip.set_position(('center', SUBTITLE_Y))
-            
-            overlays.append(sub_clip)
-            current_start += page_duration
-            
-            if current_start >= duration: break
+        pages = pages[:len(starts)]
+        sprites, positions = zip(*[self.create_subtitle_sprite(page_lines) for page_lines in pages])
+        # [수정] 페이지마다 시간 게이트 오버레이를 두는 대신 페이지 전환 트랙 하나로 합성
+        subtitles = PagedSpriteClip(sprites, starts, duration, positions=positions)
+        subtitles = subtitles.set_position(subtitles.origin)
 
-        final_clip = CompositeVideoClip([visual_clip] + overlays, size=(W, H))
-        final_clip = final_clip.set_audio(audio)
-        return final_clip
+        return CompositeVideoClip([visual_clip, subtitles], size=(W, H))
 
-    def make_video(self, data):
-        print(f"🎬 [Editor] Assembling Long-Form Video...")
+    def build_scene_specs(self, data):
+        """
+        [NEW] 렌더링할 장면 목록 (idx, scene, audio_path, override_video_path, loop_video)
+        - 인트로 -> 본문 -> 아웃트로 순서. 프로세스 풀에 넘길 수 있도록 단순 값만 담습니다.
+        """
         scenes = data['script']['scenes']
-        clips = []
+        specs = []
+        intro_audio = self.workspace_path("audio", "intro.mp3")
+        outro_audio = self.workspace_path("audio", "outro.mp3")
         
-        # 1. Intro
-        if os.path.exists("audio/intro.mp3"):
-            print("   🔹 Processing Intro...")
-            intro_text = data.get("intro_narration", "")
+        # 1. Intro (파이프라인 모드에서는 오디오가 아직 합성 중일 수 있으므로 대본 기준으로도 포함)
+        intro_text = data.get("intro_narration", "")
+        if os.path.exists(intro_audio) or intro_text.replace("*", ""):
             intro_scene = {"visual_type": "image", "narration": intro_text}
             
             intro_vid = None
@@ -204,24 +203,16 @@ class EditorLong:
             elif os.path.exists("assets/intro.mp4"):
                 intro_vid = "assets/intro.mp4"
 
-            intro_clip = self.create_scene_clip(0, intro_scene, "audio/intro.mp3", 
-                                                override_video_path=intro_vid, 
-                                                loop_video=False)
-            if intro_clip: clips.append(intro_clip)
+            specs.append((0, intro_scene, intro_audio, intro_vid, False))
 
         # 2. Main Scenes
         for i, scene in enumerate(scenes):
             idx = i + 1
-            audio_path = f"audio/audio_{idx}.mp3"
-            clip = self.create_scene_clip(idx, scene, audio_path, loop_video=True)
-            if clip:
-                clips.append(clip)
-                print(f"   ✅ Processed Scene {idx}/{len(scenes)}")
+            specs.append((idx, scene, self.workspace_path("audio", f"audio_{idx}.mp3"), None, True))
 
         # 3. Outro
-        if os.path.exists("audio/outro.mp3"):
-            print("   🔹 Processing Outro...")
-            outro_text = data.get("outro_narration", "")
+        outro_text = data.get("outro_narration", "")
+        if os.path.exists(outro_audio) or outro_text.replace("*", ""):
             outro_scene = {"visual_type": "image", "narration": outro_text}
             
             outro_vid = None
@@ -231,32 +222,187 @@ class EditorLong:
             elif os.path.exists("assets/outro.mp4"):
                 outro_vid = "assets/outro.mp4"
 
-            outro_clip = self.create_scene_clip(len(scenes)+1, outro_scene, "audio/outro.mp3", 
-                                                override_video_path=outro_vid, 
-                                                loop_video=False)
-            if outro_clip: clips.append(outro_clip)
+            specs.append((len(scenes)+1, outro_scene, outro_audio, outro_vid, False))
 
-        if not clips: return None
+        return specs
 
-        final_video = concatenate_videoclips(clips, method="compose")
-        
-        if os.path.exists("assets/bgm.mp3"):
-            from moviepy.audio.fx import volumex
-            bgm = AudioFileClip("assets/bgm.mp3").loop(duration=final_video.duration)
-            bgm = bgm.fx(volumex, 0.1)
-            final_audio = CompositeAudioClip([bgm, final_video.audio])
-            final_video = final_video.set_audio(final_audio)
+    def resolve_workers(self):
+        workers = Config.LONG_RENDER_WORKERS
+        if workers <= 0: workers = max(1, (os.cpu_count() or 1) - 1)
+        return workers
 
+    def output_path(self):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M")
-        output_filename = f"results/longform_{timestamp}.mp4"
-        
+        return self.workspace_path("results", f"longform_{timestamp}.mp4")
+
+    def make_video(self, data, run=None, profile=None):
+        print(f"🎬 [Editor] Assembling Long-Form Video...")
+        specs = self.build_scene_specs(data)
+        if not specs: return None
+
+        output_filename = self.output_path()
+        encode = encode_params("long", profile)
+
+        # [NEW] 멀티코어 세그먼트 렌더링 (워커 2개 이상일 때)
+        workers = self.resolve_workers()
+        if workers > 1:
+            return self.render_segmented(specs, output_filename, workers, run=run, encode=encode)
+
+        final_video, placements = self.build_timeline(specs)
+        if final_video is None: return None
+        print(f"   ✅ Timeline: {len(placements)} scenes, {final_video.duration:.1f}s (built lazily while rendering)")
+
+        # [수정] 오디오는 ffmpeg 한 번으로 조립 (내레이션 배치 + BGM 루프/더킹 + 정규화) 후 인코더가 그대로 mux
+        print("   🔊 Assembling soundtrack...")
+        track = assemble_soundtrack(placements, final_video.duration, output_filename[:-4] + "_audio.m4a", bgm_path="assets/bgm.mp3")
+
         print(f"🚀 Rendering Final Video: {output_filename}")
-        final_video.write_videofile(
-            output_filename, 
-            fps=30, 
-            codec="libx264", 
-            audio_codec="aac", 
-            bitrate="8000k", 
-            preset="medium"
-        )
-        return output_filename
\ No newline at end of file
+        try: final_video.write_videofile(output_filename, audio=track, **encode)
+        finally:
+            final_video.close()
+            DECODERS.close_all()
+            if os.path.exists(track): os.remove(track)
+        return output_filename
+
+    def build_timeline(self, specs):
+        """
+        [NEW] 단일 패스용 지연 타임라인 + 내레이션 배치 [(start, audio_path)]
+        장면 클립은 자기 구간을 렌더링할 때 만들어지고 다음 장면으로 넘어가면 해제됩니다. (배경 디코더도 함께 정리)
+        """
+        entries, placements, start = [], [], 0.0
+        for spec in specs:
+            duration = self.scene_duration(spec[2])
+            if not duration: continue
+            entries.append((duration, spec))
+            placements.append((start, spec[2]))
+            start += duration
+        if not entries: return None, []
+        timeline = LazyTimeline(entries, lambda spec: self.create_scene_clip(*spec), (W, H),
+                                release=lambda clip: DECODERS.close_all())
+        return timeline, placements
+
+    def segment_inputs(self, spec, encode):
+        """[NEW] 세그먼트 체크포인트용 입력 해시 (장면 데이터 + 사용 파일 내용 + 인코딩 설정)"""
+        idx, scene, audio_path, override_video_path, _ = spec
+        paths = [audio_path, override_video_path,
+                 self.workspace_path("images", f"image_{idx}.png"), self.workspace_path("videos", f"video_{idx}.mp4")]
+        digests = [(p, file_digest(p)) for p in paths if p and os.path.exists(p)]
+        return hash_value(spec, digests, encode, SEGMENT_WRITE)
+
+    def render_segmented(self, specs, output_filename, workers, run=None, encode=None):
+        """
+        [NEW] 장면별로 프로세스 풀에서 동일한 코덱 파라미터로 (영상만) 인코딩한 뒤,
+        stream copy 로 이어붙이고 내레이션 + BGM 사운드트랙은 마지막에 한 번에 조립해서 mux 합니다.
+        run 이 있으면 세그먼트를 작업 폴더에 두고, 이미 인코딩된 세그먼트는 재사용합니다.
+        """
+        session = SegmentSession(self, specs, output_filename, workers, run=run, encode=encode)
+        for n in range(len(specs)): session.submit(n)
+        return session.finish()
+
+    def open_pipeline(self, data, run=None, profile=None):
+        """
+        [NEW] 파이프라인 모드: 자산이 준비되기 전에 세그먼트 세션을 먼저 열어 두고,
+        장면이 준비되는 대로 session.submit(n) 으로 인코딩을 시작합니다.
+        [수정] 워커가 1개면 병렬 이득 없이 프로세스 풀 비용만 생기므로 None -> make_video 의 지연 타임라인 단일 패스 사용
+        """
+        workers = self.resolve_workers()
+        if workers <= 1: return None
+        print(f"🎬 [Editor] Opening Pipelined Long-Form Render...")
+        specs = self.build_scene_specs(data)
+        if not specs: return None
+        return SegmentSession(self, specs, self.output_path(), workers, run=run, encode=encode_params("long", profile))
+
+
+class SegmentSession:
+    """
+    [NEW] 세그먼트 렌더 세션 - 준비된 장면부터 submit(n) (스레드 안전, 중복 무시),
+    finish() 에서 남은 세그먼트를 기다린 뒤 concat + 사운드트랙 mux.
+    encode: 인코딩 파라미터 (stream copy concat 을 위해 모든 세그먼트가 동일해야 함)
+    """
+    def __init__(self, editor, specs, output_filename, workers, run=None, encode=None):
+        self.editor = editor
+        self.specs = specs
+        self.encode = encode or encode_params("long")
+        self.output_filename = output_filename
+        self.run = run
+        self.seg_dir = os.path.join(run.dir, "segments") if run else output_filename[:-4] + "_segments"
+        os.makedirs(self.seg_dir, exist_ok=True)
+        self.seg_paths = [os.path.join(self.seg_dir, f"segment_{n:03d}.mp4") for n in range(len(specs))]
+        self.lock = threading.Lock()
+        self.futures = {}
+        self.results = {}
+        self.hashes = {}
+
+        print(f"🚀 Rendering {len(specs)} segments with {workers} workers: {output_filename}")
+        self.pool = ProcessPoolExecutor(max_workers=workers)
+        # fork 방식에서는 첫 submit 때 워커가 모두 생성됨 -> 다운로드 스레드가 돌기 전에 미리 띄워 둠
+        self.pool.submit(os.getpid).result()
+
+    def submit(self, n):
+        with self.lock:
+            if n in self.futures or n in self.results: return
+            spec = self.specs[n]
+            if self.run:
+                self.hashes[n] = self.editor.segment_inputs(spec, self.encode)
+                if self.run.is_done(f"segment_{n:03d}", self.hashes[n]):
+                    self.results[n] = self.run.get(f"segment_{n:03d}")
+                    print(f"   ⏭️ Reusing Segment {spec[0]}")
+                    return
+            self.futures[n] = self.pool.submit(render_segment, self.editor.workspace, spec, self.seg_paths[n], self.encode)
+            print(f"   ⏩ Queued Segment {spec[0]}")
+
+    def finish(self):
+        # 아직 submit 되지 않은 장면이 있으면 (준비 신호 누락 등) 여기서 마저 제출
+        for n in range(len(self.specs)): self.submit(n)
+        try:
+            for n, future in sorted(self.futures.items()):
+                result = future.result()
+                self.results[n] = result
+                if result:
+                    if self.run: self.run.complete(f"segment_{n:03d}", self.hashes[n], data=result, outputs=[result])
+                    print(f"   ✅ Encoded Segment {self.specs[n][0]}")
+        finally:
+            self.pool.shutdown()
+
+        done = [(n, self.results[n]) for n in sorted(self.results) if self.results[n]]
+        if not done: return None
+
+        output_filename = self.output_filename
+        joined = os.path.join(self.seg_dir, "joined.mp4")
+        concat_segments([path for _, path in done], joined)
+
+        # 내레이션은 이어붙인 세그먼트의 실제 길이(프레임 단위) 기준으로 배치
+        placements, start = [], 0.0
+        for n, path in done:
+            placements.append((start, self.specs[n][2]))
+            start += media_duration(path)
+        print("   🔊 Assembling soundtrack...")
+        track = assemble_soundtrack(placements, start, os.path.join(self.seg_dir, "soundtrack.m4a"), bgm_path="assets/bgm.mp3")
+        mux_audio(joined, track, output_filename)
+        os.remove(joined)
+        os.remove(track)
+
+        if not self.run: shutil.rmtree(self.seg_dir, ignore_errors=True)
+        return output_filename
+
+    def close(self):
+        """finish() 없이 종료 (렌더 단계가 이미 최신인 경우 등)"""
+        self.pool.shutdown(cancel_futures=True)
+
+
+# =========================================================================
+# [NEW] 세그먼트 렌더 워커 (ProcessPoolExecutor 에서 실행 - 모듈 최상위 함수여야 함)
+# =========================================================================
+_worker_editors = {}
+
+def render_segment(workspace, spec, out_path, encode):
+    if workspace not in _worker_editors: _worker_editors[workspace] = EditorLong(workspace)
+
+    clip = _worker_editors[workspace].create_scene_clip(*spec)
+    if clip is None: return None
+    try: clip.write_videofile(out_path, **SEGMENT_WRITE, **encode)
+    finally:
+        # [NEW] 장면 인코딩이 끝나면 배경 디코더를 바로 닫음 (워커가 ffmpeg 프로세스를 쌓아 두지 않도록)
+        DECODERS.close_all()
+        clip.close()
+    return out_path
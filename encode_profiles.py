@@ -0,0 +1,48 @@
+from config import Config
+
+# ==============================================================================
+# 🎛️ ENCODE PROFILES (write_videofile 인코딩 설정)
+# - fast-draft: 미리보기/검수용 (빠르게, 화질은 낮게)
+# - publish: 업로드용 기본값 (기존 설정 그대로: 쇼츠 5000k / 롱폼 8000k, medium)
+# - archive: 보관용 고화질 (느리지만 CRF 로 화질 고정)
+# crf 가 있으면 품질 고정(CRF), 없으면 형식별 비트레이트. threads 0 = ffmpeg 자동 (코어 수)
+# 픽셀 포맷은 moviepy 가 libx264 출력에 항상 yuv420p 를 지정하므로 (플랫폼 호환) 프로필에 두지 않음
+# ==============================================================================
+
+ENCODE_PROFILES = {
+    "fast-draft": {"preset": "ultrafast", "crf": 28, "threads": 0, "tune": "fastdecode"},
+    "publish": {"preset": "medium", "crf": None, "threads": 0, "tune": None},
+    "archive": {"preset": "slow", "crf": 18, "threads": 0, "tune": "film"},
+}
+
+FORM_BITRATE = {"shorts": "5000k", "long": "8000k"}
+
+def resolve_profile(profile=None):
+    name = profile or Config.ENCODE_PROFILE
+    if name not in ENCODE_PROFILES:
+        print(f"   ⚠️ [Encode] Unknown profile '{name}'. Using 'publish'. (choices: {', '.join(ENCODE_PROFILES)})")
+        name = "publish"
+    return name
+
+def encode_params(form, profile=None):
+    """
+    write_videofile 에 그대로 넘길 인자. form: "shorts" 또는 "long"
+    (롱폼 세그먼트 concat 을 위해 같은 작업의 모든 패스는 같은 프로필을 써야 함)
+    """
+    settings = ENCODE_PROFILES[resolve_profile(profile)]
+    params = dict(fps=30, codec="libx264", audio_codec="aac", preset=settings["preset"], threads=settings["threads"])
+
+    ffmpeg_params = []
+    if settings["crf"] is not None: ffmpeg_params += ["-crf", str(settings["crf"])]
+    else: params["bitrate"] = FORM_BITRATE[form]
+    if settings["tune"]: ffmpeg_params += ["-tune", settings["tune"]]
+    if ffmpeg_params: params["ffmpeg_params"] = ffmpeg_params
+    return params
+
+def ffmpeg_video_args(params):
+    """encode_params() 결과를 ffmpeg 출력 인자로 변환 (moviepy 를 거치지 않는 렌더러용, moviepy 와 같은 옵션)"""
+    args = ["-c:v", params["codec"], "-preset", params["preset"]]
+    args += params.get("ffmpeg_params", [])
+    if params.get("bitrate"): args += ["-b:v", params["bitrate"]]
+    if params.get("threads") is not None: args += ["-threads", str(params["threads"])]
+    return args + ["-pix_fmt", "yuv420p"]
@@ -0,0 +1,53 @@
+import os
+import subprocess
+
+# ==============================================================================
+# 🎞️ FFMPEG HELPERS (moviepy 를 거치지 않는 스트림 복사 / 오디오 믹스 작업)
+# ==============================================================================
+
+def ffmpeg_binary():
+    """moviepy 와 같은 ffmpeg 실행 파일을 사용 (imageio-ffmpeg 번들 포함)"""
+    try:
+        from moviepy.config import get_setting
+        return get_setting("FFMPEG_BINARY")
+    except Exception:
+        return "ffmpeg"
+
+def run_ffmpeg(args):
+    cmd = [ffmpeg_binary(), "-y", "-hide_banner", "-loglevel", "error"] + list(args)
+    subprocess.run(cmd, check=True)
+
+def concat_segments(paths, out_path):
+    """
+    동일한 코덱 파라미터로 인코딩된 세그먼트들을 재인코딩 없이(stream copy) 이어붙입니다.
+    """
+    list_path = out_path + ".concat.txt"
+    with open(list_path, "w", encoding="utf-8") as f:
+        for p in paths:
+            safe = os.path.abspath(p).replace(os.sep, "/").replace("'", "'\\''")
+            f.write(f"file '{safe}'\n")
+    try:
+        run_ffmpeg(["-f", "concat", "-safe", "0", "-i", list_path, "-c", "copy", out_path])
+    finally:
+        if os.path.exists(list_path): os.remove(list_path)
+
+def mux_audio(video_path, audio_path, out_path):
+    """
+    영상 스트림과 미리 조립된 오디오 트랙을 재인코딩 없이(stream copy) 합칩니다.
+    """
+    run_ffmpeg([
+        "-i", video_path, "-i", audio_path,
+        "-map", "0:v", "-map", "1:a",
+        "-c", "copy", "-shortest",
+        out_path
+    ])
+
+def has_audio(path):
+    """파일에 오디오 스트림이 있는지 (인트로/아웃트로 영상 자체 사운드 확인용)"""
+    from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+    try: return bool(ffmpeg_parse_infos(path).get("audio_found"))
+    except Exception: return False
+
+def media_duration(path):
+    from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+    return ffmpeg_parse_infos(path)["duration"]
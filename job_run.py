@@ -0,0 +1,119 @@
+import os
+import json
+import shutil
+import threading
+import hashlib
+from datetime import datetime
+from config import Config
+
+# ==============================================================================
+# 📒 JOB RUN MANIFEST (단계별 체크포인트 -> 같은 job id 로 재실행 시 이어서 진행)
+# - 각 단계는 입력 해시(이전 단계 출력 해시 포함)와 출력 파일 해시를 기록합니다.
+# - 입력이 바뀌었거나 출력 파일이 없어진/변경된 첫 단계부터 다시 실행됩니다.
+# ==============================================================================
+
+def hash_value(*parts):
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(json.dumps(part, sort_keys=True, ensure_ascii=False, default=str).encode('utf-8'))
+        h.update(b"\0")
+    return h.hexdigest()
+
+def file_digest(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def publish_file(src, dst):
+    """
+    작업 폴더의 결과물을 공용 results/ 로 원자적으로 게시합니다.
+    (같은 드라이브면 rename, 아니면 임시 파일로 복사 후 교체 - 반쯤 쓰인 파일이 보이지 않음)
+    """
+    os.makedirs(os.path.dirname(dst) or ".", exist_ok=True)
+    try:
+        os.replace(src, dst)
+    except OSError:
+        tmp_path = f"{dst}.{os.getpid()}.tmp"
+        shutil.copyfile(src, tmp_path)
+        os.replace(tmp_path, dst)
+        os.remove(src)
+
+class JobRun:
+    def __init__(self, job_id, root=None):
+        self.job_id = job_id
+        self.dir = os.path.join(root or Config.RUNS_DIR, job_id)
+        os.makedirs(self.dir, exist_ok=True)
+        self.manifest_path = os.path.join(self.dir, "manifest.json")
+        # 파이프라인 모드에서는 여러 단계가 동시에 complete() 를 호출할 수 있음
+        self.lock = threading.RLock()
+        self.manifest = self._load()
+
+    def _load(self):
+        if os.path.exists(self.manifest_path):
+            try:
+                with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                    manifest = json.load(f)
+                print(f"📒 [Run] Resuming job '{self.job_id}' ({len(manifest.get('stages', {}))} checkpoints)")
+                return manifest
+            except Exception as e:
+                print(f"   ⚠️ [Run] Manifest unreadable, starting over: {e}")
+        return {"job_id": self.job_id, "created_at": datetime.now().isoformat(), "stages": {}}
+
+    def _save(self):
+        with self.lock:
+            self._write()
+
+    def _write(self):
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.manifest_path)
+
+    # ------------------------------------------------------------------
+    # 단계 상태
+    # ------------------------------------------------------------------
+    def is_done(self, stage, input_hash):
+        entry = self.manifest["stages"].get(stage)
+        if not entry or entry.get("input_hash") != input_hash: return False
+        for path, digest in entry.get("outputs", {}).items():
+            if not os.path.exists(path) or file_digest(path) != digest: return False
+        return True
+
+    def get(self, stage, default=None):
+        entry = self.manifest["stages"].get(stage)
+        return entry.get("data", default) if entry else default
+
+    def output_hash(self, stage):
+        entry = self.manifest["stages"].get(stage)
+        return entry.get("output_hash") if entry else None
+
+    def complete(self, stage, input_hash, data=None, outputs=()):
+        files = {p: file_digest(p) for p in outputs if p and os.path.exists(p)}
+        entry = {
+            "input_hash": input_hash,
+            "output_hash": hash_value(data, sorted(files.items())),
+            "outputs": files,
+            "data": data,
+            "completed_at": datetime.now().isoformat(),
+        }
+        with self.lock:
+            self.manifest["stages"][stage] = entry
+            self._save()
+        return entry["output_hash"]
+
+    def step(self, stage, inputs, produce):
+        """
+        inputs 가 같고 출력 파일이 그대로면 저장된 결과를 반환, 아니면 produce() 실행.
+        produce() -> (data, output_paths). data 가 None 이면 실패로 보고 기록하지 않습니다.
+        """
+        input_hash = hash_value(*inputs)
+        if self.is_done(stage, input_hash):
+            print(f"   ⏭️ [Run] Stage '{stage}' is up to date. Skipping.")
+            return self.get(stage)
+
+        data, outputs = produce()
+        if data is None: return None
+        self.complete(stage, input_hash, data=data, outputs=outputs)
+        return data
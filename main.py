@@ -1,6 +1,7 @@
 import os
 import re
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dotenv import load_dotenv
 from config import Config
@@ -8,6 +9,9 @@ from news_agent import NewsAgent
 from writer_agent import WriterAgent
 from media_agent import MediaAgent
 from editor import Editor
+from job_run import JobRun, publish_file
+from subtitle_timing import timing_path
+from encode_profiles import ENCODE_PROFILES, resolve_profile
 
 # 환경 변수 로드
 load_dotenv()
@@ -38,6 +42,168 @@ def sanitize_script(script_data):
 
     return script_data
 
+class StudioAgents:
+    """
+    [NEW] 쇼츠 제작 에이전트 묶음.
+    워커 데몬에서는 한 번만 만들고 작업마다 작업 폴더만 바꿔서 재사용합니다 (폰트/HTTP 세션/TTS 클라이언트 유지).
+    """
+    def __init__(self, workspace=".", news_agent=None):
+        self.news = news_agent or NewsAgent()
+        self.writer = WriterAgent(workspace=workspace)
+        self.media = MediaAgent(workspace=workspace)
+        self.editor = Editor(workspace=workspace)
+
+    def use_workspace(self, workspace):
+        for agent in (self.writer, self.media, self.editor):
+            agent.use_workspace(workspace)
+
+def produce_shorts(news_mode, target_category, target_url, gender, tone, final_timestamp, job_id=None, agents=None, news_agent=None, profile=None):
+    """
+    [NEW] 쇼츠 1건 생성 (CLI 와 워커 데몬이 공유). 성공 시 results/ 에 게시된 영상 경로, 실패 시 None.
+    """
+    print("\n" + "="*50)
+    print(f"🚀 Processing: [{news_mode.upper()}] Category=[{target_category}] Gender=[{gender}]")
+    print("="*50 + "\n")
+
+    # [NEW] 작업별 체크포인트 매니페스트
+    job_id = job_id or f"{target_category if news_mode == 'daily' else 'url'}_{final_timestamp}"
+    run = JobRun(job_id)
+
+    # [NEW] 작업별 격리된 작업 폴더 (동시에 여러 작업이 실행되어도 서로 덮어쓰지 않음)
+    agents = agents or StudioAgents(news_agent=news_agent)
+    agents.use_workspace(run.dir)
+    news_agent, writer, media_agent, editor = agents.news, agents.writer, agents.media, agents.editor
+
+    # [Step 2] 실행 단계
+    try:
+        # 1. News Gathering
+        def gather_news():
+            if news_mode == "url":
+                print(f"📰 [News] Fetching content from URL...")
+                return news_agent.get_specific_news(target_url), []
+            return news_agent.get_daily_news(category=target_category), []
+
+        context = run.step("context", [news_mode, target_category, target_url], gather_news)
+        if not context:
+            print("❌ Failed to gather news context. Aborting.")
+            return None
+
+        # 2. Script Writing
+        def write_script():
+            script_data = writer.generate_content(context, mode="shorts")
+            return sanitize_script(script_data) if script_data else None, []
+
+        script_data = run.step("script", [run.output_hash("context")], write_script)
+        if not script_data:
+            print("❌ Script generation failed.")
+            return None
+        
+        # [메타데이터 저장]
+        if 'metadata' in script_data:
+            if hasattr(writer, 'save_metadata_file'):
+                writer.save_metadata_file(script_data['metadata'])
+
+        # 3. Media Generation
+        def make_audio():
+            media_agent.get_audio(script_data, gender=gender, tone=tone)
+            files = [f for _, f in media_agent.narration_jobs(script_data)]
+            # [수정] 합성에 실패한 클립이 있으면 단계를 실패로 (체크포인트에 남지 않으므로 재시도 시 다시 합성)
+            missing = [f for f in files if not os.path.exists(f)]
+            if missing:
+                print(f"   ❌ [Audio] {len(missing)} narration clip(s) failed: {', '.join(os.path.basename(f) for f in missing)}")
+                return None, files
+            durations = {f: media_agent.audio_durations.get(f) for f in files}
+            # 단어 타이밍 파일(있는 경우)도 체크포인트 출력에 포함
+            return {"durations": durations}, files + [timing_path(f) for f in files]
+
+        def make_images():
+            scenes = script_data['script']['scenes']
+            media_agent.get_images(scenes)
+            return {"count": len(scenes)}, [media_agent.workspace_path("images", f"image_{i+1}.png") for i in range(len(scenes))]
+
+        # [NEW] 오디오 합성과 이미지 다운로드는 서로 독립적이므로 동시에 진행
+        if Config.PIPELINE_STAGES:
+            with ThreadPoolExecutor(max_workers=2) as stages:
+                audio_future = stages.submit(run.step, "audio", [run.output_hash("script"), gender, tone], make_audio)
+                images_future = stages.submit(run.step, "images", [run.output_hash("script")], make_images)
+                audio = audio_future.result(); images_future.result()
+        else:
+            audio = run.step("audio", [run.output_hash("script"), gender, tone], make_audio)
+            run.step("images", [run.output_hash("script")], make_images)
+        if not audio:
+            print("❌ Narration synthesis failed. Aborting.")
+            return None
+
+        results_dir = "results"
+        job_results_dir = os.path.join(run.dir, "results")
+        cat_upper = target_category.upper()
+
+        # [핵심] final_timestamp를 사용하여 최종 파일명 결정
+        new_base = f"final_shorts_{cat_upper}_{final_timestamp}"
+        dst_video = os.path.join(results_dir, f"{new_base}.mp4")
+        dst_meta  = os.path.join(results_dir, f"{new_base}.json")
+        dst_text  = os.path.join(results_dir, f"{new_base}.txt")
+
+        # 4. Video Editing (+ 영상 이름 변경까지 한 단계로 체크포인트)
+        def render_video():
+            editor.make_shorts(script_data, category=target_category, profile=profile)
+
+            # =========================================================================
+            # 🆕 [Step 3] 결과물 이름 변경 (타임스탬프 적용 - JSON 포함)
+            # =========================================================================
+            print("\n📦 [Archiving] Renaming files...")
+
+            # 파일 이름 후보군 (Editor가 생성한 파일명)
+            video_candidates = [
+                f"final_shorts_{cat_upper}.mp4",
+                f"final_shorts_{cat_upper}S.mp4",
+                f"final_shorts_{cat_upper.rstrip('S')}.mp4",
+                f"final_shorts_US{cat_upper}.mp4" 
+            ]
+            
+            src_video = None
+            for cand in video_candidates:
+                path = os.path.join(job_results_dir, cand)
+                if os.path.exists(path):
+                    src_video = path
+                    print(f"   🔍 Found generated video: {cand}")
+                    break
+
+            # [1] 영상 이름 변경 (작업 폴더 -> results/ 원자적 게시)
+            if not src_video:
+                print(f"   ⚠️ Video file not found (Checked variants: {video_candidates})")
+                return None, []
+            publish_file(src_video, dst_video)
+            print(f"   ✅ Video Saved: {dst_video}")
+            return {"video": dst_video}, [dst_video]
+
+        render_inputs = [run.output_hash("script"), run.output_hash("audio"), run.output_hash("images"), resolve_profile(profile)]
+        rendered = run.step("render", render_inputs, render_video)
+        if not rendered: return None
+
+        src_meta = os.path.join(job_results_dir, "metadata.json")
+        src_text = os.path.join(job_results_dir, "social_metadata.txt")
+
+        # [2] JSON 메타데이터 이름 변경 (보존)
+        if os.path.exists(src_meta):
+            publish_file(src_meta, dst_meta)
+            print(f"   ✅ Metadata Saved: {dst_meta}")
+
+        # [3] 소셜 텍스트 이름 변경 (보존)
+        if os.path.exists(src_text):
+            publish_file(src_text, dst_text)
+            print(f"   ✅ Social Text Saved: {dst_text}")
+            
+        print("\n🎉 All Done! Please check the 'results' folder.")
+        return dst_video
+
+    except Exception as e:
+        print(f"\n❌ Critical Error in Main Process: {e}")
+        import traceback
+        traceback.print_exc()
+        return None
+
+
 def main():
     print(f"\n🤖 Flash News Bite AI Studio Initialized...")
 
@@ -48,13 +214,13 @@ def main():
     parser.add_argument("--tone", type=str, default="2", help="Voice tone: 1(Trust), 2(Neutral), 3(Bright)")
     # [핵심] 스케줄러가 전달하는 timestamp를 받기 위한 인자 추가
     parser.add_argument("--timestamp", type=str, help="External timestamp for file naming")
+    # [NEW] 같은 job id 로 재실행하면 마지막으로 성공한 단계 다음부터 이어서 진행
+    parser.add_argument("--job-id", type=str, help="Resume/checkpoint id (default: <category>_<timestamp>)")
+    parser.add_argument("--encode-profile", choices=list(ENCODE_PROFILES), help=f"Encode profile (default: {Config.ENCODE_PROFILE})")
     
     args = parser.parse_args()
 
     news_agent = NewsAgent()
-    writer = WriterAgent()
-    media_agent = MediaAgent()
-    editor = Editor()
 
     news_mode = "daily"
     target_category = "world"
@@ -115,109 +281,8 @@ def main():
         tone_map = {'1': '1', '2': '2', '3': '3'}
         tone = tone_map.get(t_choice, '2')
 
-    print("\n" + "="*50)
-    print(f"🚀 Processing: [{news_mode.upper()}] Category=[{target_category}] Gender=[{gender}]")
-    print("="*50 + "\n")
-
-    # [Step 2] 실행 단계
-    try:
-        # 1. News Gathering
-        context = ""
-        if news_mode == "url":
-            print(f"📰 [News] Fetching content from URL...")
-            context = news_agent.get_specific_news(target_url)
-        else:
-            context = news_agent.get_daily_news(category=target_category)
-
-        if not context:
-            print("❌ Failed to gather news context. Aborting.")
-            return
-
-        # 2. Script Writing
-        script_data = writer.generate_content(context, mode="shorts")
-        if not script_data:
-            print("❌ Script generation failed.")
-            return
-
-        script_data = sanitize_script(script_data)
-        
-        # [메타데이터 저장]
-        if 'metadata' in script_data:
-            if hasattr(writer, 'save_metadata_file'):
-                writer.save_metadata_file(script_data['metadata'])
-
-        # 3. Media Generation
-        media_agent.get_audio(script_data, gender=gender, tone=tone)
-        media_agent.get_images(script_data['script']['scenes'])
-
-        # 4. Video Editing
-        editor.make_shorts(script_data, category=target_category)
-
-        # =========================================================================
-        # 🆕 [Step 3] 결과물 이름 변경 (타임스탬프 적용 - JSON 포함)
-        # =========================================================================
-        print("\n📦 [Archiving] Renaming files...")
-        
-        results_dir = "results"
-        cat_upper = target_category.upper()
-
-        # 파일 이름 후보군 (Editor가 생성한 파일명)
-        video_candidates = [
-            f"final_shorts_{cat_upper}.mp4",
-            f"final_shorts_{cat_upper}S.mp4",
-            f"final_shorts_{cat_upper.rstrip('S')}.mp4",
-            f"final_shorts_US{cat_upper}.mp4" 
-        ]
-        
-        src_video = None
-        for cand in video_candidates:
-            path = os.path.join(results_dir, cand)
-            if os.path.exists(path):
-                src_video = path
-                print(f"   🔍 Found generated video: {cand}")
-                break
-        
-        src_meta = os.path.join(results_dir, "metadata.json")
-        src_text = os.path.join(results_dir, "social_metadata.txt")
-
-        # [핵심] final_timestamp를 사용하여 최종 파일명 결정
-        new_base = f"final_shorts_{cat_upper}_{final_timestamp}"
-        dst_video = os.path.join(results_dir, f"{new_base}.mp4")
-        dst_meta  = os.path.join(results_dir, f"{new_base}.json")
-        dst_text  = os.path.join(results_dir, f"{new_base}.txt")
-
-        # [1] 영상 이름 변경
-        if src_video:
-            if os.path.exists(dst_video):
-                try: os.remove(dst_video)
-                except: pass
-            os.rename(src_video, dst_video)
-            print(f"   ✅ Video Saved: {dst_video}")
-        else:
-            print(f"   ⚠️ Video file not found (Checked variants: {video_candidates})")
-
-        # [2] JSON 메타데이터 이름 변경 (보존)
-        if os.path.exists(src_meta):
-            if os.path.exists(dst_meta):
-                try: os.remove(dst_meta)
-                except: pass
-            os.rename(src_meta, dst_meta)
-            print(f"   ✅ Metadata Saved: {dst_meta}")
-
-        # [3] 소셜 텍스트 이름 변경 (보존)
-        if os.path.exists(src_text):
-            if os.path.exists(dst_text):
-                try: os.remove(dst_text)
-                except: pass
-            os.rename(src_text, dst_text)
-            print(f"   ✅ Social Text Saved: {dst_text}")
-            
-        print("\n🎉 All Done! Please check the 'results' folder.")
-
-    except Exception as e:
-        print(f"\n❌ Critical Error in Main Process: {e}")
-        import traceback
-        traceback.print_exc()
+    produce_shorts(news_mode, target_category, target_url, gender, tone, final_timestamp,
+                   job_id=args.job_id, news_agent=news_agent, profile=args.encode_profile)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,6 +1,7 @@
 import os
 import argparse
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from config import Config
 from news_agent import NewsAgent
@@ -8,11 +9,13 @@ from writer_agent import WriterAgent
 from media_agent import MediaAgent
 from editor_long import EditorLong
 from uploaders.youtube_uploader import upload_video
+from job_run import JobRun, publish_file
+from subtitle_timing import timing_path
+from encode_profiles import ENCODE_PROFILES, resolve_profile
+from scene_pipeline import long_form_gate
 
-def main():
-    print(f"\n🎬 [CinemaGen Long-Form Studio] Initialized...")
-    print("="*50)
-
+def ask_request():
+    """대화형 입력 (모드 / 소스 / 길이 / 목소리)"""
     # 1. 입력 모드 선택
     print("Select Mode:")
     print("1. 🔗 URL based (News/Fact - Uses Images)")
@@ -20,27 +23,13 @@ def main():
     mode_choice = input("👉 Select (1/2): ").strip()
     
     source_type = "news" if mode_choice == '1' else "topic"
-    context = ""
-    
-    # 에이전트 초기화
-    news_agent = NewsAgent()
-    writer = WriterAgent()
-    media_agent = MediaAgent()
-    editor = EditorLong()
+    request = {"source_type": source_type}
 
-    # 2. Context 확보
     if source_type == "news":
-        url = input("👉 Enter Article URL: ").strip()
-        print("⏳ Fetching article...")
-        context = news_agent.get_specific_news(url)
+        request["url"] = input("👉 Enter Article URL: ").strip()
     else:
-        title = input("👉 Enter Topic Title: ").strip()
-        desc = input("👉 Enter Brief Description: ").strip()
-        context = f"Topic: {title}\nDescription: {desc}"
-
-    if not context:
-        print("❌ Failed to get context.")
-        return
+        request["title"] = input("👉 Enter Topic Title: ").strip()
+        request["desc"] = input("👉 Enter Brief Description: ").strip()
 
     # [NEW] 2.5 영상 길이 선택
     print("\n[Target Duration]")
@@ -56,22 +45,68 @@ def main():
         '3': '12-18 minutes',
         '4': '20-30 minutes'
     }
-    target_duration = duration_map.get(dur_input, '2-4 minutes')
-    print(f"✅ Target Duration Set: {target_duration}")
+    request["target_duration"] = duration_map.get(dur_input, '2-4 minutes')
+    print(f"✅ Target Duration Set: {request['target_duration']}")
 
     # 3. 보이스 설정
     print("\n[Voice Settings]")
     print("👉 Gender: 1. Male / 2. Female")
     g_input = input("Selection (default 1): ").strip()
-    gender = "male" if g_input == '1' else "female"
+    request["gender"] = "male" if g_input == '1' else "female"
     
     print("👉 Tone: 1. Trust / 2. Neutral / 3. Bright")
     t_input = input("Selection (default 1): ").strip()
     tone_map = {'1':'1', '2':'2', '3':'3'}
-    tone = tone_map.get(t_input, '1')
+    request["tone"] = tone_map.get(t_input, '1')
+    return request
+
+def main():
+    print(f"\n🎬 [CinemaGen Long-Form Studio] Initialized...")
+    print("="*50)
+
+    # [NEW] 같은 job id 로 재실행하면 입력 질문 없이 마지막 성공 단계 다음부터 이어서 진행
+    parser = argparse.ArgumentParser(description="CinemaGen Long-Form Studio")
+    parser.add_argument("--job-id", type=str, help="Resume/checkpoint id (default: long_<timestamp>)")
+    parser.add_argument("--encode-profile", choices=list(ENCODE_PROFILES), help=f"Encode profile (default: {Config.ENCODE_PROFILE})")
+    args = parser.parse_args()
+
+    job_id = args.job_id or f"long_{datetime.now().strftime('%Y%m%d_%H%M')}"
+    run = JobRun(job_id)
+
+    request = run.get("request")
+    if request:
+        print(f"   ⏭️ [Run] Reusing saved request: {request.get('source_type')} / {request.get('target_duration')}")
+    else:
+        request = ask_request()
+        run.complete("request", "interactive", data=request)
+
+    source_type = request["source_type"]
+    target_duration = request["target_duration"]
+    gender, tone = request["gender"], request["tone"]
+    
+    # 에이전트 초기화 (작업별 격리된 작업 폴더 사용)
+    news_agent = NewsAgent()
+    writer = WriterAgent(workspace=run.dir)
+    media_agent = MediaAgent(workspace=run.dir)
+    editor = EditorLong(workspace=run.dir)
+
+    # 2. Context 확보
+    def gather_context():
+        if source_type == "news":
+            print("⏳ Fetching article...")
+            return news_agent.get_specific_news(request["url"]), []
+        return f"Topic: {request['title']}\nDescription: {request['desc']}", []
+
+    context = run.step("context", [run.output_hash("request")], gather_context)
+    if not context:
+        print("❌ Failed to get context.")
+        return
 
     # 4. 대본 작성 (Long Mode + Duration 전달)
-    script_data = writer.generate_content(context, mode="long", source_type=source_type, duration=target_duration)
+    def write_script():
+        return writer.generate_content(context, mode="long", source_type=source_type, duration=target_duration), []
+
+    script_data = run.step("script", [run.output_hash("context"), target_duration], write_script)
     if not script_data:
         print("❌ Script generation failed.")
         return
@@ -82,15 +117,78 @@ def main():
     print(f"📄 Scenes: {len(script_data['script']['scenes'])}")
 
     # 5. 미디어 생성
-    media_agent.get_audio(script_data, gender=gender, tone=tone)
-    media_agent.get_mixed_media(script_data['script']['scenes'])
+    scenes = script_data['script']['scenes']
+
+    def make_audio(on_done=None):
+        media_agent.get_audio(script_data, gender=gender, tone=tone, on_done=on_done)
+        files = [f for _, f in media_agent.narration_jobs(script_data)]
+        # [수정] 합성에 실패한 클립이 있으면 단계를 실패로 (체크포인트에 남지 않으므로 재시도 시 다시 합성)
+        missing = [f for f in files if not os.path.exists(f)]
+        if missing:
+            print(f"   ❌ [Audio] {len(missing)} narration clip(s) failed: {', '.join(os.path.basename(f) for f in missing)}")
+            return None, files
+        # 단어 타이밍 파일(있는 경우)도 체크포인트 출력에 포함
+        return {"durations": {f: media_agent.audio_durations.get(f) for f in files}}, files + [timing_path(f) for f in files]
+
+    def make_media(on_done=None):
+        media_agent.get_mixed_media(scenes, on_done=on_done)
+        files = []
+        for i in range(len(scenes)):
+            files += [media_agent.workspace_path("videos", f"video_{i+1}.mp4"),
+                      media_agent.workspace_path("images", f"image_{i+1}.png")]
+        return {"count": len(scenes)}, files
+
+    audio_inputs = [run.output_hash("script"), gender, tone]
+    media_inputs = [run.output_hash("script")]
+
+    # [NEW] 파이프라인 모드: 오디오/미디어를 동시에 받으면서, 장면별 자산이 준비되는 즉시 세그먼트 인코딩 시작
+    # [수정] 렌더 워커가 1개면 세션 없이 (자산만 동시에 받고) 단일 패스 지연 타임라인으로 렌더링
+    session = editor.open_pipeline(script_data, run=run, profile=args.encode_profile) if Config.PIPELINE_STAGES else None
+    if Config.PIPELINE_STAGES:
+        gate, on_audio, on_visual = long_form_gate(session.specs, session.submit) if session else (None, None, None)
+
+        def audio_stage():
+            audio = run.step("audio", audio_inputs, lambda: make_audio(on_done=on_audio))
+            if gate: gate.mark_all("audio")
+            return audio
+
+        def media_stage():
+            run.step("media", media_inputs, lambda: make_media(on_done=on_visual))
+            if gate: gate.mark_all("visual")
+
+        with ThreadPoolExecutor(max_workers=2) as stages:
+            audio_future, media_future = stages.submit(audio_stage), stages.submit(media_stage)
+            audio = audio_future.result(); media_future.result()
+    else:
+        audio = run.step("audio", audio_inputs, make_audio)
+        run.step("media", media_inputs, make_media)
+
+    if not audio:
+        if session: session.close()
+        print("❌ Narration synthesis failed.")
+        return
 
     print("\n✅ Assets Ready! Starting Editor...")
     
-    # 6. 편집 및 렌더링
-    output_file = editor.make_video(script_data)
+    # 6. 편집 및 렌더링 (세그먼트 단위 체크포인트는 EditorLong 이 run 에 기록)
+    def render_video():
+        output_file = session.finish() if session else editor.make_video(script_data, run=run, profile=args.encode_profile)
+        if not output_file or not os.path.exists(output_file): return None, []
+        # 작업 폴더 -> results/ 원자적 게시
+        published = os.path.join("results", os.path.basename(output_file))
+        publish_file(output_file, published)
+        return {"video": published}, [published]
+
+    render_inputs = [run.output_hash("script"), run.output_hash("audio"), run.output_hash("media"), resolve_profile(args.encode_profile)]
+    rendered = run.step("render", render_inputs, render_video)
+    if session: session.close()
+    output_file = rendered.get("video") if rendered else None
     
     if output_file and os.path.exists(output_file):
+        if run.get("upload"):
+            print("   ⏭️ [Run] Already uploaded for this job. Skipping upload.")
+            return
+
         print("\n" + "="*50)
         print("🚀 [Upload] Uploading to YouTube...")
         print("="*50)
@@ -110,6 +208,7 @@ def main():
         )
         
         if success:
+            run.complete("upload", run.output_hash("render"), data={"video": output_file})
             print("\n🎉 [Success] Video Created & Uploaded!")
         else:
             print("\n⚠️ [Warning] Video Created but Upload Failed.")
@@ -117,4 +216,4 @@ def main():
         print("❌ Video rendering failed.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
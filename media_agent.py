@@ -1,21 +1,41 @@
 import os
 import json
+import time
 import requests
-import edge_tts
+import threading
 import asyncio
-from PIL import Image
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from PIL import Image, ImageFile
 from config import Config
+from asset_cache import AssetCache, normalize_query
+from audio_probe import DURATIONS, audio_duration
+from subtitle_timing import save_timing, load_timing, clear_timing, split_boundary
+import html
+import hashlib
 import random
 import base64
 import io
-# Google Cloud TTS 라이브러리
-from google.cloud import texttospeech
+
+class RateLimiter:
+    """[NEW] 프로바이더별 최소 호출 간격 (여러 스레드가 공유)"""
+    def __init__(self, per_second):
+        self.interval = 1.0 / per_second if per_second > 0 else 0
+        self.lock = threading.Lock()
+        self.next_time = 0.0
+
+    def wait(self):
+        if not self.interval: return
+        with self.lock:
+            now = time.monotonic()
+            delay = self.next_time - now
+            self.next_time = max(now, self.next_time) + self.interval
+        if delay > 0: time.sleep(delay)
 
 class MediaAgent:
-    def __init__(self):
-        os.makedirs("images", exist_ok=True)
-        os.makedirs("videos", exist_ok=True)
-        os.makedirs("audio", exist_ok=True)
+    def __init__(self, workspace="."):
+        # [NEW] 작업별 작업 폴더 (audio/, images/, videos/ 가 이 아래에 생성됨)
+        self.use_workspace(workspace)
         
         if os.path.exists("google_key.json"):
             os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = "google_key.json"
@@ -25,6 +45,31 @@ class MediaAgent:
             self.has_gcp = False
             print("⚠️ [Media] 'google_key.json' not found. GCP TTS disabled.")
 
+        # [NEW] 검색 결과 / 다운로드 에셋 캐시
+        self.cache = AssetCache() if Config.ASSET_CACHE_ENABLED else None
+
+        # [NEW] GCP TTS 클라이언트는 처음 쓸 때 한 번만 생성해서 재사용 (채널/인증 비용 절감)
+        self._gcp_client = None
+        self._gcp_lock = threading.Lock()
+
+        # [NEW] 공유 HTTP 세션 (Serper / Pexels / Gemini TTS / 이미지 후보 다운로드 커넥션 풀)
+        pool_size = Config.IMAGE_FETCH_WORKERS * max(1, Config.MEDIA_SCENE_WORKERS)
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.http.mount("http://", adapter)
+        self.http.mount("https://", adapter)
+
+        # [NEW] 내레이션 TTS 캐시 (텍스트 + 목소리 + 프로바이더 + 속도 기준)
+        self.tts_cache = None
+        if Config.TTS_CACHE_ENABLED:
+            self.tts_cache = AssetCache(root=Config.TTS_CACHE_DIR, max_bytes=Config.TTS_CACHE_MAX_MB * 1024 * 1024, ttl=0)
+
+        # [NEW] 장면 병렬 처리 시 API 호출 속도 제한
+        self.limits = {
+            "serper": RateLimiter(Config.SERPER_RATE_PER_SEC),
+            "pexels": RateLimiter(Config.PEXELS_RATE_PER_SEC),
+        }
+
     GEMINI_VOICES = {
         "male": {"1": "Charon", "2": "Puck", "3": "Fenrir"},
         "female": {"1": "Aoede", "2": "Kore", "3": "Leda"}
@@ -33,6 +78,34 @@ class MediaAgent:
         "male": {"1": "en-US-ChristopherNeural", "2": "en-US-GuyNeural", "3": "en-US-EricNeural"},
         "female": {"1": "en-US-MichelleNeural", "2": "en-US-JennyNeural", "3": "en-US-AriaNeural"}
     }
+    GCP_SPEAKING_RATE = 1.1
+    EDGE_RATE = "+10%"
+    USER_AGENTS = [
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64)',
+        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)'
+    ]
+
+    def use_workspace(self, workspace):
+        """[NEW] 작업 폴더 전환 (워커 데몬에서 세션/클라이언트/캐시는 유지한 채 작업만 교체)"""
+        self.workspace = workspace
+        self.audio_durations = {}
+        os.makedirs(self.workspace_path("images"), exist_ok=True)
+        os.makedirs(self.workspace_path("videos"), exist_ok=True)
+        os.makedirs(self.workspace_path("audio"), exist_ok=True)
+
+    def workspace_path(self, *parts):
+        return os.path.join(self.workspace, *parts)
+
+    def _save_image(self, file_content, filename, min_width):
+        try:
+            img = Image.open(io.BytesIO(file_content))
+            if img.mode != 'RGB': img = img.convert('RGB')
+            w, h = img.size
+            if w < min_width: return False
+            if w <= h: return False 
+            img.save(filename, format='PNG')
+            return os.path.exists(filename) and os.path.getsize(filename) > 1000
+        except: return False
 
     def _download_logic(self, query, filename, min_width=800):
         url = "https://google.serper.dev/images"
@@ -40,51 +113,124 @@ class MediaAgent:
         headers = {'X-API-KEY': Config.SERPER_KEY, 'Content-Type': 'application/json'}
         skip_keywords = ["stock", "getty", "alamy", "shutterstock", "istock", "dreamstime", "123rf", "depositphotos"]
 
+        # [NEW] 캐시: 같은 검색어로 이미 고른 이미지가 있으면 검색/다운로드 생략
+        norm_query = normalize_query(query)
+        resolve_key = f"image:{norm_query}:{min_width}"
+        if self.cache:
+            chosen = self.cache.get_json(resolve_key)
+            if chosen:
+                cached = self.cache.get_bytes(f"url:{chosen['url']}")
+                if cached and self._save_image(cached, filename, min_width):
+                    print(f"   ♻️ [Image] Cache Hit: {filename}")
+                    return True
+
         try:
-            resp = requests.post(url, headers=headers, data=payload)
-            results = resp.json().get("images", [])
-            user_agents = [
-                'Mozilla/5.0 (Windows NT 10.0; Win64; x64)',
-                'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)'
-            ]
-            
-            for item in results:
-                image_url = item['imageUrl']
-                if any(k in image_url.lower() for k in skip_keywords): continue
+            results = self.cache.get_json(f"serper:{norm_query}") if self.cache else None
+            if results is None:
+                self.limits["serper"].wait()
+                resp = self.http.post(url, headers=headers, data=payload, timeout=10)
+                results = resp.json().get("images", [])
+                if self.cache and results: self.cache.put_json(f"serper:{norm_query}", results)
 
-                try:
-                    headers2 = {'User-Agent': random.choice(user_agents), 'Referer': 'https://www.google.com/', 'Accept': 'image/*'}
-                    r = requests.get(image_url, headers=headers2, timeout=3)
-                    
-                    if r.status_code == 200:
-                        file_content = r.content
-                        try:
-                            img = Image.open(io.BytesIO(file_content))
-                            if img.mode != 'RGB': img = img.convert('RGB')
-                            w, h = img.size
-                            if w < min_width: continue
-                            if w <= h: continue 
-                            img.save(filename, format='PNG')
-                            if os.path.exists(filename) and os.path.getsize(filename) > 1000:
-                                print(f"   ✅ [Image] Saved: {filename}")
-                                return True
-                        except: continue
-                except: continue
+            candidates = [item['imageUrl'] for item in results
+                          if not any(k in item['imageUrl'].lower() for k in skip_keywords)]
+            if not candidates: return False
+
+            # [NEW] 후보를 동시에 받고, 가장 먼저 조건을 통과한 이미지를 채택 (나머지는 취소)
+            stop = threading.Event()
+            pool = ThreadPoolExecutor(max_workers=Config.IMAGE_FETCH_WORKERS)
+            futures = [pool.submit(self._fetch_candidate, image_url, min_width, stop) for image_url in candidates]
+            try:
+                for future in as_completed(futures):
+                    try: fetched = future.result()
+                    except: continue
+                    if not fetched: continue
+
+                    image_url, file_content = fetched
+                    if self._save_image(file_content, filename, min_width):
+                        if self.cache:
+                            self.cache.put(f"url:{image_url}", file_content)
+                            self.cache.put_json(resolve_key, {"url": image_url})
+                        print(f"   ✅ [Image] Saved: {filename}")
+                        return True
+            finally:
+                stop.set()
+                pool.shutdown(wait=False, cancel_futures=True)
         except: pass
         return False
 
+    def _fetch_candidate(self, image_url, min_width, stop):
+        """
+        [NEW] 이미지 헤더만 먼저 파싱해서 작거나 세로형이면 다운로드 도중에 중단합니다.
+        반환: (image_url, bytes) 또는 None
+        """
+        if stop.is_set(): return None
+        if self.cache:
+            cached = self.cache.get_bytes(f"url:{image_url}")
+            if cached is not None: return image_url, cached
+
+        headers2 = {'User-Agent': random.choice(self.USER_AGENTS), 'Referer': 'https://www.google.com/', 'Accept': 'image/*'}
+        with self.http.get(image_url, headers=headers2, timeout=3, stream=True) as r:
+            if r.status_code != 200: return None
+
+            parser = ImageFile.Parser()
+            checked = False
+            chunks = []
+            for chunk in r.iter_content(chunk_size=16384):
+                if stop.is_set(): return None
+                chunks.append(chunk)
+                if checked: continue
+                try:
+                    parser.feed(chunk)
+                except Exception:
+                    checked = True  # 헤더 파싱 불가 -> 전체 다운로드 후 판단
+                    continue
+                if parser.image:
+                    w, h = parser.image.size
+                    if w < min_width or w <= h: return None
+                    checked = True
+            return image_url, b"".join(chunks)
+
     def search_and_download_image(self, query, filename):
         if self._download_logic(query, filename, min_width=800): return True
         short_query = " ".join(query.split()[:4]) + " news"
         if self._download_logic(short_query, filename, min_width=600): return True
         return False
 
-    def get_images(self, scenes):
-        print(f"🎨 [Media] Downloading Images for Shorts...")
-        for i, scene in enumerate(scenes):
+    def run_scenes(self, label, scenes, task, on_done=None):
+        """
+        [NEW] 장면 단위 병렬 실행 (MEDIA_SCENE_WORKERS) + 장면별 소요 시간 리포트
+        task(idx, scene) 는 images/image_{idx}.png 등 기존 출력 규칙을 그대로 따릅니다.
+        on_done(idx) 는 장면이 끝나는 즉시 (성공/실패 무관) 호출됩니다.
+        """
+        def timed(args):
+            i, scene = args
             idx = i + 1
-            if not self.search_and_download_image(scene['image_prompt'], f"images/image_{idx}.png"):
-                 Image.new('RGB', (1280, 720), (20,30,60)).save(f"images/image_{idx}.png")
+            start = time.perf_counter()
+            try: task(idx, scene)
+            except Exception as e: print(f"   ⚠️ [Media] Scene {idx} failed: {e}")
+            if on_done: on_done(idx)
+            return idx, time.perf_counter() - start
+
+        started = time.perf_counter()
+        workers = max(1, Config.MEDIA_SCENE_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            timings = list(pool.map(timed, enumerate(scenes)))
+
+        if timings:
+            detail = ", ".join(f"#{idx} {sec:.1f}s" for idx, sec in timings)
+            print(f"   ⏱️ [Media] {label}: {time.perf_counter() - started:.1f}s total ({workers} workers) | {detail}")
+        if self.cache: self.cache.report()
+
+    def get_images(self, scenes, on_done=None):
+        print(f"🎨 [Media] Downloading Images for Shorts...")
+
+        def task(idx, scene):
+            i_filename = self.workspace_path("images", f"image_{idx}.png")
+            if not self.search_and_download_image(scene['image_prompt'], i_filename):
+                 Image.new('RGB', (1280, 720), (20,30,60)).save(i_filename)
+
+        self.run_scenes("Images", scenes, task, on_done)
 
     # =========================================================================
     # [UPGRADED] 1.5 비디오 다운로드 (고화질 검색어 추가)
@@ -102,10 +248,23 @@ class MediaAgent:
         headers = {"Authorization": Config.PEXELS_KEY}
         params = {"query": enhanced_query, "orientation": "landscape", "per_page": 5, "size": "medium"}
 
+        # [NEW] 캐시: 같은 검색어로 받은 영상이 있으면 그대로 복사
+        norm_query = normalize_query(enhanced_query)
+        resolve_key = f"video:{norm_query}:{min_duration}"
+        if self.cache:
+            chosen = self.cache.get_json(resolve_key)
+            if chosen and self.cache.copy_to(f"url:{chosen['url']}", filename):
+                print(f"      ♻️ [Video] Cache Hit: {filename}")
+                return True
+
         try:
-            r = requests.get(url, headers=headers, params=params, timeout=10)
-            data = r.json()
-            videos = data.get('videos', [])
+            videos = self.cache.get_json(f"pexels:{norm_query}") if self.cache else None
+            if videos is None:
+                self.limits["pexels"].wait()
+                r = self.http.get(url, headers=headers, params=params, timeout=10)
+                data = r.json()
+                videos = data.get('videos', [])
+                if self.cache and videos: self.cache.put_json(f"pexels:{norm_query}", videos)
             
             if not videos: return False
 
@@ -124,46 +283,78 @@ class MediaAgent:
                 target_url = videos[0]['video_files'][0]['link']
 
             if target_url:
-                v_content = requests.get(target_url, timeout=30).content
+                if self.cache and self.cache.copy_to(f"url:{target_url}", filename):
+                    print(f"      ♻️ [Video] Cache Hit: {filename}")
+                    return True
+                v_content = self.http.get(target_url, timeout=30).content
                 with open(filename, 'wb') as f: f.write(v_content)
                 if os.path.exists(filename) and os.path.getsize(filename) > 1000:
+                    if self.cache:
+                        self.cache.put(f"url:{target_url}", v_content)
+                        self.cache.put_json(resolve_key, {"url": target_url})
                     print(f"      ✅ [Video] Saved: {filename}")
                     return True
         except Exception as e:
             print(f"   ❌ Pexels Error: {e}")
         return False
 
-    def get_mixed_media(self, scenes):
+    def get_mixed_media(self, scenes, on_done=None):
         print(f"🎨 [Media] Downloading Mixed Assets (Video + Image)...")
-        
-        for i, scene in enumerate(scenes):
-            idx = i + 1
+
+        def task(idx, scene):
             v_type = scene.get('visual_type', 'image') 
             prompt = scene.get('visual_prompt', scene.get('image_prompt', 'news'))
             
             if v_type == 'video':
-                v_filename = f"videos/video_{idx}.mp4"
+                v_filename = self.workspace_path("videos", f"video_{idx}.mp4")
                 if self.search_and_download_video(prompt, v_filename):
-                    continue 
+                    return
                 else:
                     print(f"      ⚠️ Video failed. Fallback to Image for Scene {idx}")
                     v_type = 'image'
 
             if v_type == 'image':
-                i_filename = f"images/image_{idx}.png"
+                i_filename = self.workspace_path("images", f"image_{idx}.png")
                 if not self.search_and_download_image(prompt, i_filename):
                      Image.new('RGB', (1920, 1080), (20,30,60)).save(i_filename)
 
+        self.run_scenes("Mixed Media", scenes, task, on_done)
+
+    def get_gcp_client(self):
+        # [수정] Google Cloud TTS / edge_tts 는 실제로 합성할 때만 import (캐시 히트 / 재실행 시 로딩 비용 없음)
+        # (v1beta1: v1 과 같은 서비스 + SSML mark 타임포인트 지원)
+        from google.cloud import texttospeech_v1beta1 as texttospeech
+        with self._gcp_lock:
+            if self._gcp_client is None:
+                self._gcp_client = texttospeech.TextToSpeechClient()
+            return self._gcp_client
+
     def try_gcp_tts(self, text, filename, voice_name="en-US-Neural2-F"):
         if not self.has_gcp: return False
         try:
-            client = texttospeech.TextToSpeechClient()
-            input_text = texttospeech.SynthesisInput(text=text)
+            from google.cloud import texttospeech_v1beta1 as texttospeech
+            client = self.get_gcp_client()
             voice = texttospeech.VoiceSelectionParams(language_code="en-US", name=voice_name)
-            audio_config = texttospeech.AudioConfig(audio_encoding=texttospeech.AudioEncoding.MP3, speaking_rate=1.1)
-            response = client.synthesize_speech(input=input_text, voice=voice, audio_config=audio_config)
+            audio_config = texttospeech.AudioConfig(audio_encoding=texttospeech.AudioEncoding.MP3, speaking_rate=self.GCP_SPEAKING_RATE)
+
+            # [NEW] 단어마다 SSML mark 를 넣어 자막 타이밍(timepoints)을 같이 받음 (SSML 5000 바이트 제한 초과 시 일반 텍스트)
+            tokens = text.split()
+            ssml = "<speak>" + " ".join(f'<mark name="{i}"/>{html.escape(w)}' for i, w in enumerate(tokens)) + "</speak>"
+            if len(ssml.encode('utf-8')) <= 5000:
+                request = texttospeech.SynthesizeSpeechRequest(
+                    input=texttospeech.SynthesisInput(ssml=ssml), voice=voice, audio_config=audio_config,
+                    enable_time_pointing=[texttospeech.SynthesizeSpeechRequest.TimepointType.SSML_MARK])
+            else:
+                request = texttospeech.SynthesizeSpeechRequest(input=texttospeech.SynthesisInput(text=text), voice=voice, audio_config=audio_config)
+            response = client.synthesize_speech(request=request)
             with open(filename, "wb") as out: out.write(response.audio_content)
-            if os.path.exists(filename) and os.path.getsize(filename) > 0: return True
+            if os.path.exists(filename) and os.path.getsize(filename) > 0:
+                marks = sorted((tp.time_seconds, int(tp.mark_name)) for tp in response.timepoints)
+                if marks:
+                    end = audio_duration(filename) or marks[-1][0]
+                    ends = [m[0] for m in marks[1:]] + [end]
+                    save_timing(filename, [(start, stop, tokens[i]) for (start, i), stop in zip(marks, ends)])
+                return True
         except Exception as e: print(f"   ⚠️ GCP TTS Failed: {e}")
         return False
 
@@ -172,12 +363,12 @@ class MediaAgent:
         for attempt in range(max_retries):
             key = Config.get_current_key()
             try:
-                url = f"https://generativelanguage.googleapis.com/v1beta/{Config.TTS_MODEL_NAME}:generateContent?key={key}"
+                url = f"{Config.GEMINI_API_BASE}/v1beta/{Config.TTS_MODEL_NAME}:generateContent?key={key}"
                 payload = {
                     "contents": [{"parts": [{"text": text}]}],
                     "generationConfig": {"responseModalities": ["AUDIO"],"speechConfig": {"voiceConfig": {"prebuiltVoiceConfig": {"voiceName": voice_name}}}}
                 }
-                response = requests.post(url, json=payload, timeout=10)
+                response = self.http.post(url, json=payload, timeout=10)
                 if response.status_code == 200:
                     data = response.json()['candidates'][0]['content']['parts'][0]['inlineData']['data']
                     with open(filename, "wb") as f: f.write(base64.b64decode(data))
@@ -188,33 +379,129 @@ class MediaAgent:
 
     async def try_edge_tts(self, text, filename, voice_name):
         try:
-            communicate = edge_tts.Communicate(text, voice_name, rate="+10%")
-            await communicate.save(filename)
+            import edge_tts
+            # [수정] save() 대신 stream() 으로 받아서 단어 경계(WordBoundary) 이벤트도 함께 저장
+            try: communicate = edge_tts.Communicate(text, voice_name, rate=self.EDGE_RATE, boundary="WordBoundary")
+            except TypeError: communicate = edge_tts.Communicate(text, voice_name, rate=self.EDGE_RATE)  # 구버전 (기본값이 WordBoundary)
+            words = []
+            with open(filename, "wb") as f:
+                async for chunk in communicate.stream():
+                    if chunk["type"] == "audio": f.write(chunk["data"])
+                    elif chunk["type"] in ("WordBoundary", "SentenceBoundary"):
+                        start = chunk["offset"] / 1e7  # 100ns 단위
+                        end = start + chunk["duration"] / 1e7
+                        if chunk["type"] == "WordBoundary": words.append((start, end, chunk["text"]))
+                        else: words += split_boundary(start, end, chunk["text"])
+            if words: save_timing(filename, words)
             return True
         except: return False
 
-    def get_audio(self, data, gender="female", tone="2"):
-        gcp_voice = "en-US-Neural2-F" if gender == "female" else "en-US-Neural2-D" 
-        gemini_voice = self.GEMINI_VOICES.get(gender).get(tone, "Kore")
-        edge_voice = self.EDGE_VOICES.get(gender).get(tone, "en-US-JennyNeural")
-        
-        print(f"🎙️ [Media] Audio Strategy: 1.GCP -> 2.Gemini -> 3.Edge")
+    # =========================================================================
+    # [NEW] TTS 캐시 (재시도 / 반복되는 인트로·아웃트로 문장 재사용)
+    # =========================================================================
+    def tts_key(self, text, voice_name, provider, rate):
+        norm_text = " ".join(text.split())
+        digest = hashlib.sha256(norm_text.encode('utf-8')).hexdigest()
+        return f"tts:{provider}:{voice_name}:{rate}:{digest}"
+
+    def load_cached_tts(self, text, filename, variant):
+        """
+        variant: (provider, voice, rate) - 폴백 체인이 지금 시도하는 프로바이더의 캐시만 확인
+        [수정] 하위 프로바이더 캐시를 먼저 보면 GCP 가 한 번 실패했을 때 캐시된 Edge/Gemini 음성이 계속 쓰임
+        """
+        if not self.tts_cache: return False
+        provider, voice_name, rate = variant
+        key = self.tts_key(text, voice_name, provider, rate)
+        if not self.tts_cache.copy_to(key, filename): return False
+        duration = self.tts_cache.get_meta(key).get("duration")
+        if duration:
+            self.audio_durations[filename] = duration
+            DURATIONS.put(filename, duration)
+        words = self.tts_cache.get_json(f"timing:{key}")
+        if words: save_timing(filename, words)
+        print(f"   ♻️ [Audio] Cache Hit ({provider}): {filename}")
+        return True
 
+    def store_cached_tts(self, text, filename, provider, voice_name, rate):
+        duration = audio_duration(filename)
+        if duration: self.audio_durations[filename] = duration
+        if not self.tts_cache or not os.path.exists(filename): return
+        with open(filename, 'rb') as f: data = f.read()
+        key = self.tts_key(text, voice_name, provider, rate)
+        self.tts_cache.put(key, data, meta={"duration": duration})
+        # [NEW] 단어 타이밍은 별도 항목으로 (인덱스를 가볍게 유지)
+        words = load_timing(filename)
+        if words: self.tts_cache.put_json(f"timing:{key}", words)
+
+    def narration_jobs(self, data):
+        """[NEW] 합성할 내레이션 목록 [(text, filename)] - 인트로 -> 장면 -> 아웃트로 순서"""
         intro_txt = data.get('intro_narration', "").replace("*", "")
         outro_txt = data.get('outro_narration', "").replace("*", "")
         scenes = data['script']['scenes']
 
+        jobs = []
+        if intro_txt: jobs.append((intro_txt, self.workspace_path("audio", "intro.mp3")))
+        for i, scene in enumerate(scenes):
+            clean_narration = scene['narration'].replace("*", "")
+            jobs.append((clean_narration, self.workspace_path("audio", f"audio_{i+1}.mp3")))
+        if outro_txt: jobs.append((outro_txt, self.workspace_path("audio", "outro.mp3")))
+        return jobs
+
+    def get_audio(self, data, gender="female", tone="2", on_done=None):
+        print(f"🎙️ [Media] Audio Strategy: 1.GCP -> 2.Gemini -> 3.Edge")
+        self.synthesize_batch(self.narration_jobs(data), gender=gender, tone=tone, on_done=on_done)
+
+    def synthesize_batch(self, jobs, gender="female", tone="2", on_done=None):
+        """
+        [NEW] 대본의 모든 내레이션 블록 [(text, filename)] 을 한 번에 제출해서 합성합니다.
+        on_done(filename) 은 클립 하나가 끝나는 즉시 호출됩니다.
+        """
+        gcp_voice = "en-US-Neural2-F" if gender == "female" else "en-US-Neural2-D" 
+        gemini_voice = self.GEMINI_VOICES.get(gender).get(tone, "Kore")
+        edge_voice = self.EDGE_VOICES.get(gender).get(tone, "en-US-JennyNeural")
+        variants = [
+            ("gcp", gcp_voice, str(self.GCP_SPEAKING_RATE)),
+            ("gemini", gemini_voice, "default"),
+            ("edge", edge_voice, self.EDGE_RATE),
+        ]
+
         async def _run():
-            async def generate_final(text, filename):
-                if not text: return
-                if self.try_gcp_tts(text, filename, gcp_voice): return
-                if self.try_gemini_tts(text, filename, gemini_voice): return
-                await self.try_edge_tts(text, filename, edge_voice)
-
-            if intro_txt: await generate_final(intro_txt, "audio/intro.mp3")
-            for i, scene in enumerate(scenes):
-                clean_narration = scene['narration'].replace("*", "")
-                await generate_final(clean_narration, f"audio/audio_{i+1}.mp3")
-            if outro_txt: await generate_final(outro_txt, "audio/outro.mp3")
-
-        asyncio.run(_run())
\ No newline at end of file
+            # [NEW] 클립 단위 동시 합성: 블로킹 프로바이더는 스레드 풀로, 프로바이더별 세마포어로 제한
+            loop = asyncio.get_running_loop()
+            limits = {
+                "gcp": asyncio.Semaphore(Config.TTS_GCP_CONCURRENCY),
+                "gemini": asyncio.Semaphore(Config.TTS_GEMINI_CONCURRENCY),
+                "edge": asyncio.Semaphore(Config.TTS_EDGE_CONCURRENCY),
+            }
+            workers = Config.TTS_GCP_CONCURRENCY + Config.TTS_GEMINI_CONCURRENCY
+
+            with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+                synthesize = {
+                    "gcp": lambda text, filename: loop.run_in_executor(executor, self.try_gcp_tts, text, filename, gcp_voice),
+                    "gemini": lambda text, filename: loop.run_in_executor(executor, self.try_gemini_tts, text, filename, gemini_voice),
+                    "edge": lambda text, filename: self.try_edge_tts(text, filename, edge_voice),
+                }
+
+                async def generate_final(text, filename):
+                    if not text: return
+                    # 이전 시도의 타이밍 파일이 남아 있으면 다른 프로바이더 결과와 어긋나므로 먼저 제거
+                    clear_timing(filename)
+                    # 클립마다 GCP -> Gemini -> Edge 순서는 그대로 유지.
+                    # 각 단계에서 그 프로바이더의 캐시 -> 합성 순으로 시도하고, 합성이 실패했을 때만 다음 프로바이더(캐시 포함)로 넘어감
+                    for variant in variants:
+                        provider = variant[0]
+                        if self.load_cached_tts(text, filename, variant): return
+                        async with limits[provider]:
+                            if await synthesize[provider](text, filename):
+                                return self.store_cached_tts(text, filename, *variant)
+
+                async def generate_and_notify(text, filename):
+                    await generate_final(text, filename)
+                    if on_done: on_done(filename)
+
+                started = time.perf_counter()
+                await asyncio.gather(*(generate_and_notify(text, filename) for text, filename in jobs))
+                print(f"   ⏱️ [Media] Audio: {len(jobs)} clips in {time.perf_counter() - started:.1f}s")
+                if self.tts_cache: self.tts_cache.report()
+
+        asyncio.run(_run())
@@ -6,8 +6,6 @@ import time
 import random
 from datetime import datetime
 from config import Config
-# [필수] Playwright 라이브러리 (pip install playwright && playwright install)
-from playwright.sync_api import sync_playwright
 
 class NewsAgent:
     def __init__(self):
@@ -148,6 +146,9 @@ class NewsAgent:
         print(f"🔗 [News] Deep Analyzing with VISIBLE Browser: {url}")
         
         try:
+            # [수정] Playwright 는 URL 모드에서만 필요하므로 여기서 import (RSS 일일 뉴스 실행은 로딩 비용 없음)
+            # (pip install playwright && playwright install)
+            from playwright.sync_api import sync_playwright
             with sync_playwright() as p:
                 # headless=False: 브라우저 창을 실제로 띄웁니다.
                 browser = p.chromium.launch(headless=False)
@@ -0,0 +1,331 @@
+import gc
+import bisect
+import threading
+from collections import OrderedDict
+import numpy as np
+from PIL import Image
+if not hasattr(Image, 'ANTIALIAS'): Image.ANTIALIAS = Image.LANCZOS
+from moviepy.video.VideoClip import VideoClip
+from moviepy.video.io.ffmpeg_reader import FFMPEG_VideoReader, ffmpeg_parse_infos
+from moviepy.video.fx.resize import resize
+from moviepy.video.fx.crop import crop
+from moviepy.video.fx.loop import loop
+
+# [NEW] moviepy.editor 를 import 하지 않으므로 (전체 fx / 미리보기 로딩으로 시작이 느림)
+# 에디터들이 메서드로 쓰는 fx 만 VideoClip 에 직접 등록합니다.
+for _fx in (resize, crop, loop):
+    if not hasattr(VideoClip, _fx.__name__): setattr(VideoClip, _fx.__name__, _fx)
+
+# =========================================================================
+# [NEW] 정적 레이어 사전 합성 (Pre-composited Static Overlay)
+# - 장면 안에서 움직이지 않는 요소(검은 레터박스, 타이틀 박스, 로고, 자막 페이지)를
+#   자막 페이지마다 한 장의 스프라이트로 미리 합성해 두고,
+#   매 프레임에는 움직이는 줌 영역만 블렌딩합니다.
+# =========================================================================
+
+class StaticOverlay:
+    def __init__(self, rgba, box=None):
+        """
+        rgba: (H, W, 4) uint8 오버레이 캔버스 (타이틀 + 로고 + 자막)
+        box: (y0, y1) 줌 이미지가 들어가는 행 범위 (없으면 None)
+        """
+        alpha = rgba[:, :, 3:4].astype(np.float32) / 255.0
+        premult = rgba[:, :, :3].astype(np.float32) * alpha
+
+        # 검은 배경 위에 오버레이를 합성한 결과 = premultiplied RGB
+        self.frame = np.round(premult).astype(np.uint8)
+        self.box = box
+        self.blend_rows = None
+
+        if box is not None:
+            y0, y1 = box
+            # 줌 영역 안에서 실제로 알파가 있는 행만 블렌딩 대상으로 저장
+            rows = np.nonzero(alpha[y0:y1, :, 0].any(axis=1))[0]
+            if len(rows):
+                r0, r1 = y0 + int(rows[0]), y0 + int(rows[-1]) + 1
+                self.blend_rows = (r0, r1)
+                self.blend_premult = premult[r0:r1]
+                self.blend_inv_alpha = 1.0 - alpha[r0:r1]
+                self.scratch = np.empty_like(self.blend_premult)
+
+    def compose(self, region, out=None):
+        """
+        region: 줌 영역 프레임 (y1-y0, W, 3) uint8
+        out: 미리 할당된 (H, W, 3) uint8 버퍼 (주면 새 배열을 만들지 않고 그 안에 합성)
+        """
+        if out is None: frame = self.frame.copy()
+        else:
+            frame = out
+            np.copyto(frame, self.frame)
+        if self.box is None or region is None: return frame
+
+        y0, y1 = self.box
+        frame[y0:y1] = region
+        if self.blend_rows:
+            r0, r1 = self.blend_rows
+            np.multiply(region[r0 - y0:r1 - y0], self.blend_inv_alpha, out=self.scratch)
+            np.add(self.scratch, self.blend_premult, out=self.scratch)
+            frame[r0:r1] = self.scratch
+        return frame
+
+
+class SpriteOverlay:
+    """
+    [NEW] 글자/로고 영역만큼 잘라낸 오버레이 + 화면 좌표 (좌상단 x, y).
+    전체 크기 RGBA 캔버스 대신 스프라이트가 덮는 행/열만 블렌딩합니다.
+    """
+    def __init__(self, rgba, x, y):
+        alpha = rgba[:, :, 3:4].astype(np.float32) / 255.0
+        self.premult = rgba[:, :, :3].astype(np.float32) * alpha
+        self.inv_alpha = 1.0 - alpha
+        self.x, self.y = int(x), int(y)
+        self.h, self.w = rgba.shape[:2]
+
+    @property
+    def nbytes(self):
+        return self.premult.nbytes + self.inv_alpha.nbytes
+
+    def blend(self, frame):
+        """frame (H, W, 3) uint8 을 제자리에서 수정 (화면 밖으로 나간 부분은 잘라냄)"""
+        H, W = frame.shape[:2]
+        x0, y0 = max(0, self.x), max(0, self.y)
+        x1, y1 = min(W, self.x + self.w), min(H, self.y + self.h)
+        if x0 >= x1 or y0 >= y1: return frame
+        sx, sy = x0 - self.x, y0 - self.y
+        region = frame[y0:y1, x0:x1].astype(np.float32)
+        premult = self.premult[sy:sy + y1 - y0, sx:sx + x1 - x0]
+        inv_alpha = self.inv_alpha[sy:sy + y1 - y0, sx:sx + x1 - x0]
+        frame[y0:y1, x0:x1] = (premult + region * inv_alpha).astype(np.uint8)
+        return frame
+
+def with_sprites(clip, sprites):
+    """[NEW] CompositeVideoClip 없이 클립 프레임 위에 스프라이트를 합성 (길이/오디오 유지)"""
+    def blend(get_frame, t):
+        frame = np.array(get_frame(t), dtype=np.uint8)  # 리더가 캐시한 프레임을 건드리지 않도록 복사
+        for sprite in sprites: sprite.blend(frame)
+        return frame
+    return clip.fl(blend)
+
+
+# =========================================================================
+# [NEW] Ken Burns 줌 엔진 (editor.py / editor_long.py 공용)
+# - 기존 resize(lambda t) 는 매 프레임 원본 전체를 LANCZOS 로 다시 리사이즈했습니다.
+# - 원본을 한 번만 확대(최대 ZOOM_SUPERSAMPLE_CAP 배)해 두고,
+#   매 프레임은 보이는 영역만 잘라서(box) 바이리니어로 출력 크기에 맞춥니다 (PIL C 구현).
+# =========================================================================
+
+# 사전 확대 배율 상한 (그 이상의 줌은 바이리니어 업샘플링으로 처리 - 메모리 보호)
+ZOOM_SUPERSAMPLE_CAP = 1.5
+
+class KenBurnsZoom:
+    def __init__(self, img, duration, rate=0.04):
+        """
+        img: PIL 이미지 또는 (h, w, 3) ndarray - 출력 프레임 크기 = 원본 크기
+        duration: 최대 줌 배율(1 + rate * duration) 계산용
+        """
+        if isinstance(img, np.ndarray): img = Image.fromarray(img)
+        self.w, self.h = img.size
+        self.rate = rate
+
+        max_scale = 1.0 + rate * max(0.0, duration)
+        self.pre_scale = max(1.0, min(max_scale, ZOOM_SUPERSAMPLE_CAP))
+        if self.pre_scale > 1.0:
+            size = (int(round(self.w * self.pre_scale)), int(round(self.h * self.pre_scale)))
+            img = img.resize(size, Image.LANCZOS)
+        self.src = img.convert("RGB")
+        self.src.load()
+
+    def __call__(self, t):
+        scale = 1.0 + self.rate * t
+        # 사전 확대된 원본 위에서 잘라낼 중앙 영역 (실수 좌표 그대로 - 서브픽셀 단위로 부드럽게 줌)
+        crop_w = min(self.src.width, self.w * self.pre_scale / scale)
+        crop_h = min(self.src.height, self.h * self.pre_scale / scale)
+        cx, cy = self.src.width / 2.0, self.src.height / 2.0
+        box = (cx - crop_w / 2, cy - crop_h / 2, cx + crop_w / 2, cy + crop_h / 2)
+        return np.asarray(self.src.resize((self.w, self.h), Image.BILINEAR, box=box))
+
+
+class KenBurnsClip(VideoClip):
+    """[NEW] 고정 크기 줌 클립 (set_position/CompositeVideoClip 없이 바로 사용)"""
+    def __init__(self, img, duration, rate=0.04):
+        self.zoom = KenBurnsZoom(img, duration, rate)
+        VideoClip.__init__(self, lambda t: self.zoom(t), duration=duration)
+
+
+class ShortsSceneClip(VideoClip):
+    """
+    [NEW] 자막 페이지별 정적 스프라이트 + 줌 영역 하나로 구성된 장면 클립.
+    CompositeVideoClip 중첩 없이 프레임당 한 번만 블렌딩합니다.
+    """
+    def __init__(self, overlays, starts, duration, zoom=None):
+        self.overlays = overlays
+        self.starts = starts
+        self.zoom = zoom
+
+        def make_frame(t):
+            overlay = self.overlay_at(t)
+            if self.zoom is None: return overlay.frame
+            return overlay.compose(self.zoom(t))
+
+        VideoClip.__init__(self, make_frame, duration=duration)
+
+    def overlay_at(self, t):
+        page = max(0, bisect.bisect_right(self.starts, t) - 1)
+        return self.overlays[min(page, len(self.overlays) - 1)]
+
+    def render_into(self, t, out):
+        """[NEW] 직접 렌더러용: 미리 할당된 프레임 버퍼에 합성 (moviepy get_frame 경로 우회)"""
+        overlay = self.overlay_at(t)
+        if self.zoom is None: np.copyto(out, overlay.frame)
+        else: overlay.compose(self.zoom(t), out=out)
+        return out
+
+
+class PagedSpriteClip(VideoClip):
+    """
+    [NEW] 자막 페이지 스프라이트 트랙: 시간 게이트가 걸린 오버레이 여러 개 대신
+    bisect 로 현재 페이지 하나만 골라 반환합니다 (페이지 시작은 프레임 경계로 맞춘 값).
+    sprites: (h, w, 4) uint8 RGBA 목록 - 크기가 다르면 위쪽 기준으로 투명 패딩
+    positions: 스프라이트별 화면 좌표 (좌상단). 주면 전체를 감싸는 박스로 맞추고 좌상단을 self.origin 에 기록
+    """
+    def __init__(self, sprites, starts, duration, positions=None):
+        if positions is None:
+            w = max(s.shape[1] for s in sprites)
+            positions = [((w - s.shape[1]) // 2, 0) for s in sprites]
+        x0 = min(x for x, _ in positions); y0 = min(y for _, y in positions)
+        w = max(x + s.shape[1] for s, (x, _) in zip(sprites, positions)) - x0
+        h = max(y + s.shape[0] for s, (_, y) in zip(sprites, positions)) - y0
+        padded = []
+        for s, (x, y) in zip(sprites, positions):
+            canvas = np.zeros((h, w, 4), dtype=np.uint8)
+            canvas[y - y0:y - y0 + s.shape[0], x - x0:x - x0 + s.shape[1]] = s
+            padded.append(canvas)
+        self.origin = (x0, y0)
+        self.rgb = [np.ascontiguousarray(p[:, :, :3]) for p in padded]
+        self.alpha = [p[:, :, 3].astype(np.float32) / 255.0 for p in padded]
+        self.starts = starts
+
+        VideoClip.__init__(self, lambda t: self.rgb[self.page(t)], duration=duration)
+        self.mask = VideoClip(lambda t: self.alpha[self.page(t)], ismask=True, duration=duration)
+
+    def page(self, t):
+        return min(len(self.rgb) - 1, max(0, bisect.bisect_right(self.starts, t) - 1))
+
+
+# =========================================================================
+# [NEW] 배경 영상 지연 디코딩 (롱폼)
+# - VideoFileClip 은 만들자마자 ffmpeg 프로세스를 띄우고 렌더가 끝날 때까지 열어 둡니다.
+# - LazyVideoClip 은 정보(크기/길이)만 읽어 두고, 첫 프레임 요청 때 DecoderPool 에서 디코더를 엽니다.
+# - DecoderPool 은 열린 디코더 수를 제한(LRU)하고, 장면 인코딩이 끝나면 close_all() 로 정리합니다.
+# =========================================================================
+
+class DecoderPool:
+    def __init__(self, max_open=2):
+        self.max_open = max(1, max_open)
+        self.readers = OrderedDict()
+        self.lock = threading.Lock()
+
+    def reader(self, path):
+        with self.lock:
+            if path in self.readers:
+                self.readers.move_to_end(path)
+                return self.readers[path]
+            while len(self.readers) >= self.max_open:
+                _, oldest = self.readers.popitem(last=False)
+                oldest.close()
+            reader = FFMPEG_VideoReader(path)
+            self.readers[path] = reader
+            return reader
+
+    def release(self, path):
+        with self.lock: reader = self.readers.pop(path, None)
+        if reader: reader.close()
+
+    def close_all(self):
+        with self.lock:
+            readers = list(self.readers.values())
+            self.readers.clear()
+        for reader in readers: reader.close()
+
+    def __len__(self):
+        return len(self.readers)
+
+
+class LazyVideoClip(VideoClip):
+    """
+    [NEW] 배경 영상 클립 (오디오 없음). loop=True 면 원본 길이로 반복, False 면 마지막 프레임에서 정지.
+    vfx.loop / 정지 프레임 concatenate 대신 시간만 변환해서 디코더에 요청합니다.
+    """
+    def __init__(self, path, duration, pool, loop=True):
+        infos = ffmpeg_parse_infos(path)
+        self.path = path
+        self.pool = pool
+        self.src_duration = infos['video_duration']
+        self.loop = loop
+
+        # [수정] make_frame 을 생성자에 넘기면 moviepy 가 크기를 알기 위해 get_frame(0) 을 호출 -> 디코더가 바로 열림
+        # 크기는 이미 알고 있으므로 make_frame 없이 만든 뒤 직접 지정
+        VideoClip.__init__(self, duration=duration)
+        self.make_frame = self.read_frame
+        self.size = tuple(infos['video_size'])
+        self.fps = infos['video_fps']
+
+    def read_frame(self, t):
+        if self.loop: t = t % self.src_duration
+        else: t = min(t, max(0, self.src_duration - 0.1))
+        return self.pool.reader(self.path).get_frame(t)
+
+    def close(self):
+        self.pool.release(self.path)
+
+
+
+# =========================================================================
+# [NEW] 지연 타임라인 (롱폼 단일 패스)
+# - concatenate_videoclips 는 모든 장면 클립(이미지 배열 / 디코더 / 자막 스프라이트)을 렌더가 끝날 때까지 들고 있습니다.
+# - LazyTimeline 은 장면 길이만 미리 알고, 해당 시간 구간의 첫 프레임을 그릴 때 장면을 만들고
+#   다음 장면으로 넘어가면 바로 해제합니다 -> 메모리는 장면 수와 관계없이 장면 1개 분량.
+# - 모든 장면은 size 크기의 불투명 클립이어야 함 (concatenate "compose" 와 같은 결과)
+# =========================================================================
+
+class LazyTimeline(VideoClip):
+    """
+    entries: [(duration, key)] - 순서대로 이어붙일 장면, build(key) -> clip
+    release(clip): 장면을 내릴 때 호출 (배경 디코더 정리 등, 선택)
+    """
+    def __init__(self, entries, build, size, release=None):
+        self.keys = [key for _, key in entries]
+        self.starts = [0.0]
+        for duration, _ in entries: self.starts.append(self.starts[-1] + duration)
+        self.build = build
+        self.release = release
+        self.current = None
+        self.scene = None
+
+        # make_frame 을 생성자에 넘기면 get_frame(0) 으로 첫 장면이 바로 만들어지므로 직접 지정
+        VideoClip.__init__(self, duration=self.starts[-1])
+        self.make_frame = self.render_frame
+        self.size = tuple(size)
+
+    def scene_index(self, t):
+        return min(len(self.keys) - 1, max(0, bisect.bisect_right(self.starts, t) - 1))
+
+    def render_frame(self, t):
+        n = self.scene_index(t)
+        if n != self.current:
+            self.unload()
+            self.scene = self.build(self.keys[n])
+            self.current = n
+        return self.scene.get_frame(t - self.starts[n])
+
+    def unload(self):
+        if self.scene is None: return
+        if self.release: self.release(self.scene)
+        self.scene.close()
+        self.scene, self.current = None, None
+        # 클립은 make_frame 바운드 메서드로 자기 자신을 참조(순환)하므로 참조를 끊어도 바로 해제되지 않음
+        # -> 순환 GC 는 객체 수 기준이라 큰 배열이 장면마다 쌓이지 않도록 여기서 수거
+        gc.collect()
+
+    def close(self):
+        self.unload()
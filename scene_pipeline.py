@@ -0,0 +1,49 @@
+import threading
+
+# ==============================================================================
+# 🔀 SCENE PIPELINE (장면별 자산 준비 상태 추적)
+# - 장면마다 필요한 자산(audio, visual)이 모두 도착하면 on_ready(n) 를 한 번만 호출합니다.
+# - 미디어 다운로드가 진행되는 동안 준비된 장면부터 인코딩을 시작하는 데 사용됩니다.
+# ==============================================================================
+
+class SceneGate:
+    def __init__(self, requirements, on_ready):
+        """requirements: {n: {"audio", "visual", ...}}"""
+        self.waiting = {n: set(parts) for n, parts in requirements.items()}
+        self.on_ready = on_ready
+        self.lock = threading.Lock()
+
+    def mark(self, n, part):
+        with self.lock:
+            parts = self.waiting.get(n)
+            if parts is None: return
+            parts.discard(part)
+            if parts: return
+            del self.waiting[n]
+        # 콜백은 락 밖에서 호출 (인코딩 제출이 느려도 다른 장면 신호를 막지 않음)
+        try: self.on_ready(n)
+        except Exception as e: print(f"   ⚠️ [Pipeline] Scene {n} could not start: {e}")
+
+    def mark_all(self, part):
+        """단계 전체가 끝났거나 체크포인트로 건너뛴 경우"""
+        with self.lock: pending = list(self.waiting)
+        for n in pending: self.mark(n, part)
+
+def long_form_gate(specs, on_ready):
+    """
+    EditorLong 장면 목록으로 게이트 구성.
+    반환: (gate, on_audio(filename), on_visual(idx)) - MediaAgent 의 on_done 콜백으로 그대로 전달
+    """
+    # 인트로/아웃트로(loop_video=False)는 오디오만, 본문 장면은 오디오 + 비주얼 필요
+    requirements = {n: {"audio", "visual"} if spec[4] else {"audio"} for n, spec in enumerate(specs)}
+    by_audio = {spec[2]: n for n, spec in enumerate(specs)}
+    by_scene = {spec[0]: n for n, spec in enumerate(specs) if spec[4]}
+    gate = SceneGate(requirements, on_ready)
+
+    def on_audio(filename):
+        if filename in by_audio: gate.mark(by_audio[filename], "audio")
+
+    def on_visual(idx):
+        if idx in by_scene: gate.mark(by_scene[idx], "visual")
+
+    return gate, on_audio, on_visual
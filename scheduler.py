@@ -4,7 +4,12 @@ import schedule
 import subprocess
 import json
 import random
-from datetime import datetime
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from config import Config
+from worker_daemon import submit_job, DaemonTimeout
 
 # 업로더 모듈 가져오기
 try:
@@ -94,38 +99,168 @@ def load_json_metadata(json_path):
             print(f"      ⚠️ Error loading JSON: {e}")
     return {}
 
-def run_job(category):
+# ====================================================
+# 📋 Persistent Job Queue & Worker Pool
+# ====================================================
+
+class JobQueue:
+    """
+    [NEW] 디스크에 저장되는 작업 큐 (스케줄러가 재시작되어도 미완료 작업을 이어서 처리)
+    상태: queued -> rendering -> uploading -> done / failed / expired
+    """
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.RLock()
+        self.jobs = []
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f: self.jobs = json.load(f)
+            except Exception as e:
+                print(f"⚠️ Job queue unreadable, starting empty: {e}")
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        # 완료된 작업은 최근 200개만 보관
+        active = [j for j in self.jobs if j['status'] in ACTIVE_STATUSES]
+        finished = [j for j in self.jobs if j['status'] not in ACTIVE_STATUSES][-200:]
+        self.jobs = finished + active
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f: json.dump(self.jobs, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def add(self, job):
+        with self.lock:
+            self.jobs.append(job)
+            self._save()
+
+    def update(self, job, **changes):
+        with self.lock:
+            job.update(changes)
+            self._save()
+
+    def pending(self):
+        with self.lock:
+            return [j for j in self.jobs if j['status'] in ACTIVE_STATUSES]
+
+ACTIVE_STATUSES = ("queued", "rendering", "uploading")
+
+JOB_QUEUE = JobQueue(os.path.join(BASE_DIR, Config.RUNS_DIR, "scheduler_queue.json"))
+JOB_POOL = ThreadPoolExecutor(max_workers=Config.SCHED_MAX_JOBS)
+
+# CPU 를 쓰는 렌더링 단계와 네트워크 업로드 단계의 동시 실행 수를 따로 제한
+RENDER_SLOTS = threading.BoundedSemaphore(Config.SCHED_RENDER_SLOTS)
+UPLOAD_SLOTS = threading.BoundedSemaphore(Config.SCHED_UPLOAD_SLOTS)
+# 브라우저 프로필을 공유하는 업로더는 플랫폼별로 한 번에 하나씩
+PLATFORM_LOCKS = {"youtube": threading.Lock(), "x": threading.Lock(), "threads": threading.Lock()}
+
+def enqueue_job(category):
     """
-    스케줄러 잡 실행 함수
+    스케줄 슬롯에서 호출: 작업을 큐에 넣고 즉시 반환 (다음 슬롯이 밀리지 않도록)
     """
+    now = datetime.now()
     # 1. 작업 ID(Timestamp) 생성 - 스케줄러가 주도권을 가짐 (Timestamp Injection)
-    timestamp = datetime.now().strftime("%m%d%Y_%H%M")
-    
+    timestamp = now.strftime("%m%d%Y_%H%M")
     gender, tone = get_voice_settings(category)
+    job = {
+        "id": f"{category}_{timestamp}",
+        "category": category,
+        "timestamp": timestamp,
+        "gender": gender,
+        "tone": tone,
+        "status": "queued",
+        "enqueued_at": now.isoformat(),
+        # 이 시각까지 시작하지 못한 작업은 건너뜀 (뒤늦은 뉴스 업로드 방지)
+        "start_deadline": (now + timedelta(minutes=Config.SCHED_START_DEADLINE_MIN)).isoformat(),
+    }
+    JOB_QUEUE.add(job)
+    print(f"\n📥 [{now.strftime('%H:%M')}] Queued Job: {job['id']} (Voice: {gender.upper()}/{tone})")
+    JOB_POOL.submit(process_job, job)
+
+def expire_if_late(job):
+    """시작 기한이 지났으면 expired 로 기록하고 True"""
+    if datetime.now() <= datetime.fromisoformat(job['start_deadline']): return False
+    print(f"⏰ Job {job['id']} missed its start deadline. Skipping.")
+    JOB_QUEUE.update(job, status="expired")
+    return True
+
+def process_job(job):
+    try:
+        if job['status'] in ("queued", "rendering"):
+            if expire_if_late(job): return
+            with RENDER_SLOTS:
+                # [수정] 렌더 슬롯을 기다리는 동안 기한이 지났을 수 있으므로 슬롯을 얻은 뒤 다시 확인
+                if expire_if_late(job): return
+                JOB_QUEUE.update(job, status="rendering", render_started_at=datetime.now().isoformat())
+                if not render_phase(job):
+                    JOB_QUEUE.update(job, status="failed")
+                    return
+
+        with UPLOAD_SLOTS:
+            JOB_QUEUE.update(job, status="uploading")
+            upload_phase(job)
+        JOB_QUEUE.update(job, status="done", finished_at=datetime.now().isoformat())
+        print(f"✨ Job Finished for {job['category']}. ({job['id']})\n")
+    except Exception as e:
+        print(f"❌ Job {job['id']} crashed: {e}")
+        JOB_QUEUE.update(job, status="failed", error=str(e))
+
+def render_phase(job):
+    category, timestamp = job['category'], job['timestamp']
     current_time = datetime.now().strftime('%H:%M')
     
     print(f"\n🎬 [{current_time}] Starting Job: Category='{category}' (ID: {timestamp})")
-    print(f"   🎙️ Voice Director: Gender='{gender.upper()}', Tone='{tone}'")
+    print(f"   🎙️ Voice Director: Gender='{job['gender'].upper()}', Tone='{job['tone']}'")
+
+    # 2. 영상 생성 요청 (timestamp 전달 - 같은 timestamp 로 재실행하면 체크포인트에서 이어서 진행)
+    if not generate_video(job): return False
+
+    # 3. [수정됨] 정확한 파일명으로 가져오기 (JSON 포함)
+    video_path, _, _ = get_exact_files(category, timestamp)
+    if not video_path:
+        print(f"❌ Aborting upload. Job failed for {category}.")
+        return False
+    return True
+
+def generate_video(job):
+    """
+    [NEW] 상주 워커 데몬이 떠 있으면 소켓으로 작업 전달 (워밍업된 에이전트 재사용),
+    아니면 기존처럼 main.py 를 새 프로세스로 실행합니다.
+    """
+    timeout = Config.SCHED_RENDER_TIMEOUT_MIN * 60
+    if Config.SCHED_USE_DAEMON:
+        try:
+            result = submit_job({"category": job['category'], "gender": job['gender'], "tone": job['tone'],
+                                 "timestamp": job['timestamp'], "job_id": job['id']}, timeout=timeout)
+            if result.get("status") == "done": return True
+            print(f"❌ Generation Failed in daemon: {result.get('error', 'no video produced')}")
+            return False
+        except DaemonTimeout as e:
+            # 데몬 대기열에 작업이 남아 있을 수 있으므로 subprocess 로 다시 돌리지 않고 실패 처리
+            print(f"❌ Generation timed out in daemon: {e}")
+            return False
+        except (OSError, EOFError, multiprocessing.AuthenticationError) as e:
+            # 데몬 없음 / 키 불일치 / 연결 끊김 -> 기존 경로
+            print(f"⚠️ Worker daemon unavailable ({e!r}). Falling back to subprocess.")
 
-    # 2. 영상 생성 요청 (timestamp 전달)
     try:
         subprocess.run([
             "python", "main.py", 
-            "--category", category, 
-            "--gender", gender, 
-            "--tone", tone,
-            "--timestamp", timestamp
-        ], check=True)
+            "--category", job['category'], 
+            "--gender", job['gender'], 
+            "--tone", job['tone'],
+            "--timestamp", job['timestamp']
+        ], check=True, timeout=timeout)
+        return True
+    except subprocess.TimeoutExpired:
+        print(f"❌ Generation Timed Out after {Config.SCHED_RENDER_TIMEOUT_MIN} min: {job['id']}")
     except Exception as e:
         print(f"❌ Generation Failed: {e}")
-        return
+    return False
 
-    # 3. [수정됨] 정확한 파일명으로 가져오기 (JSON 포함)
-    video_path, text_path, json_path = get_exact_files(category, timestamp)
-    
-    if not video_path:
-        print(f"❌ Aborting upload. Job failed for {category}.")
-        return
+def upload_phase(job):
+    category = job['category']
+    video_path, text_path, json_path = get_exact_files(category, job['timestamp'])
+    if not video_path: raise RuntimeError("Rendered video disappeared before upload.")
 
     # 4. [핵심 수정] JSON 데이터 로드 및 플랫폼별 내용 분배
     meta_data = load_json_metadata(json_path)
@@ -152,57 +287,64 @@ def run_job(category):
 
     # ==========================================
     # 🚀 [업로드 순서] YouTube -> X -> Threads
+    # (이미 올라간 플랫폼은 재시작 시 건너뜀)
     # ==========================================
-    
-    # 1. YouTube
-    print("   🚀 [1/3] Uploading to YouTube...")
-    youtube_upload(video_path, category=category, title=yt_title, description=yt_desc)
+    uploaded = set(job.get('uploaded', []))
+    steps = [
+        ("youtube", "[1/3] Uploading to YouTube...", lambda: youtube_upload(video_path, category=category, title=yt_title, description=yt_desc)),
+        ("x", "[2/3] Uploading to X...", lambda: x_upload(video_path, text=x_text)),
+        ("threads", "[3/3] Uploading to Threads...", lambda: (time.sleep(5), threads_upload(video_path, text=threads_text))),
+    ]
+    for platform, label, upload in steps:
+        if platform in uploaded: continue
+        print(f"   🚀 {label}")
+        with PLATFORM_LOCKS[platform]:
+            upload()
+        uploaded.add(platform)
+        JOB_QUEUE.update(job, uploaded=sorted(uploaded))
 
-    # 2. X (Twitter)
-    print("   🚀 [2/3] Uploading to X...")
-    x_upload(video_path, text=x_text)
-    
-    # 3. Threads
-    print("   🚀 [3/3] Uploading to Threads...")
-    time.sleep(5)
-    threads_upload(video_path, text=threads_text)
-    
-    print(f"✨ Job Finished for {category}.\n")
+def resume_pending_jobs():
+    """[NEW] 스케줄러 재시작 시 큐에 남아 있던 작업을 다시 워커 풀에 넣습니다."""
+    for job in JOB_QUEUE.pending():
+        print(f"🔁 Resuming queued job: {job['id']} ({job['status']})")
+        JOB_POOL.submit(process_job, job)
 
 # ====================================================
 # ⏳ 24-Hour Schedule Configuration
 # ====================================================
 
 # 1. 🌍 U.S. & World News (2회)
-schedule.every().day.at("07:00").do(run_job, category="world") 
-schedule.every().day.at("17:00").do(run_job, category="world") 
+schedule.every().day.at("07:00").do(enqueue_job, category="world") 
+schedule.every().day.at("17:00").do(enqueue_job, category="world") 
 
 # 2. 💻 Tech & Science News (2회 - 남/녀 교대)
-schedule.every().day.at("09:00").do(run_job, category="tech")
-schedule.every().day.at("21:00").do(run_job, category="tech")
+schedule.every().day.at("09:00").do(enqueue_job, category="tech")
+schedule.every().day.at("21:00").do(enqueue_job, category="tech")
 
 # 3. 💰 Finance News (2회 - 남/녀 교대)
-schedule.every().day.at("08:00").do(run_job, category="finance")
-schedule.every().day.at("20:00").do(run_job, category="finance")
+schedule.every().day.at("08:00").do(enqueue_job, category="finance")
+schedule.every().day.at("20:00").do(enqueue_job, category="finance")
 
 # 4. 🎨 Arts & Culture News (1회)
-schedule.every().day.at("14:00").do(run_job, category="art")
+schedule.every().day.at("14:00").do(enqueue_job, category="art")
 
 # 5. 🏆 Sports News (1회 - 점심시간으로 이동)
-schedule.every().day.at("12:00").do(run_job, category="sports")
+schedule.every().day.at("12:00").do(enqueue_job, category="sports")
 
 # 6. 🎬 Entertainment News (1회)
-schedule.every().day.at("19:00").do(run_job, category="ent")
+schedule.every().day.at("19:00").do(enqueue_job, category="ent")
 
 # 7. 🏥 Health News (2회 - 남/녀 교대)
-schedule.every().day.at("06:00").do(run_job, category="health")
-schedule.every().day.at("18:00").do(run_job, category="health")
+schedule.every().day.at("06:00").do(enqueue_job, category="health")
+schedule.every().day.at("18:00").do(enqueue_job, category="health")
 
 if __name__ == "__main__":
     print("🤖 Scheduler Started...")
     print("📅 24-Hour Smart News Cycle Initialized.")
     print("   Order: YouTube -> X -> Threads")
+    print(f"   Workers: {Config.SCHED_MAX_JOBS} jobs / {Config.SCHED_RENDER_SLOTS} render / {Config.SCHED_UPLOAD_SLOTS} upload")
     
+    resume_pending_jobs()
     while True:
         schedule.run_pending()
-        time.sleep(60)
\ No newline at end of file
+        time.sleep(10)
\ No newline at end of file
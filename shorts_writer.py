@@ -0,0 +1,59 @@
+import bisect
+import subprocess
+import numpy as np
+from ffmpeg_tools import ffmpeg_binary
+from encode_profiles import ffmpeg_video_args
+
+# ==============================================================================
+# 📼 DIRECT SHORTS WRITER (moviepy write_videofile 우회)
+# - 장면 클립 목록을 시간순으로 돌면서 미리 할당한 uint8 버퍼 하나에 프레임을 합성하고
+#   ffmpeg stdin 으로 raw RGB 를 바로 씁니다. (concatenate_videoclips 의 프레임별 클립 트리 재귀 없음)
+# - ShortsSceneClip 은 render_into() 로 버퍼에 직접 합성, 그 외 클립(인트로/아웃트로)은 get_frame 결과를 복사
+# - 오디오는 미리 조립된 사운드트랙(soundtrack.py, AAC)을 같은 ffmpeg 패스에서 stream copy 로 mux
+# ==============================================================================
+
+def render_frame(clip, t, out):
+    if hasattr(clip, "render_into"): return clip.render_into(t, out)
+    out[...] = clip.get_frame(t)
+    return out
+
+def write_shorts_direct(clips, audio_path, out_path, encode, size=(720, 1280)):
+    """
+    clips: 이어붙일 클립 목록 (모두 size 크기), audio_path: 조립된 사운드트랙 파일 (없으면 None)
+    encode: encode_params() 결과
+    """
+    W, H = size
+    for clip in clips:
+        if tuple(clip.size) != (W, H): raise ValueError(f"clip size {clip.size} != {size}")
+
+    fps = encode["fps"]
+    starts, total = [], 0.0
+    for clip in clips:
+        starts.append(total)
+        total += clip.duration
+
+    frame = np.empty((H, W, 3), dtype=np.uint8)
+    proc = None
+    try:
+        inputs = ["-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{W}x{H}", "-r", f"{fps:.02f}", "-i", "-"]
+        maps = ["-map", "0:v"]
+        if audio_path:
+            inputs += ["-i", audio_path]
+            maps += ["-map", "1:a", "-c:a", "copy"]
+
+        cmd = [ffmpeg_binary(), "-y", "-hide_banner", "-loglevel", "error"] + inputs + maps + ffmpeg_video_args(encode) + [out_path]
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+
+        for t in np.arange(0, total, 1.0 / fps):
+            n = min(len(clips) - 1, bisect.bisect_right(starts, t) - 1)
+            render_frame(clips[n], t - starts[n], frame)
+            proc.stdin.write(frame.data)
+
+        proc.stdin.close()
+        if proc.wait() != 0: raise RuntimeError(f"ffmpeg exited with code {proc.returncode}")
+        proc = None
+    finally:
+        if proc is not None:
+            proc.kill()
+            proc.wait()
+    return out_path
@@ -0,0 +1,74 @@
+import os
+from config import Config
+from ffmpeg_tools import run_ffmpeg
+
+# ==============================================================================
+# 🔊 SOUNDTRACK ASSEMBLY (영상 프레임 루프 밖에서 오디오를 한 번에 조립)
+# - 내레이션 MP3 를 장면 시작 시각에 배치 (장면 사이 쉼은 영상 길이에 이미 포함)
+# - BGM 은 무한 반복 후 길이에 맞춰 자르고, 내레이션이 나올 때 사이드체인으로 더킹
+# - 마지막에 라우드니스 정규화 (loudnorm, 1패스) 후 AAC 트랙 하나로 저장 -> 영상 인코더가 그대로 mux
+# ffmpeg 필터 그래프 한 번으로 처리하므로 moviepy 의 파이썬 청크 단위 오디오 평가가 없습니다.
+# ==============================================================================
+
+SOUNDTRACK_ENCODE = ["-c:a", "aac", "-b:a", "192k", "-ar", "44100", "-ac", "2"]
+
+def audio_format(label_in, label_out, extra=""):
+    return f"[{label_in}]aresample=44100,aformat=sample_fmts=fltp:channel_layouts=stereo{extra}[{label_out}]"
+
+def build_filter(placements, duration, bgm_index=None):
+    """placements: [(start_sec, input_index)] -> filter_complex 문자열 (출력 라벨 [aout])"""
+    graph, voices = [], []
+    for n, (start, index) in enumerate(placements):
+        ms = int(round(start * 1000))
+        graph.append(audio_format(f"{index}:a", f"v{n}", f",adelay={ms}|{ms}"))
+        voices.append(f"[v{n}]")
+
+    if len(voices) > 1:
+        graph.append(f"{''.join(voices)}amix=inputs={len(voices)}:duration=longest:dropout_transition=0:normalize=0[mixed]")
+        voice = "mixed"
+    else:
+        voice = voices[0][1:-1]
+    graph.append(f"[{voice}]apad,atrim=0:{duration:.3f}[voice]")
+    out = "voice"
+
+    if bgm_index is not None:
+        graph.append(audio_format(f"{bgm_index}:a", "bgmraw", f",volume={Config.BGM_VOLUME},atrim=0:{duration:.3f}"))
+        if Config.BGM_DUCKING:
+            # 내레이션을 키 신호로 BGM 을 눌러 줌 (쉼 구간에서는 원래 볼륨으로 복귀)
+            graph.append("[voice]asplit=2[voicemix][key]")
+            graph.append("[bgmraw][key]sidechaincompress=threshold=0.02:ratio=6:attack=30:release=500[bgm]")
+            voice_label = "voicemix"
+        else:
+            graph.append("[bgmraw]anull[bgm]")
+            voice_label = "voice"
+        graph.append(f"[{voice_label}][bgm]amix=inputs=2:duration=first:dropout_transition=0:normalize=0[withbgm]")
+        out = "withbgm"
+
+    if Config.AUDIO_LOUDNORM:
+        graph.append(f"[{out}]loudnorm=I={Config.AUDIO_TARGET_LUFS}:TP=-1.5:LRA=11,aresample=44100[aout]")
+    else:
+        graph.append(f"[{out}]anull[aout]")
+    return ";".join(graph)
+
+def assemble_soundtrack(placements, duration, out_path, bgm_path=None):
+    """
+    placements: [(start_sec, audio_path)] - 오디오 스트림이 있는 파일 (MP3 / MP4 모두 가능)
+    duration: 트랙 전체 길이 (영상 길이와 같게), out_path: .m4a
+    """
+    placements = [(start, path) for start, path in placements if path and os.path.exists(path)]
+    inputs = []
+    if placements:
+        for _, path in placements: inputs += ["-i", path]
+    else:
+        # 내레이션이 하나도 없으면 무음 트랙
+        inputs += ["-f", "lavfi", "-i", "anullsrc=r=44100:cl=stereo"]
+        placements = [(0.0, None)]
+
+    bgm_index = None
+    if bgm_path and os.path.exists(bgm_path):
+        bgm_index = len(placements)
+        inputs += ["-stream_loop", "-1", "-i", bgm_path]
+
+    graph = build_filter([(start, n) for n, (start, _) in enumerate(placements)], duration, bgm_index)
+    run_ffmpeg(inputs + ["-filter_complex", graph, "-map", "[aout]", "-t", f"{duration:.3f}"] + SOUNDTRACK_ENCODE + [out_path])
+    return out_path
@@ -0,0 +1,64 @@
+import os
+import json
+
+# ==============================================================================
+# ⏲️ SUBTITLE TIMING (TTS 단어 경계 -> 자막 페이지 시작 시각)
+# - MediaAgent 가 MP3 옆에 audio_N.timing.json 으로 저장: {"v": 1, "words": [[start_ms, end_ms, "word"], ...]}
+# - 에디터는 페이지의 첫 단어가 발음되는 프레임에 자막을 전환합니다. (파일이 없으면 기존 추정 방식)
+# ==============================================================================
+
+def timing_path(audio_path):
+    return os.path.splitext(audio_path)[0] + ".timing.json"
+
+def save_timing(audio_path, words):
+    """words: [(start_sec, end_sec, text)]"""
+    data = {"v": 1, "words": [[int(round(s * 1000)), int(round(e * 1000)), w] for s, e, w in words]}
+    path = timing_path(audio_path)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+def load_timing(audio_path):
+    """[(start_sec, end_sec, text)] 또는 None"""
+    path = timing_path(audio_path)
+    if not os.path.exists(path): return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return [(s / 1000.0, e / 1000.0, w) for s, e, w in json.load(f)["words"]]
+    except Exception as e:
+        print(f"   ⚠️ [Timing] Unreadable timing file {path}: {e}")
+        return None
+
+def clear_timing(audio_path):
+    path = timing_path(audio_path)
+    if os.path.exists(path): os.remove(path)
+
+def split_boundary(start, end, text):
+    """문장 단위 경계(SentenceBoundary)를 글자 수 비율로 단어 단위로 나눕니다."""
+    tokens = text.split()
+    total = sum(len(t) for t in tokens) or 1
+    words, t = [], start
+    for token in tokens:
+        d = (end - start) * len(token) / total
+        words.append((t, t + d, token))
+        t += d
+    return words
+
+def page_starts(pages, words, fps=30):
+    """
+    자막 페이지 [[line, ...], ...] 의 시작 시각 (프레임 경계로 맞춤). 타이밍이 없으면 None.
+    페이지 단어 수와 TTS 단어 수가 다르면 (구두점 분리 등) 비율로 대응시킵니다.
+    """
+    counts = [len(" ".join(lines).replace("*", "").split()) for lines in pages]
+    total = sum(counts)
+    if not words or not total: return None
+
+    starts, k = [], 0
+    for count in counts:
+        idx = k if total == len(words) else int(k * len(words) / total)
+        starts.append(round(words[min(idx, len(words) - 1)][0] * fps) / fps)
+        k += count
+    starts[0] = 0.0
+    for i in range(1, len(starts)): starts[i] = max(starts[i], starts[i - 1])
+    return starts
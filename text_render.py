@@ -0,0 +1,152 @@
+import os
+import math
+from collections import OrderedDict
+from PIL import Image, ImageDraw
+
+# ==============================================================================
+# 🔤 TEXT RASTERIZER (editor.py / editor_long.py 공용)
+# - 외곽선은 draw.text 를 여러 번 겹쳐 그리는 대신 PIL 내장 stroke_width 로 한 번에
+# - 단어 조각 / 줄 스프라이트는 (텍스트, 폰트, 크기, 스타일) 키로 캐시 (LRU)
+# - 스프라이트는 글자 영역(bbox)만큼만 잘라서 만들고, 기준점 대비 오프셋을 함께 반환
+# - [NEW] 개수 외에 바이트 예산도 제한 (롱폼 자막은 페이지마다 문장이 달라 개수만으로는 메모리가 계속 늘어남)
+# ==============================================================================
+
+# 스타일: (fill, stroke_width, stroke_fill, box) - box 는 None 또는 (pad_x, pad_y, box_fill)
+SHORTS_SUBTITLE_STYLES = (("white", 2, "black", None), ("#FFFF00", 2, "black", None))
+SHORTS_TITLE_STYLES = (("white", 2, "black", None), ("black", 0, None, (8, 5, "#FFD700")))
+LONG_SUBTITLE_STYLES = (("white", 6, "black", None), ("#FFFF00", 6, "black", None))
+
+def parse_highlights(line):
+    """'*강조*' 표기를 [(text, is_highlight)] 조각으로 분리"""
+    parts = []
+    buffer = ""; is_highlight = False
+    for char in line:
+        if char == '*':
+            if buffer: parts.append((buffer, is_highlight))
+            buffer = ""; is_highlight = not is_highlight
+        else: buffer += char
+    if buffer: parts.append((buffer, is_highlight))
+    return parts
+
+def font_key(font):
+    """
+    글꼴 식별 키: 파일 경로 + 크기, 경로가 없으면 (이름, 스타일, 크기).
+    식별할 수 없는 글꼴(비트맵 기본 글꼴 등)은 None -> 캐시하지 않음 (id() 는 GC 후 다른 글꼴에 재사용될 수 있음)
+    """
+    size = getattr(font, "size", None)
+    path = getattr(font, "path", None)
+    if isinstance(path, (str, bytes, os.PathLike)): return (os.fspath(path), getattr(font, "index", 0), size)
+    try: return ("name",) + tuple(font.getname()) + (size,)
+    except Exception: return None
+
+def text_bbox(font, text, stroke_width=0):
+    try: return font.getbbox(text, stroke_width=stroke_width)
+    except TypeError: return font.getbbox(text)
+
+class TextRasterizer:
+    def __init__(self, max_items=2048, max_bytes=64 * 2**20):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.cache = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _nbytes(value):
+        return value[0].width * value[0].height * 4 if value else 0
+
+    def _cached(self, key, build):
+        if key is None:
+            self.misses += 1
+            return build()
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return self.cache[key]
+        self.misses += 1
+        value = build()
+        self.cache[key] = value
+        self.bytes += self._nbytes(value)
+        while len(self.cache) > 1 and (len(self.cache) > self.max_items or self.bytes > self.max_bytes):
+            _, evicted = self.cache.popitem(last=False)
+            self.bytes -= self._nbytes(evicted)
+        return value
+
+    def segment(self, text, font, style):
+        """
+        조각 하나를 그린 스프라이트. 반환: (RGBA 이미지, (ox, oy)) - draw.text((x, y)) 기준점 대비 좌상단 위치
+        """
+        def build():
+            fill, stroke_width, stroke_fill, box = style
+            l, t, r, b = text_bbox(font, text, stroke_width)
+            if box:
+                pad_x, pad_y, _ = box
+                ascender, descender = text_bbox(font, "Ay")[1], text_bbox(font, "Ay")[3]
+                box_rect = (-pad_x, ascender - pad_y, font.getlength(text) + pad_x, descender + pad_y)
+                l, t = min(l, box_rect[0]), min(t, box_rect[1])
+                r, b = max(r, box_rect[2]), max(b, box_rect[3])
+            x0, y0 = math.floor(l), math.floor(t)
+            img = Image.new('RGBA', (max(1, math.ceil(r) - x0), max(1, math.ceil(b) - y0)), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(img)
+            if box:
+                draw.rectangle([(box_rect[0] - x0, box_rect[1] - y0), (box_rect[2] - x0, box_rect[3] - y0)], fill=box[2])
+            if stroke_width:
+                draw.text((-x0, -y0), text, font=font, fill=fill, stroke_width=stroke_width, stroke_fill=stroke_fill)
+            else:
+                draw.text((-x0, -y0), text, font=font, fill=fill)
+            return img, (x0, y0)
+
+        fk = font_key(font)
+        return self._cached(("seg", text, fk, style) if fk else None, build)
+
+    def line(self, line, font, styles):
+        """
+        한 줄 (강조 조각 포함) 스프라이트. 반환: (RGBA, (ox, oy)) - 기준점은 줄의 가로 중앙 / 글꼴 원점 y
+        """
+        def build():
+            parts = parse_highlights(line)
+            if not parts: return None
+            total_w = sum(font.getlength(p[0]) for p in parts)
+            placed, x = [], -total_w / 2
+            for part_text, highlight in parts:
+                sprite, (ox, oy) = self.segment(part_text, font, styles[1 if highlight else 0])
+                placed.append((sprite, int(round(x + ox)), oy))
+                x += font.getlength(part_text)
+
+            x0 = min(px for _, px, _ in placed); y0 = min(py for _, _, py in placed)
+            x1 = max(px + s.width for s, px, _ in placed); y1 = max(py + s.height for s, _, py in placed)
+            img = Image.new('RGBA', (x1 - x0, y1 - y0), (0, 0, 0, 0))
+            for sprite, px, py in placed:
+                img.alpha_composite(sprite, (px - x0, py - y0))
+            return img, (x0, y0)
+
+        fk = font_key(font)
+        return self._cached(("line", line, fk, styles) if fk else None, build)
+
+    def block(self, lines, font, styles, line_height):
+        """
+        여러 줄 블록 스프라이트 (줄마다 가운데 정렬). 반환: (RGBA, (ox, oy)) 또는 (None, (0, 0))
+        기준점: 블록의 가로 중앙 / 첫 줄 원점 y
+        """
+        placed = []
+        for i, line in enumerate(lines):
+            rendered = self.line(line, font, styles)
+            if rendered: placed.append((rendered[0], rendered[1][0], rendered[1][1] + i * line_height))
+        if not placed: return None, (0, 0)
+
+        x0 = min(px for _, px, _ in placed); y0 = min(py for _, _, py in placed)
+        x1 = max(px + s.width for s, px, _ in placed); y1 = max(py + s.height for s, _, py in placed)
+        img = Image.new('RGBA', (x1 - x0, y1 - y0), (0, 0, 0, 0))
+        for sprite, px, py in placed:
+            img.alpha_composite(sprite, (px - x0, py - y0))
+        return img, (x0, y0)
+
+def composite(canvas, sprite, x, y):
+    """캔버스 밖(음수 좌표)으로 나가는 부분은 잘라서 alpha 합성"""
+    sx, sy = max(0, -x), max(0, -y)
+    if sx >= sprite.width or sy >= sprite.height: return
+    canvas.alpha_composite(sprite, (max(0, x), max(0, y)), (sx, sy))
+
+# 프로세스 안의 모든 에디터가 같은 캐시를 공유
+RASTERIZER = TextRasterizer()
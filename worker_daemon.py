@@ -0,0 +1,207 @@
+import os
+import sys
+import time
+import queue
+import secrets
+import argparse
+import threading
+import traceback
+import multiprocessing
+from multiprocessing.connection import Listener, Client
+from config import Config
+
+# ==============================================================================
+# 🛰️ WORKER DAEMON (상주 렌더 워커)
+# - 무거운 모듈(moviepy, genai, texttospeech, playwright)은 forkserver 에서 한 번만 import
+# - 워커 프로세스는 에이전트(폰트, HTTP 세션, TTS 클라이언트)를 한 번 만들어 여러 작업에 재사용
+# - 작업이 워커를 죽이거나 시간 제한을 넘기면 그 워커만 재시작 (데몬과 다른 워커는 그대로)
+# - [수정] 연결은 받은 메시지를 unpickle 하므로 인증 키가 곧 실행 권한 -> 공개 기본 키 없이,
+#   DAEMON_AUTHKEY 또는 사용자별 키 파일(0600)이 없으면 데몬이 시작하지 않음
+# ==============================================================================
+
+# 에이전트 모듈은 무거운 라이브러리를 지연 import 하므로, 워커가 결국 쓰게 될 것들을 여기서 미리 로드
+PRELOAD_MODULES = [
+    "main", "editor_long", "google.generativeai", "google.cloud.texttospeech_v1beta1",
+    "edge_tts", "playwright.sync_api",
+]
+
+def daemon_address():
+    return (Config.DAEMON_HOST, Config.DAEMON_PORT)
+
+def init_authkey():
+    """사용자별 키 파일 생성 (권한 0600, 이미 있으면 그대로 둠). 키 파일 경로 반환"""
+    path = Config.DAEMON_KEY_FILE
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    try: fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError: return path
+    with os.fdopen(fd, 'w') as f: f.write(secrets.token_hex(32))
+    return path
+
+def daemon_authkey():
+    """
+    인증 키: 환경변수 DAEMON_AUTHKEY -> 키 파일 순서. 둘 다 없으면 FileNotFoundError (OSError 라서 스케줄러는 subprocess 로 폴백)
+    """
+    if Config.DAEMON_AUTHKEY: return Config.DAEMON_AUTHKEY.encode('utf-8')
+    path = Config.DAEMON_KEY_FILE
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"No daemon auth key. Set DAEMON_AUTHKEY or run 'python worker_daemon.py --init-key' ({path})")
+    if os.name == "posix" and os.stat(path).st_mode & 0o077:
+        raise PermissionError(f"Daemon key file is accessible by other users: {path} (chmod 600)")
+    with open(path, 'r', encoding='utf-8') as f: key = f.read().strip()
+    if not key: raise FileNotFoundError(f"Daemon key file is empty: {path}")
+    return key.encode('utf-8')
+
+def worker_main(conn):
+    """워커 프로세스: 에이전트를 한 번 만들고 작업을 순서대로 처리"""
+    from main import StudioAgents, produce_shorts
+    agents = StudioAgents()
+    print("🔥 [Worker] Agents warmed up. Waiting for jobs...")
+
+    while True:
+        try: job = conn.recv()
+        except EOFError: break
+        if job is None: break
+        try:
+            video = produce_shorts("daily", job["category"], None, job.get("gender", "female"), job.get("tone", "2"),
+                                   job["timestamp"], job_id=job.get("job_id"), agents=agents, profile=job.get("profile"))
+            conn.send({"status": "done" if video else "failed", "video": video})
+        except Exception as e:
+            traceback.print_exc()
+            conn.send({"status": "failed", "error": str(e)})
+
+class WorkerSlot:
+    """워커 프로세스 1개 + 파이프. 작업 중 죽거나 시간 초과 시 restart()"""
+    def __init__(self, ctx, number):
+        self.ctx = ctx
+        self.number = number
+        self.start()
+
+    def start(self):
+        self.conn, child_conn = self.ctx.Pipe()
+        self.process = self.ctx.Process(target=worker_main, args=(child_conn,), name=f"render-worker-{self.number}", daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def restart(self, reason):
+        print(f"♻️ [Daemon] Restarting worker {self.number}: {reason}")
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(10)
+        self.conn.close()
+        self.start()
+
+    def run(self, job, timeout):
+        try: self.conn.send(job)
+        except (BrokenPipeError, OSError):
+            self.restart("pipe closed before job")
+            self.conn.send(job)
+
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if self.conn.poll(1):
+                try: return self.conn.recv()
+                except EOFError: break
+            if not self.process.is_alive(): break
+
+        if self.process.is_alive():
+            error = f"timed out after {timeout:.0f}s"
+        else:
+            error = f"worker crashed (exit code {self.process.exitcode})"
+        self.restart(error)
+        return {"status": "failed", "error": error}
+
+    def stop(self):
+        try: self.conn.send(None)
+        except OSError: pass
+        self.process.join(5)
+        if self.process.is_alive(): self.process.terminate()
+
+class WorkerDaemon:
+    def __init__(self, workers=None):
+        methods = multiprocessing.get_all_start_methods()
+        # forkserver: 깨끗한 단일 스레드 서버에서 preload 후 fork (Windows 는 spawn 으로 대체)
+        ctx = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        if ctx.get_start_method() == "forkserver":
+            ctx.set_forkserver_preload(PRELOAD_MODULES)
+
+        workers = workers or Config.DAEMON_WORKERS
+        self.idle = queue.Queue()
+        self.slots = [WorkerSlot(ctx, n + 1) for n in range(workers)]
+        for slot in self.slots: self.idle.put(slot)
+
+    def handle(self, conn):
+        try:
+            request = conn.recv()
+            if request.get("type") == "ping":
+                conn.send({"status": "ok", "workers": len(self.slots), "idle": self.idle.qsize()})
+                return
+
+            job = request["job"]
+            timeout = request.get("timeout") or Config.SCHED_RENDER_TIMEOUT_MIN * 60
+            print(f"📥 [Daemon] Job received: {job.get('job_id') or job.get('category')}")
+            # 빈 워커가 없으면 여기서 대기 (로컬 작업 큐)
+            slot = self.idle.get()
+            try:
+                started = time.perf_counter()
+                result = slot.run(job, timeout)
+                print(f"   📤 [Daemon] Worker {slot.number}: {result.get('status')} in {time.perf_counter() - started:.1f}s")
+            finally:
+                self.idle.put(slot)
+            conn.send(result)
+        except (EOFError, OSError) as e:
+            print(f"   ⚠️ [Daemon] Client disconnected: {e}")
+        finally:
+            conn.close()
+
+    def serve_forever(self):
+        authkey = daemon_authkey()
+        with Listener(daemon_address(), authkey=authkey) as listener:
+            print(f"🛰️ [Daemon] Listening on {Config.DAEMON_HOST}:{Config.DAEMON_PORT} with {len(self.slots)} warm workers")
+            try:
+                while True:
+                    try: conn = listener.accept()
+                    except multiprocessing.AuthenticationError as e:
+                        print(f"   ⚠️ [Daemon] Rejected connection: {e}")
+                        continue
+                    threading.Thread(target=self.handle, args=(conn,), daemon=True).start()
+            finally:
+                for slot in self.slots: slot.stop()
+
+class DaemonTimeout(Exception):
+    """데몬이 제한 시간 안에 결과를 보내지 않음 (OSError 가 아님 -> 호출 측이 subprocess 로 중복 실행하지 않도록)"""
+
+def submit_job(job, timeout=None):
+    """
+    데몬에 작업을 보내고 결과를 기다립니다. {"status": "done"/"failed", "video": ..., "error": ...}
+    데몬이 떠 있지 않으면 ConnectionRefusedError, 키가 맞지 않으면 AuthenticationError.
+    [수정] 데몬의 시간 제한은 워커 슬롯을 얻은 뒤부터라 대기열에서 무한정 기다릴 수 있음
+    -> 클라이언트 쪽에서도 timeout 초 (대기 + 렌더 합계) 까지만 기다리고 DaemonTimeout
+    """
+    with Client(daemon_address(), authkey=daemon_authkey()) as conn:
+        conn.send({"type": "job", "job": job, "timeout": timeout})
+        if timeout is not None and not conn.poll(timeout):
+            raise DaemonTimeout(f"no result from daemon within {timeout}s")
+        return conn.recv()
+
+def ping():
+    try:
+        with Client(daemon_address(), authkey=daemon_authkey()) as conn:
+            conn.send({"type": "ping"})
+            return conn.recv()
+    except (OSError, EOFError, multiprocessing.AuthenticationError):
+        return None
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CinemaGen Worker Daemon")
+    parser.add_argument("--workers", type=int, help=f"Warm render workers (default: {Config.DAEMON_WORKERS})")
+    parser.add_argument("--init-key", action="store_true", help=f"Create the per-user auth key file ({Config.DAEMON_KEY_FILE})")
+    args = parser.parse_args()
+    if args.init_key:
+        print(f"🔑 [Daemon] Auth key file: {init_authkey()}")
+        sys.exit(0)
+    # 키가 없으면 워커를 띄우기 전에 거부
+    try: daemon_authkey()
+    except OSError as e:
+        print(f"❌ [Daemon] Refusing to start: {e}")
+        sys.exit(1)
+    WorkerDaemon(workers=args.workers).serve_forever()
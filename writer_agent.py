@@ -1,12 +1,18 @@
 import json
 import time
-import google.generativeai as genai
 from config import Config
 import os
 from datetime import date
 import re
 
 class WriterAgent:
+    def __init__(self, workspace="."):
+        # [NEW] 메타데이터 파일을 작업별 폴더의 results/ 에 저장
+        self.workspace = workspace
+
+    def use_workspace(self, workspace):
+        self.workspace = workspace
+
     def generate_content(self, context, mode="shorts", source_type="news", duration="2-4 minutes"):
         """
         mode: "shorts" or "long"
@@ -121,6 +127,8 @@ class WriterAgent:
         return self._call_gemini(prompt)
 
     def _call_gemini(self, prompt):
+        # [수정] genai 는 대본 생성 시에만 import (체크포인트로 대본 단계를 건너뛰면 로딩 비용 없음)
+        import google.generativeai as genai
         max_attempts = len(Config.GEMINI_KEYS) * 2
         attempts = 0
         
@@ -167,7 +175,8 @@ class WriterAgent:
                 time.sleep(1)
         return None
 
-    def save_metadata_file(self, metadata, folder="results"):
+    def save_metadata_file(self, metadata, folder=None):
+        folder = folder or os.path.join(self.workspace, "results")
         os.makedirs(folder, exist_ok=True)
         
         title = metadata.get('youtube_title', metadata.get('title', 'N/A'))